@@ -15,6 +15,8 @@ from pathlib import Path
 import math
 import random
 
+from registry import services
+
 # Optional imports for advanced analytics
 try:
     import pandas as pd
@@ -426,5 +428,9 @@ class AnalyticsManager:
             "timestamp": datetime.now().isoformat()
         }
 
-# Global instance
-analytics_manager = AnalyticsManager() 
\ No newline at end of file
+# Global instance (built on first use)
+analytics_manager = services.register("analytics_manager", AnalyticsManager)
+
+def get_analytics_manager() -> AnalyticsManager:
+    """Get the process-wide analytics manager"""
+    return services.get("analytics_manager")
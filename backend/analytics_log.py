@@ -0,0 +1,370 @@
+"""
+Analytics Log Module for CK Empire Builder
+Append-only JSONL analytics streams with batched fsync, atomic segment rotation and a segment index
+"""
+
+import os
+import csv
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterator
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        ANALYTICS_LOG_DIR = "data/analytics"
+        ANALYTICS_FSYNC_BATCH = 32
+        ANALYTICS_FSYNC_INTERVAL = 5.0
+        ANALYTICS_ROTATE_BYTES = 8 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+# Files the old load-append-rewrite trackers wrote, imported once per stream
+LEGACY_PATHS = {
+    "business_ideas": "data/business_ideas_analytics.json",
+    "channel_suggestions": "data/channel_suggestions_analytics.json",
+    "monetization": "data/monetization_analytics.csv",
+    "niche_content": "data/niche_content_analytics.csv",
+}
+
+TIMESTAMP_FIELD = "generated_at"
+
+class AnalyticsLog:
+    """
+    One analytics stream stored as JSONL segments
+
+    New records go to "<stream>.jsonl". When it grows past rotate_bytes it is
+    renamed to a numbered segment and "<stream>.index.json" records the
+    segment's record count and time range, so counts and recent reads never
+    parse sealed segments they do not need.
+    """
+
+    def __init__(
+        self,
+        stream: str,
+        log_dir: Optional[str] = None,
+        fsync_batch: Optional[int] = None,
+        fsync_interval: Optional[float] = None,
+        rotate_bytes: Optional[int] = None,
+        legacy_path: Optional[str] = None
+    ):
+        """
+        Args:
+            stream: Stream name, used for file names
+            log_dir: Directory holding the stream's files
+            fsync_batch: fsync after this many unsynced records
+            fsync_interval: fsync when the last sync is older than this many seconds
+            rotate_bytes: Seal the active file once it reaches this size
+            legacy_path: JSON array or CSV imported once when the stream has no files yet
+        """
+        self.stream = stream
+        self.log_dir = Path(log_dir or settings.ANALYTICS_LOG_DIR)
+        self.fsync_batch = fsync_batch or settings.ANALYTICS_FSYNC_BATCH
+        self.fsync_interval = fsync_interval if fsync_interval is not None else settings.ANALYTICS_FSYNC_INTERVAL
+        self.rotate_bytes = rotate_bytes or settings.ANALYTICS_ROTATE_BYTES
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+
+        self.path = self.log_dir / f"{stream}.jsonl"
+        self.index_path = self.log_dir / f"{stream}.index.json"
+
+        self._segments: Optional[List[Dict[str, Any]]] = None
+        # Byte offset of every record in the active file
+        self._offsets: List[int] = []
+        self._active_first: Optional[str] = None
+        self._active_last: Optional[str] = None
+        self._size = 0
+        self._writer = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.RLock()
+
+    def _segment_path(self, number: int) -> Path:
+        return self.log_dir / f"{self.stream}.{number:06d}.jsonl"
+
+    def _ensure_loaded(self):
+        """Read the segment index and scan the active file on first use"""
+        if self._segments is not None:
+            return
+
+        with self._lock:
+            if self._segments is not None:
+                return
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._segments = self._load_index()
+            self._scan_active()
+
+            if not self._segments and not self._offsets and self.legacy_path and self.legacy_path.exists():
+                self._import_legacy()
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        """Sealed segments from the index, rebuilding entries for segments it does not list"""
+        segments = []
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    segments = json.load(f).get("segments", [])
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Rebuilding analytics index for {self.stream}: {e}")
+
+        known = {segment["number"] for segment in segments}
+        # A crash between rotating a file and writing the index leaves a segment unlisted
+        missing = [
+            path for path in self.log_dir.glob(f"{self.stream}.[0-9]*.jsonl")
+            if int(path.name.split(".")[-2]) not in known
+        ]
+        for path in missing:
+            records = list(self._read_file(path))
+            segments.append(self._segment_entry(int(path.name.split(".")[-2]), records))
+        segments.sort(key=lambda segment: segment["number"])
+        if missing:
+            self._write_index(segments)
+        return segments
+
+    @staticmethod
+    def _segment_entry(number: int, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "number": number,
+            "count": len(records),
+            "first": records[0].get(TIMESTAMP_FIELD) if records else None,
+            "last": records[-1].get(TIMESTAMP_FIELD) if records else None
+        }
+
+    def _write_index(self, segments: List[Dict[str, Any]]):
+        """Swap in a new index file atomically"""
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"stream": self.stream, "segments": segments}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+
+    def _scan_active(self):
+        """Record the offset of each complete line in the active file"""
+        self._offsets = []
+        self._active_first = self._active_last = None
+        self._size = 0
+        if not self.path.exists():
+            return
+
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                if line.endswith(b'\n'):
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write from a crash; later records still count
+                        record = None
+                    if record is not None:
+                        self._offsets.append(offset)
+                        self._active_first = self._active_first or record.get(TIMESTAMP_FIELD)
+                        self._active_last = record.get(TIMESTAMP_FIELD)
+                    offset += len(line)
+                else:
+                    break
+            self._size = offset
+
+        # Drop an unterminated tail so the next append starts on a fresh line
+        if self._size < self.path.stat().st_size:
+            with open(self.path, 'r+b') as f:
+                f.truncate(self._size)
+
+    def _import_legacy(self):
+        """One-time import of the old JSON array or CSV file"""
+        with open(self.legacy_path, 'r', encoding='utf-8') as f:
+            if self.legacy_path.suffix == ".json":
+                rows = json.load(f)
+            else:
+                rows = [
+                    {(TIMESTAMP_FIELD if key == "Date" else key.lower()): value for key, value in row.items()}
+                    for row in csv.DictReader(f)
+                ]
+        for row in rows:
+            self.append(row)
+        self.flush()
+        logger.info(f"Imported {len(rows)} legacy {self.stream} analytics records from {self.legacy_path}")
+
+    def _read_file(self, path: Path, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """Parse records from a file, skipping torn lines"""
+        with open(path, 'r', encoding='utf-8') as f:
+            f.seek(start)
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append one record
+
+        Args:
+            record: JSON-serializable analytics fields; generated_at is added if missing
+
+        Returns:
+            The stored record
+        """
+        self._ensure_loaded()
+        record = dict(record)
+        record.setdefault(TIMESTAMP_FIELD, datetime.utcnow().isoformat())
+        line = (json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+
+        with self._lock:
+            if self._writer is None:
+                self._writer = open(self.path, 'ab')
+            self._writer.write(line)
+            self._offsets.append(self._size)
+            self._size += len(line)
+            self._active_first = self._active_first or record[TIMESTAMP_FIELD]
+            self._active_last = record[TIMESTAMP_FIELD]
+            self._unsynced += 1
+
+            if self._size >= self.rotate_bytes:
+                self.rotate()
+            elif self._unsynced >= self.fsync_batch or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self.flush()
+        return record
+
+    def flush(self):
+        """Force buffered records to disk"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+                os.fsync(self._writer.fileno())
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def rotate(self):
+        """Seal the active file as the next numbered segment"""
+        self._ensure_loaded()
+        with self._lock:
+            if not self._offsets:
+                return
+            self.flush()
+            self.close()
+
+            number = self._segments[-1]["number"] + 1 if self._segments else 1
+            os.replace(self.path, self._segment_path(number))
+            self._segments.append({
+                "number": number,
+                "count": len(self._offsets),
+                "first": self._active_first,
+                "last": self._active_last
+            })
+            self._write_index(self._segments)
+
+            self._offsets = []
+            self._active_first = self._active_last = None
+            self._size = 0
+            logger.info(f"Rotated {self.stream} analytics log into segment {number}")
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Most recent records, oldest first
+
+        Args:
+            n: Max records to return
+
+        Returns:
+            Up to n records; sealed segments are only read when the active file holds fewer
+        """
+        self._ensure_loaded()
+        if n <= 0:
+            return []
+
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            records = []
+            if self._offsets:
+                start = self._offsets[max(0, len(self._offsets) - n)]
+                records = list(self._read_file(self.path, start))
+            segments = list(self._segments)
+
+        for segment in reversed(segments):
+            if len(records) >= n:
+                break
+            older = list(self._read_file(self._segment_path(segment["number"])))
+            records = older[-(n - len(records)):] + records
+        return records[-n:]
+
+    def since(self, timestamp: str) -> Iterator[Dict[str, Any]]:
+        """
+        Records generated at or after an ISO timestamp, skipping segments that end earlier
+
+        Args:
+            timestamp: ISO-8601 UTC timestamp
+        """
+        self._ensure_loaded()
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            segments = [s for s in self._segments if s["last"] is None or s["last"] >= timestamp]
+            active_end = self._size
+
+        for segment in segments:
+            for record in self._read_file(self._segment_path(segment["number"])):
+                if record.get(TIMESTAMP_FIELD, "") >= timestamp:
+                    yield record
+        if active_end:
+            for record in self._read_file(self.path):
+                if record.get(TIMESTAMP_FIELD, "") >= timestamp:
+                    yield record
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Every record, oldest first"""
+        return self.since("")
+
+    def close(self):
+        """Close the active file"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return sum(segment["count"] for segment in self._segments) + len(self._offsets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get stream size and sync state"""
+        self._ensure_loaded()
+        return {
+            "stream": self.stream,
+            "records": len(self),
+            "segments": len(self._segments),
+            "active_bytes": self._size,
+            "unsynced": self._unsynced,
+            "path": str(self.path)
+        }
+
+# Global analytics streams, created on first use
+analytics_logs: Dict[str, AnalyticsLog] = {}
+_analytics_logs_lock = threading.Lock()
+
+def get_analytics_log(stream: str) -> AnalyticsLog:
+    """Get the global log for an analytics stream"""
+    log = analytics_logs.get(stream)
+    if log is None:
+        with _analytics_logs_lock:
+            log = analytics_logs.get(stream)
+            if log is None:
+                log = AnalyticsLog(stream, legacy_path=LEGACY_PATHS.get(stream))
+                analytics_logs[stream] = log
+    return log
+
+def close_analytics_logs():
+    """Sync and close every open analytics stream"""
+    for log in list(analytics_logs.values()):
+        try:
+            log.flush()
+            log.close()
+        except Exception as e:
+            logger.error(f"Error closing {log.stream} analytics log: {e}")
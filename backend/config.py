@@ -76,6 +76,9 @@ class Settings(BaseSettings):
         description="Allowed hosts"
     )
     
+    # Routers
+    DISABLED_ROUTERS: List[str] = Field(default=[], description="Routers not mounted (and not imported), e.g. video")
+    
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = Field(default=100, description="Rate limit per minute")
     RATE_LIMIT_PER_HOUR: int = Field(default=1000, description="Rate limit per hour")
@@ -94,7 +97,63 @@ class Settings(BaseSettings):
     AI_MAX_TOKENS: int = Field(default=2000, description="Max tokens for AI")
     AI_TEMPERATURE: float = Field(default=0.7, description="AI temperature")
     AI_TIMEOUT: int = Field(default=30, description="AI request timeout")
-    
+    OPENAI_MAX_WORKERS: int = Field(default=8, description="Thread pool size for blocking OpenAI calls")
+    OPENAI_MAX_CONCURRENCY: int = Field(default=8, description="Max in-flight OpenAI calls per worker process")
+
+    # Local LLM (Ollama) Gateway
+    OLLAMA_URL: str = Field(default=os.getenv("OLLAMA_URL", "http://localhost:11434"), description="Ollama server URL")
+    LLM_MAX_CONNECTIONS: int = Field(default=20, description="Max pooled connections to Ollama")
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=10, description="Max idle keep-alive connections to Ollama")
+    LLM_KEEPALIVE_EXPIRY: float = Field(default=60.0, description="Idle keep-alive expiry in seconds")
+    LLM_MAX_CONCURRENCY_PER_MODEL: int = Field(default=4, description="Max in-flight requests per Ollama model")
+    LLM_CACHE_ENABLED: bool = Field(default=True, description="Enable disk-backed LLM response cache")
+    LLM_CACHE_PATH: str = Field(default="data/llm_cache.db", description="LLM response cache database path")
+    LLM_CACHE_TTL: int = Field(default=86400, description="LLM response cache TTL in seconds")
+    LLM_CACHE_MAX_ENTRIES: int = Field(default=5000, description="Max cached LLM responses")
+    LLM_CACHE_MAX_BYTES: int = Field(default=50 * 1024 * 1024, description="Max total size of cached LLM responses")
+    LLM_BREAKER_FAILURE_THRESHOLD: int = Field(default=5, description="Consecutive Ollama failures before the circuit opens")
+    LLM_BREAKER_RECOVERY_TIMEOUT: float = Field(default=30.0, description="Seconds the circuit stays open before a half-open trial")
+    LLM_BREAKER_HALF_OPEN_MAX_CALLS: int = Field(default=1, description="Concurrent trial calls allowed while half-open")
+    LLM_BREAKER_SUCCESS_THRESHOLD: int = Field(default=2, description="Successful trial calls needed to close the circuit")
+    LLM_HEALTH_PROBE_INTERVAL: float = Field(default=15.0, description="Seconds between Ollama /api/tags health probes")
+    LLM_INTERACTIVE_LATENCY_BUDGET: float = Field(default=3.0, description="Latency budget in seconds for interactive LLM endpoints")
+
+    # Content Scheduler
+    CONTENT_CHANNEL_CONCURRENCY: int = Field(default=5, description="Max channels repurposed concurrently")
+    CONTENT_CHANNEL_TIMEOUT: float = Field(default=45.0, description="Per-channel repurpose timeout in seconds")
+    NICHE_MAX_CONCURRENCY: int = Field(default=5, description="Max niche variations generated concurrently")
+
+    # Strategy request coalescing
+    STRATEGY_SINGLEFLIGHT_TTL: float = Field(default=30.0, description="Seconds an identical strategy request reuses the last result")
+    STRATEGY_SINGLEFLIGHT_REDIS: bool = Field(default=True, description="Coalesce strategy requests across workers via Redis")
+
+    # Trend store
+    TREND_STORE_MAX_TRENDS: int = Field(default=200, description="Max trends kept for prompt optimization")
+    TREND_DECAY_HALF_LIFE_DAYS: float = Field(default=30.0, description="Days for a trend's impact score to halve")
+
+    # Content performance store
+    PERFORMANCE_STORE_PATH: str = Field(default="data/content_performance.jsonl", description="Append-only content performance log")
+    PERFORMANCE_STORE_COMPACT_RATIO: float = Field(default=3.0, description="Compact the log when lines exceed this multiple of live records")
+
+    # Analytics logs
+    ANALYTICS_LOG_DIR: str = Field(default="data/analytics", description="Directory for append-only analytics streams")
+    ANALYTICS_FSYNC_BATCH: int = Field(default=32, description="fsync an analytics stream after this many records")
+    ANALYTICS_FSYNC_INTERVAL: float = Field(default=5.0, description="fsync an analytics stream when its last sync is older than this many seconds")
+    ANALYTICS_ROTATE_BYTES: int = Field(default=8 * 1024 * 1024, description="Seal an analytics stream's active file at this size")
+
+    # Continuous optimization
+    OPTIMIZATION_WORKERS: int = Field(default=3, description="Concurrent workers optimizing low-performance content")
+    OPTIMIZATION_RATE_PER_MINUTE: float = Field(default=10.0, description="Max content optimizations started per minute (0 = unlimited)")
+
+    # Video rendering
+    VIDEO_RENDER_WORKERS: int = Field(default=2, description="Worker processes rendering videos concurrently")
+    VIDEO_RENDER_MAX_JOBS: int = Field(default=1000, description="Finished render jobs kept for status lookups")
+
+    # Fine-tuning dataset
+    FINE_TUNING_SHARD_SIZE: int = Field(default=50000, description="Max examples per fine-tuning dataset shard (0 disables sharding)")
+    EVALUATION_CONCURRENCY: int = Field(default=8, description="Max strategy evaluation calls in flight")
+    EVALUATION_CHECKPOINT_DIR: str = Field(default="data/evaluations", description="Directory for resumable evaluation checkpoints")
+
     # Ethics Module
     ETHICS_ENABLED: bool = Field(default=True, description="Enable ethics monitoring")
     BIAS_DETECTION_THRESHOLD: float = Field(default=0.8, description="Bias detection threshold")
@@ -110,6 +169,10 @@ class Settings(BaseSettings):
     WEB3_PROVIDER_URL: Optional[str] = Field(default=None, description="Web3 provider URL")
     ETHEREUM_RPC_URL: Optional[str] = Field(default=None, description="Ethereum RPC URL")
     ETHEREUM_PRIVATE_KEY: Optional[str] = Field(default=None, description="Ethereum private key")
+    NFT_MINT_CONCURRENCY: int = Field(default=16, description="Mint receipts awaited concurrently")
+    NFT_MINT_MAX_RETRIES: int = Field(default=3, description="Gas re-pricing attempts per mint transaction")
+    NFT_MINT_RECEIPT_TIMEOUT: float = Field(default=120.0, description="Seconds before a stalled mint is re-sent at a higher gas price")
+    NFT_MINT_GAS_LIMIT: int = Field(default=2000000, description="Gas limit per mint transaction")
     
     # Stripe Payments
     STRIPE_SECRET_KEY: Optional[str] = Field(default=None, description="Stripe secret key")
@@ -7,17 +7,29 @@ import asyncio
 import logging
 import json
 import os
-import csv
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
-import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 # Import AI module
-from ai import AIModule, ContentIdea, ContentType
+from ai import ContentIdea, ContentType, get_ai_module
+from llm_gateway import llm_gateway, LLMGatewayError
+from llm_json import extract_json
+from performance_store import performance_store
+from analytics_log import get_analytics_log
+from registry import services
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        CONTENT_CHANNEL_CONCURRENCY = int(os.getenv("CONTENT_CHANNEL_CONCURRENCY", "5"))
+        CONTENT_CHANNEL_TIMEOUT = float(os.getenv("CONTENT_CHANNEL_TIMEOUT", "45.0"))
 
 logger = logging.getLogger(__name__)
 
@@ -74,13 +86,16 @@ class ContentScheduler:
     
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
-        self.ai_module = AIModule()
-        self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
+        self.ai_module = get_ai_module()
+        self.llm_gateway = llm_gateway
+        self.ollama_url = llm_gateway.base_url
         self.channels = list(ChannelType)
         self.content_history = []
         self.performance_data = []
         self.is_running = False
         self.quality_threshold = 0.7  # Viral potential threshold
+        self.channel_concurrency = settings.CONTENT_CHANNEL_CONCURRENCY
+        self.channel_timeout = settings.CONTENT_CHANNEL_TIMEOUT
         
         # Platform-specific configurations
         self.platform_configs = {
@@ -217,20 +232,8 @@ class ContentScheduler:
                     logger.error("❌ Failed to regenerate high-quality content")
                     return
             
-            # Repurpose for all channels with quality checks
-            repurposed_content = []
-            for channel in self.channels:
-                adapted_content = await self._repurpose_for_channel(viral_idea, channel)
-                if adapted_content:
-                    # Quality check for repurposed content
-                    repurpose_quality = await self._assess_repurposed_quality(adapted_content)
-                    if repurpose_quality.get("passed", False):
-                        # Add performance tracking data
-                        adapted_content = await self._add_performance_tracking(adapted_content)
-                        repurposed_content.append(adapted_content)
-                        logger.info(f"✅ {channel.value}: Quality passed (Score: {adapted_content.quality_score:.2f})")
-                    else:
-                        logger.warning(f"⚠️ {channel.value}: Quality check failed - {repurpose_quality.get('reason', 'Unknown')}")
+            # Repurpose for all channels concurrently with quality checks
+            repurposed_content = await self._repurpose_for_all_channels(viral_idea)
             
             # Generate business idea
             business_idea_result = await self._generate_daily_business_idea()
@@ -322,6 +325,61 @@ class ContentScheduler:
         except Exception as e:
             logger.error(f"❌ Error in daily content generation: {e}")
 
+    async def _repurpose_for_all_channels(self, viral_idea: ContentIdea) -> List[RepurposedContent]:
+        """
+        Fan out repurpose, quality check and performance tracking across all channels
+        
+        Args:
+            viral_idea: Content idea to repurpose
+            
+        Returns:
+            Quality-approved content, in channel order
+        """
+        semaphore = asyncio.Semaphore(max(1, self.channel_concurrency))
+        start_time = datetime.utcnow()
+        
+        results = await asyncio.gather(
+            *(self._process_channel(viral_idea, channel, semaphore) for channel in self.channels),
+            return_exceptions=True
+        )
+        
+        repurposed_content = []
+        for channel, result in zip(self.channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ {channel.value}: Channel processing failed - {result}")
+            elif result:
+                repurposed_content.append(result)
+        
+        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        logger.info(f"⏱️ Repurposed {len(repurposed_content)}/{len(self.channels)} channels in {elapsed:.2f}s")
+        return repurposed_content
+
+    async def _process_channel(self, viral_idea: ContentIdea, channel: ChannelType, semaphore: asyncio.Semaphore) -> Optional[RepurposedContent]:
+        """Repurpose, quality check and track a single channel"""
+        async with semaphore:
+            try:
+                adapted_content = await asyncio.wait_for(
+                    self._repurpose_for_channel(viral_idea, channel),
+                    timeout=self.channel_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ {channel.value}: Repurpose timed out after {self.channel_timeout}s, using fallback")
+                adapted_content = self._create_fallback_repurpose(viral_idea, channel, self.platform_configs[channel])
+        
+        if not adapted_content:
+            return None
+        
+        # Quality check for repurposed content
+        repurpose_quality = await self._assess_repurposed_quality(adapted_content)
+        if not repurpose_quality.get("passed", False):
+            logger.warning(f"⚠️ {channel.value}: Quality check failed - {repurpose_quality.get('reason', 'Unknown')}")
+            return None
+        
+        # Add performance tracking data
+        adapted_content = await self._add_performance_tracking(adapted_content)
+        logger.info(f"✅ {channel.value}: Quality passed (Score: {adapted_content.quality_score:.2f})")
+        return adapted_content
+
     async def _assess_content_quality(self, content_idea: ContentIdea) -> Dict[str, Any]:
         """Assess content quality using AI module"""
         try:
@@ -362,48 +420,28 @@ class ContentScheduler:
             }}
             """
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": "llama2",
-                        "prompt": prompt,
-                        "stream": False
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get("response", "")
-                    
-                    try:
-                        assessment = json.loads(content)
-                        quality_score = assessment.get("quality_score", content_idea.viral_potential)
-                        
-                        # Determine if content passes quality check
-                        passed = quality_score >= self.quality_threshold
-                        
-                        return {
-                            "passed": passed,
-                            "reason": "Quality assessment completed" if passed else f"Quality score ({quality_score:.2f}) below threshold",
-                            "score": quality_score,
-                            "assessment": assessment
-                        }
-                    except json.JSONDecodeError:
-                        # Fallback to viral potential check
-                        return {
-                            "passed": content_idea.viral_potential >= self.quality_threshold,
-                            "reason": "Using viral potential as quality indicator",
-                            "score": content_idea.viral_potential
-                        }
-                else:
-                    # Fallback to viral potential check
-                    return {
-                        "passed": content_idea.viral_potential >= self.quality_threshold,
-                        "reason": "Using viral potential as quality indicator",
-                        "score": content_idea.viral_potential
-                    }
+            content = await self.llm_gateway.generate(prompt, model="llama2", timeout=30.0)
+            
+            assessment = extract_json(content, "quality_assessment")
+            if assessment is None:
+                # Fallback to viral potential check
+                return {
+                    "passed": content_idea.viral_potential >= self.quality_threshold,
+                    "reason": "Using viral potential as quality indicator",
+                    "score": content_idea.viral_potential
+                }
+            
+            quality_score = float(assessment.get("quality_score", content_idea.viral_potential))
+            
+            # Determine if content passes quality check
+            passed = quality_score >= self.quality_threshold
+            
+            return {
+                "passed": passed,
+                "reason": "Quality assessment completed" if passed else f"Quality score ({quality_score:.2f}) below threshold",
+                "score": quality_score,
+                "assessment": assessment
+            }
                     
         except Exception as e:
             logger.error(f"❌ Error assessing content quality: {e}")
@@ -482,7 +520,7 @@ class ContentScheduler:
             return content
 
     async def _track_content_analytics(self, content_list: List[RepurposedContent]):
-        """Track content analytics and save to CSV"""
+        """Track content analytics in the performance store"""
         try:
             timestamp = datetime.now()
             
@@ -504,56 +542,26 @@ class ContentScheduler:
                 )
                 
                 self.performance_data.append(performance_data)
-            
-            # Save to CSV
-            await self._save_performance_to_csv()
+                performance_store.put({
+                    "content_id": performance_data.content_id,
+                    "title": performance_data.title,
+                    "content_type": "video" if content.channel.value in ("youtube", "tiktok") else "social_media",
+                    "channel": performance_data.channel,
+                    "views": performance_data.mock_views,
+                    "engagement_rate": performance_data.mock_engagement_rate,
+                    "revenue": performance_data.mock_revenue,
+                    "viral_potential": performance_data.viral_potential,
+                    "quality_score": performance_data.quality_score,
+                    "source": "content_scheduler",
+                    "created_at": performance_data.created_at,
+                    "updated_at": performance_data.performance_date
+                })
             
             logger.info(f"✅ Tracked analytics for {len(content_list)} content pieces")
             
         except Exception as e:
             logger.error(f"❌ Error tracking content analytics: {e}")
 
-    async def _save_performance_to_csv(self):
-        """Save performance data to CSV file"""
-        try:
-            data_dir = "data"
-            os.makedirs(data_dir, exist_ok=True)
-            
-            csv_file = os.path.join(data_dir, "content_performance_analytics.csv")
-            
-            # Check if file exists to determine if we need headers
-            file_exists = os.path.exists(csv_file)
-            
-            with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                # Write headers if file doesn't exist
-                if not file_exists:
-                    writer.writerow([
-                        'content_id', 'title', 'channel', 'viral_potential', 'quality_score',
-                        'mock_views', 'mock_engagement_rate', 'mock_revenue', 'created_at', 'performance_date'
-                    ])
-                
-                # Write performance data
-                for performance in self.performance_data[-len(self.channels):]:  # Only latest batch
-                    writer.writerow([
-                        performance.content_id,
-                        performance.title,
-                        performance.channel,
-                        performance.viral_potential,
-                        performance.quality_score,
-                        performance.mock_views,
-                        performance.mock_engagement_rate,
-                        performance.mock_revenue,
-                        performance.created_at.isoformat(),
-                        performance.performance_date.isoformat()
-                    ])
-            
-            logger.info(f"✅ Performance data saved to {csv_file}")
-            
-        except Exception as e:
-            logger.error(f"❌ Error saving performance to CSV: {e}")
-
     async def track_daily_performance(self):
         """Track daily content performance with mock data"""
         logger.info("📊 Tracking daily content performance...")
@@ -629,27 +637,18 @@ class ContentScheduler:
             return None
 
     async def _load_existing_business_ideas(self) -> List[Dict[str, Any]]:
-        """Load existing business ideas from analytics file"""
+        """Load the most recent business ideas from the analytics log"""
         try:
-            from pathlib import Path
-            data_dir = Path("data")
-            analytics_file = data_dir / "business_ideas_analytics.json"
-            
-            if analytics_file.exists():
-                with open(analytics_file, 'r', encoding='utf-8') as f:
-                    existing_analytics = json.load(f)
-                    # Convert analytics data to business idea format
-                    ideas = []
-                    for analytics in existing_analytics[-10:]:  # Last 10 ideas
-                        ideas.append({
-                            "title": analytics.get("idea_title", "Unknown"),
-                            "initial_investment": analytics.get("initial_investment", 0),
-                            "projected_revenue_year_3": analytics.get("projected_revenue_year_3", 0),
-                            "roi_percentage": analytics.get("roi_percentage", 0)
-                        })
-                    return ideas
-            else:
-                return []
+            # Convert analytics data to business idea format
+            return [
+                {
+                    "title": analytics.get("idea_title", "Unknown"),
+                    "initial_investment": analytics.get("initial_investment", 0),
+                    "projected_revenue_year_3": analytics.get("projected_revenue_year_3", 0),
+                    "roi_percentage": analytics.get("roi_percentage", 0)
+                }
+                for analytics in get_analytics_log("business_ideas").tail(10)  # Last 10 ideas
+            ]
                 
         except Exception as e:
             logger.error(f"❌ Error loading existing business ideas: {e}")
@@ -772,6 +771,7 @@ class ContentScheduler:
                     "average_viral_potential": average_viral_potential,
                     "total_estimated_revenue": total_revenue,
                     "variation_types": variation_types,
+                    "ideas_per_minute": self.ai_module.niche_generation_stats.get("ideas_per_minute", 0.0),
                     "content_ideas": [asdict(idea) for idea in content_ideas],
                     "generated_at": datetime.utcnow().isoformat()
                 }
@@ -898,8 +898,12 @@ class ContentScheduler:
             logger.error(f"❌ Failed to generate viral idea: {e}")
             return None
     
-    async def _generate_with_ollama(self, topic: str, quality_focus: bool = False) -> Optional[ContentIdea]:
+    async def _generate_with_ollama(self, topic: str, quality_focus: bool = False, use_cache: bool = True) -> Optional[ContentIdea]:
         """Generate content idea using Ollama locally with optional quality focus"""
+        if not self.llm_gateway.is_available():
+            logger.warning("⚠️ Ollama circuit open, using fallback idea")
+            return self._create_fallback_idea(topic)
+        
         try:
             if quality_focus:
                 prompt = f"""
@@ -948,40 +952,27 @@ class ContentScheduler:
                 }}
                 """
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": "llama2",
-                        "prompt": prompt,
-                        "stream": False
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get("response", "")
-                    
-                    # Parse JSON response
-                    try:
-                        idea_data = json.loads(content)
-                        return ContentIdea(
-                            title=idea_data.get("title", "Viral Content Idea"),
-                            description=idea_data.get("description", "Engaging content description"),
-                            content_type=ContentType(idea_data.get("content_type", "video")),
-                            target_audience=idea_data.get("target_audience", "General audience"),
-                            viral_potential=idea_data.get("viral_potential", 0.8),
-                            estimated_revenue=idea_data.get("estimated_revenue", 300.0),
-                            keywords=idea_data.get("keywords", []),
-                            hashtags=idea_data.get("hashtags", [])
-                        )
-                    except json.JSONDecodeError:
-                        logger.warning("Failed to parse Ollama response as JSON")
-                        return self._create_fallback_idea(topic)
-                else:
-                    logger.error(f"Ollama API error: {response.status_code}")
-                    return self._create_fallback_idea(topic)
+            try:
+                content = await self.llm_gateway.generate(prompt, model="llama2", timeout=30.0, use_cache=use_cache)
+            except LLMGatewayError as e:
+                logger.error(f"Ollama API error: {e}")
+                return self._create_fallback_idea(topic)
+            
+            # Parse JSON response
+            idea_data = extract_json(content, "content_idea")
+            if idea_data is None:
+                return self._create_fallback_idea(topic)
+            
+            return ContentIdea(
+                title=idea_data.get("title", "Viral Content Idea"),
+                description=idea_data.get("description", "Engaging content description"),
+                content_type=ContentType(idea_data.get("content_type", "video")),
+                target_audience=idea_data.get("target_audience", "General audience"),
+                viral_potential=float(idea_data.get("viral_potential", 0.8)),
+                estimated_revenue=float(idea_data.get("estimated_revenue", 300.0)),
+                keywords=idea_data.get("keywords", []),
+                hashtags=idea_data.get("hashtags", [])
+            )
                     
         except Exception as e:
             logger.error(f"❌ Ollama generation failed: {e}")
@@ -1002,6 +993,9 @@ class ContentScheduler:
     
     async def _repurpose_for_channel(self, original_idea: ContentIdea, channel: ChannelType) -> Optional[RepurposedContent]:
         """Repurpose content for specific channel"""
+        if not self.llm_gateway.is_available():
+            return self._create_fallback_repurpose(original_idea, channel, self.platform_configs[channel])
+        
         try:
             config = self.platform_configs[channel]
             
@@ -1031,43 +1025,31 @@ class ContentScheduler:
             }}
             """
             
-            # Use Ollama for repurposing
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": "llama2",
-                        "prompt": prompt,
-                        "stream": False
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result.get("response", "")
-                    
-                    try:
-                        repurpose_data = json.loads(content)
-                        return RepurposedContent(
-                            original_idea=original_idea,
-                            channel=channel,
-                            adapted_title=repurpose_data.get("adapted_title", original_idea.title),
-                            adapted_description=repurpose_data.get("adapted_description", original_idea.description),
-                            platform_specific_hooks=repurpose_data.get("platform_hooks", []),
-                            optimal_posting_time=repurpose_data.get("optimal_posting_time", config["best_time"]),
-                            hashtags=repurpose_data.get("hashtags", original_idea.hashtags[:config["hashtag_limit"]]),
-                            content_format=repurpose_data.get("content_format", config["format"]),
-                            estimated_engagement=repurpose_data.get("estimated_engagement", 0.8),
-                            viral_potential=original_idea.viral_potential,
-                            quality_score=0.0,  # Will be calculated later
-                            mock_views=0,  # Will be set later
-                            mock_engagement_rate=0.0  # Will be set later
-                        )
-                    except json.JSONDecodeError:
-                        return self._create_fallback_repurpose(original_idea, channel, config)
-                else:
-                    return self._create_fallback_repurpose(original_idea, channel, config)
+            # Use Ollama for repurposing, stopping once the JSON object is complete
+            try:
+                content = await self.llm_gateway.generate_json_stream(prompt, model="llama2", timeout=30.0)
+            except LLMGatewayError:
+                return self._create_fallback_repurpose(original_idea, channel, config)
+            
+            repurpose_data = extract_json(content, "repurpose")
+            if repurpose_data is None:
+                return self._create_fallback_repurpose(original_idea, channel, config)
+            
+            return RepurposedContent(
+                original_idea=original_idea,
+                channel=channel,
+                adapted_title=repurpose_data.get("adapted_title", original_idea.title),
+                adapted_description=repurpose_data.get("adapted_description", original_idea.description),
+                platform_specific_hooks=repurpose_data.get("platform_hooks", []),
+                optimal_posting_time=repurpose_data.get("optimal_posting_time", config["best_time"]),
+                hashtags=repurpose_data.get("hashtags", original_idea.hashtags[:config["hashtag_limit"]]),
+                content_format=repurpose_data.get("content_format", config["format"]),
+                estimated_engagement=repurpose_data.get("estimated_engagement", 0.8),
+                viral_potential=original_idea.viral_potential,
+                quality_score=0.0,  # Will be calculated later
+                mock_views=0,  # Will be set later
+                mock_engagement_rate=0.0  # Will be set later
+            )
                     
         except Exception as e:
             logger.error(f"❌ Failed to repurpose for {channel.value}: {e}")
@@ -1272,8 +1254,12 @@ class ContentScheduler:
         await self.generate_daily_content()
         return self.content_history[-len(self.channels):] if self.content_history else []
 
-# Global scheduler instance
-content_scheduler = ContentScheduler()
+# Global scheduler instance (built on first use)
+content_scheduler = services.register("content_scheduler", ContentScheduler)
+
+def get_content_scheduler() -> ContentScheduler:
+    """Get the process-wide content scheduler"""
+    return services.get("content_scheduler")
 
 async def start_content_scheduler():
     """Start the content scheduler"""
@@ -7,23 +7,29 @@ import asyncio
 import logging
 import json
 import os
-import csv
+import random
+import statistics
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 
 # Import local modules
-from ai import AIModule
-from content_scheduler import ContentScheduler
-from finance import FinanceManager
+from ai import get_ai_module
+from content_scheduler import get_content_scheduler
+from finance import get_finance_manager
+from performance_store import performance_store
+from analytics_log import get_analytics_log
+from registry import services
 
 logger = logging.getLogger(__name__)
 
+def _pyplot():
+    """Import matplotlib on first chart render rather than at module import"""
+    import matplotlib.pyplot as plt
+    return plt
+
 class ChannelType(Enum):
     """Social media channels for analytics"""
     YOUTUBE = "youtube"
@@ -67,9 +73,6 @@ class DashboardManager:
     """Dashboard manager for multi-channel analytics and reporting"""
     
     def __init__(self):
-        self.ai_module = AIModule()
-        self.scheduler = ContentScheduler()
-        self.finance_manager = FinanceManager()
         self.channels = list(ChannelType)
         self.reports_history = []
         self.data_dir = Path("data")
@@ -95,6 +98,21 @@ class DashboardManager:
         
         logger.info("Dashboard manager initialized")
 
+    @property
+    def ai_module(self):
+        """Shared AI module (resolved on first use)"""
+        return get_ai_module()
+
+    @property
+    def scheduler(self):
+        """Shared content scheduler (resolved on first use)"""
+        return get_content_scheduler()
+
+    @property
+    def finance_manager(self):
+        """Shared finance manager (resolved on first use)"""
+        return get_finance_manager()
+
     async def generate_daily_report(self) -> DashboardReport:
         """Generate daily dashboard report with multi-channel analytics"""
         try:
@@ -113,16 +131,16 @@ class DashboardManager:
             # Calculate summary metrics
             total_views = sum(metrics.views for metrics in channel_breakdown.values())
             total_revenue = sum(metrics.revenue for metrics in channel_breakdown.values())
-            average_engagement = np.mean([metrics.engagement_rate for metrics in channel_breakdown.values()])
+            average_engagement = statistics.fmean([metrics.engagement_rate for metrics in channel_breakdown.values()])
             
             # Find top performing channel
             top_channel = max(channel_breakdown.values(), key=lambda x: x.revenue)
             
             # Calculate content quality score
-            content_quality_score = np.mean([metrics.quality_score for metrics in channel_breakdown.values()])
+            content_quality_score = statistics.fmean([metrics.quality_score for metrics in channel_breakdown.values()])
             
-            # Count business ideas generated
-            business_ideas_generated = len(business_analytics) if business_analytics else 0
+            # Count business ideas generated (index lookup, no records read)
+            business_ideas_generated = len(get_analytics_log("business_ideas"))
             
             # Create report
             report = DashboardReport(
@@ -149,52 +167,27 @@ class DashboardManager:
     async def _load_content_analytics(self) -> List[Dict[str, Any]]:
         """Load content performance analytics"""
         try:
-            analytics_file = self.data_dir / "content_performance_analytics.csv"
-            if not analytics_file.exists():
-                return []
-            
-            analytics = []
-            with open(analytics_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    analytics.append(row)
-            
-            return analytics
+            return list(performance_store.records())
             
         except Exception as e:
             logger.error(f"Error loading content analytics: {e}")
             return []
 
-    async def _load_business_analytics(self) -> List[Dict[str, Any]]:
-        """Load business ideas analytics"""
+    async def _load_business_analytics(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Load business ideas analytics from the report window"""
         try:
-            analytics_file = self.data_dir / "business_ideas_analytics.json"
-            if not analytics_file.exists():
-                return []
-            
-            with open(analytics_file, 'r', encoding='utf-8') as f:
-                analytics = json.load(f)
-            
-            return analytics
+            since = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+            return list(get_analytics_log("business_ideas").since(since))
             
         except Exception as e:
             logger.error(f"Error loading business analytics: {e}")
             return []
 
-    async def _load_monetization_analytics(self) -> List[Dict[str, Any]]:
-        """Load monetization analytics"""
+    async def _load_monetization_analytics(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Load monetization analytics from the report window"""
         try:
-            analytics_file = self.data_dir / "monetization_analytics.csv"
-            if not analytics_file.exists():
-                return []
-            
-            analytics = []
-            with open(analytics_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    analytics.append(row)
-            
-            return analytics
+            since = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+            return list(get_analytics_log("monetization").since(since))
             
         except Exception as e:
             logger.error(f"Error loading monetization analytics: {e}")
@@ -211,16 +204,16 @@ class DashboardManager:
             channel_content = [item for item in content_analytics if item.get('channel', '').lower() == channel.value]
             
             # Calculate metrics
-            total_views = sum(int(item.get('mock_views', 0)) for item in channel_content)
-            total_revenue = sum(float(item.get('mock_revenue', 0)) for item in channel_content)
-            engagement_rates = [float(item.get('mock_engagement_rate', 0)) for item in channel_content]
+            total_views = sum(int(item.get('views', 0)) for item in channel_content)
+            total_revenue = sum(float(item.get('revenue', 0)) for item in channel_content)
+            engagement_rates = [float(item.get('engagement_rate', 0)) for item in channel_content]
             viral_potentials = [float(item.get('viral_potential', 0)) for item in channel_content]
             quality_scores = [float(item.get('quality_score', 0)) for item in channel_content]
             
             # Calculate averages
-            avg_engagement = np.mean(engagement_rates) if engagement_rates else 0.0
-            avg_viral_potential = np.mean(viral_potentials) if viral_potentials else 0.0
-            avg_quality_score = np.mean(quality_scores) if quality_scores else 0.0
+            avg_engagement = statistics.fmean(engagement_rates) if engagement_rates else 0.0
+            avg_viral_potential = statistics.fmean(viral_potentials) if viral_potentials else 0.0
+            avg_quality_score = statistics.fmean(quality_scores) if quality_scores else 0.0
             
             # Create channel metrics
             channel_metrics[channel.value] = ChannelMetrics(
@@ -288,18 +281,18 @@ class DashboardManager:
         for channel in self.channels:
             channel_breakdown[channel.value] = ChannelMetrics(
                 channel=channel,
-                views=np.random.randint(1000, 50000),
-                revenue=np.random.uniform(100, 5000),
-                engagement_rate=np.random.uniform(0.05, 0.15),
-                viral_potential=np.random.uniform(0.3, 0.8),
-                quality_score=np.random.uniform(0.6, 0.9),
+                views=random.randrange(1000, 50000),
+                revenue=random.uniform(100, 5000),
+                engagement_rate=random.uniform(0.05, 0.15),
+                viral_potential=random.uniform(0.3, 0.8),
+                quality_score=random.uniform(0.6, 0.9),
                 date=datetime.utcnow()
             )
         
         return DashboardReport(
             total_views=sum(metrics.views for metrics in channel_breakdown.values()),
             total_revenue=sum(metrics.revenue for metrics in channel_breakdown.values()),
-            average_engagement=np.mean([metrics.engagement_rate for metrics in channel_breakdown.values()]),
+            average_engagement=statistics.fmean([metrics.engagement_rate for metrics in channel_breakdown.values()]),
             top_performing_channel=ChannelType.YOUTUBE,
             channel_breakdown=channel_breakdown,
             business_ideas_generated=1,
@@ -310,6 +303,7 @@ class DashboardManager:
     async def generate_multi_channel_graphs(self, report: DashboardReport) -> Dict[str, str]:
         """Generate multi-channel graphs using Matplotlib"""
         try:
+            plt = _pyplot()
             logger.info("📈 Generating multi-channel graphs...")
             
             # Set matplotlib style
@@ -349,6 +343,7 @@ class DashboardManager:
     async def _create_views_comparison_chart(self, report: DashboardReport) -> str:
         """Create views comparison chart"""
         try:
+            plt = _pyplot()
             channels = list(report.channel_breakdown.keys())
             views = [report.channel_breakdown[channel].views for channel in channels]
             colors = [self.channel_colors[ChannelType(channel)] for channel in channels]
@@ -382,6 +377,7 @@ class DashboardManager:
     async def _create_revenue_comparison_chart(self, report: DashboardReport) -> str:
         """Create revenue comparison chart"""
         try:
+            plt = _pyplot()
             channels = list(report.channel_breakdown.keys())
             revenues = [report.channel_breakdown[channel].revenue for channel in channels]
             colors = [self.channel_colors[ChannelType(channel)] for channel in channels]
@@ -415,6 +411,7 @@ class DashboardManager:
     async def _create_engagement_chart(self, report: DashboardReport) -> str:
         """Create engagement rate chart"""
         try:
+            plt = _pyplot()
             channels = list(report.channel_breakdown.keys())
             engagement_rates = [report.channel_breakdown[channel].engagement_rate * 100 for channel in channels]
             colors = [self.channel_colors[ChannelType(channel)] for channel in channels]
@@ -448,6 +445,7 @@ class DashboardManager:
     async def _create_quality_chart(self, report: DashboardReport) -> str:
         """Create quality score chart"""
         try:
+            plt = _pyplot()
             channels = list(report.channel_breakdown.keys())
             quality_scores = [report.channel_breakdown[channel].quality_score * 100 for channel in channels]
             colors = [self.channel_colors[ChannelType(channel)] for channel in channels]
@@ -481,6 +479,7 @@ class DashboardManager:
     async def _create_combined_metrics_chart(self, report: DashboardReport) -> str:
         """Create combined metrics chart"""
         try:
+            plt = _pyplot()
             channels = list(report.channel_breakdown.keys())
             metrics_data = {
                 'Views': [report.channel_breakdown[channel].views for channel in channels],
@@ -706,8 +705,12 @@ class DashboardManager:
                 "error": str(e)
             }
 
-# Global dashboard manager instance
-dashboard_manager = DashboardManager()
+# Global dashboard manager instance (built on first use)
+dashboard_manager = services.register("dashboard_manager", DashboardManager)
+
+def get_dashboard_manager() -> DashboardManager:
+    """Get the process-wide dashboard manager"""
+    return services.get("dashboard_manager")
 
 async def start_dashboard_scheduler():
     """Start dashboard scheduler for daily reports"""
@@ -0,0 +1,169 @@
+"""
+Dataset Builder Module for CK Empire Builder
+Streaming, deduplicated, sharded JSONL writer for fine-tuning datasets
+"""
+
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        FINE_TUNING_SHARD_SIZE = int(os.getenv("FINE_TUNING_SHARD_SIZE", "50000"))
+
+logger = logging.getLogger(__name__)
+
+def example_hash(record: Dict[str, Any]) -> int:
+    """64-bit content hash of an input/output pair, insensitive to whitespace runs"""
+    normalized = "\x1f".join(" ".join(str(record.get(key, "")).split()) for key in ("input", "output"))
+    return int.from_bytes(hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest(), "big")
+
+class FineTuningDatasetBuilder:
+    """Appends input/output examples to sharded JSONL files, skipping pairs already stored"""
+
+    def __init__(self, path: str, shard_size: Optional[int] = None, index_path: Optional[str] = None):
+        """
+        Args:
+            path: First shard; later shards are written next to it as <stem>.00001<suffix>, ...
+            shard_size: Max examples per shard (0 disables sharding)
+            index_path: Persistent hash index (defaults to <path>.index)
+        """
+        self.path = Path(path)
+        self.shard_size = settings.FINE_TUNING_SHARD_SIZE if shard_size is None else shard_size
+        self.index_path = Path(index_path) if index_path else self.path.with_name(self.path.name + ".index")
+
+        self._hashes: Optional[Set[int]] = None
+        self._shard_number = 0
+        self._shard_count = 0
+
+    def shard_path(self, number: int) -> Path:
+        """Path of the given shard"""
+        if number == 0:
+            return self.path
+        return self.path.with_name(f"{self.path.stem}.{number:05d}{self.path.suffix}")
+
+    def shard_paths(self) -> List[Path]:
+        """Existing shards in write order"""
+        paths = []
+        number = 0
+        while self.shard_path(number).exists():
+            paths.append(self.shard_path(number))
+            number += 1
+        return paths
+
+    def exists(self) -> bool:
+        """Whether any examples have been written"""
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def _load(self):
+        """Load the hash index and locate the shard to append to"""
+        if self._hashes is not None and self.path.exists():
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        shards = self.shard_paths()
+        self._shard_number = max(len(shards) - 1, 0)
+        self._shard_count = self._count_lines(shards[-1]) if shards else 0
+
+        if not shards and self.index_path.exists():
+            # Dataset was removed; its index is stale
+            self.index_path.unlink()
+
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._hashes = {int(line, 16) for line in f if line.strip()}
+        else:
+            # Rebuild from the dataset itself (first run or index lost)
+            self._hashes = set()
+            with open(self.index_path, 'w', encoding='utf-8') as index:
+                for record in self.iter_records():
+                    digest = example_hash(record)
+                    if digest not in self._hashes:
+                        self._hashes.add(digest)
+                        index.write(f"{digest:016x}\n")
+            if self._hashes:
+                logger.info(f"Rebuilt dataset hash index with {len(self._hashes)} entries")
+
+    @staticmethod
+    def _count_lines(path: Path) -> int:
+        """Count lines without loading the file"""
+        with open(path, 'rb') as f:
+            return sum(1 for _ in f)
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Stream records into the dataset
+
+        Args:
+            records: Iterable (typically a generator) of {"input": ..., "output": ...} dicts
+
+        Returns:
+            Counts of added, duplicate and invalid records
+        """
+        self._load()
+        stats = {"added": 0, "duplicates": 0, "invalid": 0}
+
+        shard = open(self.shard_path(self._shard_number), 'a', encoding='utf-8')
+        index = open(self.index_path, 'a', encoding='utf-8')
+        try:
+            for record in records:
+                if not record.get("input") or not record.get("output"):
+                    stats["invalid"] += 1
+                    continue
+
+                digest = example_hash(record)
+                if digest in self._hashes:
+                    stats["duplicates"] += 1
+                    continue
+
+                if self.shard_size and self._shard_count >= self.shard_size:
+                    shard.close()
+                    self._shard_number += 1
+                    self._shard_count = 0
+                    shard = open(self.shard_path(self._shard_number), 'a', encoding='utf-8')
+
+                shard.write(json.dumps({"input": record["input"], "output": record["output"]}, ensure_ascii=False) + '\n')
+                index.write(f"{digest:016x}\n")
+                self._hashes.add(digest)
+                self._shard_count += 1
+                stats["added"] += 1
+        finally:
+            shard.close()
+            index.close()
+
+        return stats
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream every stored example across shards"""
+        for path in self.shard_paths():
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping malformed dataset line in {path}")
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._hashes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dataset size and layout"""
+        self._load()
+        return {
+            "examples": len(self._hashes),
+            "shards": len(self.shard_paths()),
+            "shard_size": self.shard_size,
+            "path": str(self.path),
+            "index_path": str(self.index_path)
+        }
@@ -0,0 +1,163 @@
+"""
+Document Renderer Module for CK Empire Builder
+Precompiled Jinja2 templates streamed to disk off the event loop, deduplicated by content hash
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from optional_imports import module_available
+
+# PDF conversion (wkhtmltopdf wrapper)
+PDFKIT_AVAILABLE = module_available("pdfkit")
+if not PDFKIT_AVAILABLE:
+    logging.warning("pdfkit not available. Documents will be written as HTML. Install with: pip install pdfkit")
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+def _money(value: Any) -> str:
+    return f"${float(value or 0):,.0f}"
+
+def _percent(value: Any) -> str:
+    return f"{float(value or 0):.2f}%"
+
+def _growth(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}%"
+
+class DocumentRenderer:
+    """Renders HTML documents from templates compiled once per process"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, output_dir: str = "data"):
+        """
+        Args:
+            template_dir: Directory holding the .html templates
+            output_dir: Where rendered documents are written
+        """
+        self.output_dir = Path(output_dir)
+        self.environment = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        self.environment.filters.update(money=_money, percent=_percent, growth=_growth)
+        self._templates: Dict[str, Tuple[Any, str]] = {}
+        # Cleared after the first failed conversion (e.g. wkhtmltopdf not installed)
+        self._pdf_enabled = PDFKIT_AVAILABLE
+        self._stats = {"rendered": 0, "deduplicated": 0, "pdf_converted": 0, "bytes_written": 0}
+
+    def _template(self, name: str) -> Tuple[Any, str]:
+        """Compiled template and a checksum of its source, cached after first use"""
+        cached = self._templates.get(name)
+        if cached is None:
+            source, _, _ = self.environment.loader.get_source(self.environment, name)
+            cached = (self.environment.get_template(name), hashlib.sha256(source.encode("utf-8")).hexdigest())
+            self._templates[name] = cached
+        return cached
+
+    def document_hash(self, template_name: str, context: Dict[str, Any]) -> str:
+        """
+        Content hash of a document: the template source plus its context
+
+        Volatile values such as the generation time are not part of context,
+        so identical inputs always map to the same document.
+        """
+        _, source_hash = self._template(template_name)
+        payload = json.dumps(context, sort_keys=True, default=str)
+        return hashlib.sha256(f"{template_name}\0{source_hash}\0{payload}".encode("utf-8")).hexdigest()
+
+    def render(self, template_name: str, context: Dict[str, Any]) -> str:
+        """Render a template to a string"""
+        template, _ = self._template(template_name)
+        return template.render(generated_on=datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC'), **context)
+
+    def _write(self, template_name: str, context: Dict[str, Any], path: Path) -> int:
+        """Stream rendered chunks into a temp file, then move it into place"""
+        template, _ = self._template(template_name)
+        # Unique temp name: concurrent renders of the same document each replace atomically
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        written = 0
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for chunk in template.generate(generated_on=datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC'), **context):
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(tmp_path, path)
+        return written
+
+    def _to_pdf(self, html_path: Path, pdf_path: Path):
+        import pdfkit
+        pdfkit.from_file(str(html_path), str(pdf_path))
+
+    async def render_to_file(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        prefix: str,
+        pdf: bool = False
+    ) -> Tuple[str, bool]:
+        """
+        Write a document unless an identical one already exists
+
+        Args:
+            template_name: Template file name
+            context: Template variables (must be JSON-serializable for hashing)
+            prefix: File name prefix, e.g. "business_plan_Smart_Home"
+            pdf: Also convert to PDF when pdfkit is installed
+
+        Returns:
+            (path to the PDF if converted, else the HTML; True if newly written)
+        """
+        digest = self.document_hash(template_name, context)
+        html_path = self.output_dir / f"{prefix}_{digest[:16]}.html"
+        pdf_path = html_path.with_suffix(".pdf")
+
+        if pdf and pdf_path.exists():
+            self._stats["deduplicated"] += 1
+            return str(pdf_path), False
+        if html_path.exists() and not (pdf and self._pdf_enabled):
+            self._stats["deduplicated"] += 1
+            return str(html_path), False
+
+        loop = asyncio.get_running_loop()
+        created = False
+        if not html_path.exists():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            written = await loop.run_in_executor(None, self._write, template_name, context, html_path)
+            self._stats["rendered"] += 1
+            self._stats["bytes_written"] += written
+            created = True
+            logger.info(f"Rendered {template_name} to {html_path} ({written} chars)")
+
+        if pdf and self._pdf_enabled:
+            try:
+                await loop.run_in_executor(None, self._to_pdf, html_path, pdf_path)
+                self._stats["pdf_converted"] += 1
+                return str(pdf_path), True
+            except Exception as e:
+                self._pdf_enabled = False
+                logger.warning(f"PDFKit failed, writing HTML files from now on: {e}")
+
+        return str(html_path), created
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get render and deduplication counters"""
+        return {**self._stats, "templates_compiled": len(self._templates)}
+
+# Global document renderer instance
+document_renderer = DocumentRenderer()
+
+def get_document_renderer() -> DocumentRenderer:
+    """Get the global document renderer instance"""
+    return document_renderer
@@ -19,6 +19,7 @@ from pydantic import BaseModel
 
 from database import get_db
 from config import settings
+from registry import services
 
 logger = logging.getLogger(__name__)
 
@@ -701,5 +702,9 @@ class EthicsManager:
             'aif360_integration': True
         }
 
-# Global instance
-ethics_manager = EthicsManager() 
\ No newline at end of file
+# Global instance (built on first use)
+ethics_manager = services.register("ethics_manager", EthicsManager)
+
+def get_ethics_manager() -> EthicsManager:
+    """Get the process-wide ethics manager"""
+    return services.get("ethics_manager")
@@ -14,6 +14,8 @@ import asyncio
 from pathlib import Path
 import math
 
+from registry import services
+
 # Optional imports for advanced financial calculations
 try:
     import pandas as pd
@@ -1047,5 +1049,9 @@ class FinanceManager:
         
         return recommendations
 
-# Global instance
-finance_manager = FinanceManager() 
\ No newline at end of file
+# Global instance (built on first use)
+finance_manager = services.register("finance_manager", FinanceManager)
+
+def get_finance_manager() -> FinanceManager:
+    """Get the process-wide finance manager"""
+    return services.get("finance_manager")
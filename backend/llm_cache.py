@@ -0,0 +1,251 @@
+"""
+LLM Response Cache Module for CK Empire Builder
+Disk-backed, content-addressed LRU cache for Ollama and OpenAI responses
+"""
+
+import json
+import time
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. LLM cache metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        LLM_CACHE_ENABLED = True
+        LLM_CACHE_PATH = "data/llm_cache.db"
+        LLM_CACHE_TTL = 86400
+        LLM_CACHE_MAX_ENTRIES = 5000
+        LLM_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    LLM_CACHE_HITS = Counter('llm_cache_hits_total', 'Total LLM response cache hits', ['model'])
+    LLM_CACHE_MISSES = Counter('llm_cache_misses_total', 'Total LLM response cache misses', ['model'])
+    LLM_CACHE_EVICTIONS = Counter('llm_cache_evictions_total', 'Total LLM response cache evictions')
+
+def make_cache_key(model: str, prompt: Any, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a content-addressed cache key
+
+    Args:
+        model: Model name
+        prompt: Prompt text or chat messages
+        params: Generation parameters (temperature, max_tokens, options...)
+
+    Returns:
+        SHA-256 hex digest of the normalized request
+    """
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "params": params or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class LLMResponseCache:
+    """SQLite-backed LRU cache with TTL and size-bounded eviction"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.path = path or settings.LLM_CACHE_PATH
+        self.ttl = ttl if ttl is not None else settings.LLM_CACHE_TTL
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.LLM_CACHE_MAX_BYTES
+        self.enabled = settings.LLM_CACHE_ENABLED if enabled is None else enabled
+
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # SQLite work for async callers runs here, off the event loop
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the cache database lazily"""
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str, model: str = "unknown") -> Optional[str]:
+        """Get a cached response, refreshing its LRU position"""
+        if not self.enabled:
+            return None
+
+        try:
+            with self._lock:
+                conn = self._get_connection()
+                row = conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                now = time.time()
+                if row and (self.ttl <= 0 or now - row[1] <= self.ttl):
+                    conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+                    conn.commit()
+                    value = row[0]
+                else:
+                    if row:
+                        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                        conn.commit()
+                    value = None
+        except sqlite3.Error as e:
+            logger.error(f"LLM cache get error: {e}")
+            return None
+
+        if value is not None:
+            self.stats["hits"] += 1
+            if PROMETHEUS_AVAILABLE:
+                LLM_CACHE_HITS.labels(model=model).inc()
+        else:
+            self.stats["misses"] += 1
+            if PROMETHEUS_AVAILABLE:
+                LLM_CACHE_MISSES.labels(model=model).inc()
+        return value
+
+    def set(self, key: str, value: str, model: str = "unknown") -> bool:
+        """Store a response and evict least recently used entries if over budget"""
+        if not self.enabled or not value:
+            return False
+
+        try:
+            with self._lock:
+                conn = self._get_connection()
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, model, value, size, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, value, len(value.encode("utf-8")), now, now)
+                )
+                self._evict(conn)
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"LLM cache set error: {e}")
+            return False
+
+    def _run(self, func, *args):
+        """Run a blocking cache call on the cache's worker thread"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache")
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def aget(self, key: str, model: str = "unknown") -> Optional[str]:
+        """Async get that keeps SQLite queries off the event loop"""
+        if not self.enabled:
+            return None
+        return await self._run(self.get, key, model)
+
+    async def aset(self, key: str, value: str, model: str = "unknown") -> bool:
+        """Async set that keeps SQLite writes off the event loop"""
+        if not self.enabled or not value:
+            return False
+        return await self._run(self.set, key, value, model)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop expired entries, then LRU entries until within entry and byte limits"""
+        evicted = 0
+        if self.ttl > 0:
+            evicted += conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl,)).rowcount
+
+        count, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        while count > self.max_entries or total_bytes > self.max_bytes:
+            row = conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access ASC LIMIT 1").fetchone()
+            if not row:
+                break
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (row[0],))
+            count -= 1
+            total_bytes -= row[1]
+            evicted += 1
+
+        if evicted:
+            self.stats["evictions"] += evicted
+            if PROMETHEUS_AVAILABLE:
+                LLM_CACHE_EVICTIONS.inc(evicted)
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        entries, total_bytes = 0, 0
+        if self.enabled:
+            try:
+                with self._lock:
+                    entries, total_bytes = self._get_connection().execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+                    ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"LLM cache stats error: {e}")
+
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "bytes": total_bytes,
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "evictions": self.stats["evictions"],
+            "hit_rate": self.stats["hits"] / lookups * 100 if lookups else 0.0,
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes
+        }
+
+    def close(self):
+        """Close the cache database and its worker thread"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Global LLM response cache instance
+llm_cache = LLMResponseCache()
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the global LLM response cache instance"""
+    return llm_cache
@@ -0,0 +1,652 @@
+"""
+LLM Gateway Module for CK Empire Builder
+Shared pooled async client for all Ollama calls with keep-alive, per-model concurrency limits and latency metrics
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Optional
+
+import httpx
+
+from llm_cache import llm_cache, make_cache_key, LLMResponseCache
+from llm_json import IncrementalJSONScanner
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter, Histogram, Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. LLM gateway metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+        LLM_MAX_CONNECTIONS = 20
+        LLM_MAX_KEEPALIVE_CONNECTIONS = 10
+        LLM_KEEPALIVE_EXPIRY = 60.0
+        LLM_MAX_CONCURRENCY_PER_MODEL = 4
+        LLM_BREAKER_FAILURE_THRESHOLD = 5
+        LLM_BREAKER_RECOVERY_TIMEOUT = 30.0
+        LLM_BREAKER_HALF_OPEN_MAX_CALLS = 1
+        LLM_BREAKER_SUCCESS_THRESHOLD = 2
+        LLM_HEALTH_PROBE_INTERVAL = 15.0
+        LLM_INTERACTIVE_LATENCY_BUDGET = 3.0
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OLLAMA_MODEL = "llama2"
+DEFAULT_TIMEOUT = 30.0
+
+if PROMETHEUS_AVAILABLE:
+    LLM_REQUESTS_TOTAL = Counter('llm_requests_total', 'Total LLM gateway requests', ['model', 'status'])
+    LLM_REQUEST_DURATION = Histogram(
+        'llm_request_duration_seconds',
+        'LLM gateway request duration in seconds',
+        ['model'],
+        buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+    )
+    LLM_REQUESTS_IN_FLIGHT = Gauge('llm_requests_in_flight', 'LLM gateway requests currently in flight', ['model'])
+    LLM_TIME_TO_FIRST_TOKEN = Histogram(
+        'llm_time_to_first_token_seconds',
+        'Time until the first streamed token arrives from Ollama',
+        ['model'],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    )
+    LLM_STREAM_EARLY_STOPS = Counter('llm_stream_early_stops_total', 'Streams cut short after a complete JSON object', ['model'])
+    LLM_CIRCUIT_STATE = Gauge('llm_circuit_state', 'Ollama circuit breaker state (0=closed, 1=half_open, 2=open)')
+    LLM_CIRCUIT_TRANSITIONS = Counter('llm_circuit_transitions_total', 'Ollama circuit breaker state transitions', ['state'])
+    LLM_CIRCUIT_REJECTIONS = Counter('llm_circuit_rejections_total', 'Requests short-circuited while the breaker was open')
+    LLM_HEALTH_PROBES = Counter('llm_health_probes_total', 'Ollama health probes', ['status'])
+    LLM_DEADLINE_FALLBACKS = Counter('llm_deadline_fallbacks_total', 'Calls answered by fallback because the latency budget ran out', ['label'])
+
+class LLMGatewayError(Exception):
+    """Raised when the LLM backend is unreachable or returns an error"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        self.status_code = status_code
+        super().__init__(message)
+
+class LLMCircuitOpenError(LLMGatewayError):
+    """Raised without contacting Ollama while the circuit breaker is open"""
+
+class LLMDeadlineExceeded(LLMGatewayError):
+    """Raised when the request latency budget runs out; the call keeps running to warm the cache"""
+
+# Absolute monotonic deadline for LLM calls made on behalf of the current request
+_request_deadline: ContextVar[Optional[float]] = ContextVar("llm_request_deadline", default=None)
+
+# Calls that outlived their deadline and are finishing in the background
+_background_tasks = set()
+
+@contextmanager
+def request_deadline(budget: Optional[float] = None):
+    """
+    Bound every LLM call inside the block by a shared latency budget
+
+    Args:
+        budget: Seconds available for the whole block (defaults to LLM_INTERACTIVE_LATENCY_BUDGET)
+    """
+    budget = settings.LLM_INTERACTIVE_LATENCY_BUDGET if budget is None else budget
+    token = _request_deadline.set(time.monotonic() + budget)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left before the current request deadline, or None when unbounded"""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+def _discard_background_task(task: asyncio.Task):
+    """Drop a finished background call and swallow its outcome"""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Background LLM call failed after deadline: {task.exception()}")
+
+async def run_within_deadline(coro, label: str = "llm") -> Any:
+    """
+    Await a call within the current request deadline
+
+    If the budget runs out first, the call is left running in the background
+    (so its result still lands in the response cache) and LLMDeadlineExceeded
+    is raised so the caller can return its fallback immediately.
+
+    Args:
+        coro: Awaitable performing the call
+        label: Label for metrics and logs
+
+    Returns:
+        The call result
+    """
+    budget = remaining_budget()
+    if budget is None:
+        return await coro
+
+    task = asyncio.ensure_future(coro)
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout=budget)
+    except asyncio.CancelledError:
+        # The caller gave up; let the call finish so its result is still cached
+        _background_tasks.add(task)
+        task.add_done_callback(_discard_background_task)
+        raise
+    except asyncio.TimeoutError:
+        _background_tasks.add(task)
+        task.add_done_callback(_discard_background_task)
+        if PROMETHEUS_AVAILABLE:
+            LLM_DEADLINE_FALLBACKS.labels(label=label).inc()
+        logger.info(f"⏱️ {label} exceeded latency budget, serving fallback while it completes in background")
+        raise LLMDeadlineExceeded(f"{label} did not answer within the latency budget")
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open trial window"""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+        half_open_max_calls: Optional[int] = None,
+        success_threshold: Optional[int] = None
+    ):
+        self.failure_threshold = failure_threshold or settings.LLM_BREAKER_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or settings.LLM_BREAKER_RECOVERY_TIMEOUT
+        self.half_open_max_calls = half_open_max_calls or settings.LLM_BREAKER_HALF_OPEN_MAX_CALLS
+        self.success_threshold = success_threshold or settings.LLM_BREAKER_SUCCESS_THRESHOLD
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.half_open_successes = 0
+        self.half_open_in_flight = 0
+        self.opened_at = 0.0
+        self.rejections = 0
+
+        if PROMETHEUS_AVAILABLE:
+            LLM_CIRCUIT_STATE.set(self.STATE_VALUES[self.state])
+
+    def _transition(self, state: str):
+        """Move to a new state"""
+        if state == self.state:
+            return
+        logger.warning(f"⚠️ Ollama circuit breaker {self.state} -> {state}")
+        self.state = state
+        self.half_open_successes = 0
+        self.half_open_in_flight = 0
+        if state == self.OPEN:
+            self.opened_at = time.monotonic()
+        if state == self.CLOSED:
+            self.consecutive_failures = 0
+
+        if PROMETHEUS_AVAILABLE:
+            LLM_CIRCUIT_STATE.set(self.STATE_VALUES[state])
+            LLM_CIRCUIT_TRANSITIONS.labels(state=state).inc()
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls should skip Ollama entirely"""
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            return self.half_open_in_flight >= self.half_open_max_calls
+        return self.state == self.OPEN
+
+    def allow_request(self) -> bool:
+        """Reserve permission for one call, counting half-open trial calls"""
+        if self.is_open:
+            self.rejections += 1
+            if PROMETHEUS_AVAILABLE:
+                LLM_CIRCUIT_REJECTIONS.inc()
+            return False
+        if self.state == self.HALF_OPEN:
+            self.half_open_in_flight += 1
+        return True
+
+    def record_success(self):
+        """Record a successful call"""
+        if self.state == self.HALF_OPEN:
+            self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
+            self.half_open_successes += 1
+            if self.half_open_successes >= self.success_threshold:
+                self._transition(self.CLOSED)
+        else:
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        """Record a failed call"""
+        if self.state == self.HALF_OPEN:
+            self._transition(self.OPEN)
+            return
+        self.consecutive_failures += 1
+        if self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self._transition(self.OPEN)
+
+    def record_cancelled(self):
+        """Release a half-open trial slot without judging the backend"""
+        if self.state == self.HALF_OPEN:
+            self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
+
+    def record_probe(self, healthy: bool):
+        """Apply a background health probe result"""
+        if healthy:
+            if self.state == self.OPEN:
+                self._transition(self.HALF_OPEN)
+        elif self.state == self.CLOSED:
+            self.consecutive_failures = self.failure_threshold
+            self._transition(self.OPEN)
+        elif self.state == self.HALF_OPEN:
+            self._transition(self.OPEN)
+        else:
+            # Still down; restart the recovery window
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker state"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "half_open_successes": self.half_open_successes,
+            "rejections": self.rejections
+        }
+
+class LLMGateway:
+    """Long-lived pooled gateway for Ollama generation requests"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        max_concurrency_per_model: Optional[int] = None,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[LLMResponseCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        health_probe_interval: Optional[float] = None
+    ):
+        self.base_url = (base_url or settings.OLLAMA_URL).rstrip("/")
+        self.max_connections = max_connections or settings.LLM_MAX_CONNECTIONS
+        self.max_keepalive_connections = max_keepalive_connections or settings.LLM_MAX_KEEPALIVE_CONNECTIONS
+        self.keepalive_expiry = keepalive_expiry or settings.LLM_KEEPALIVE_EXPIRY
+        self.max_concurrency_per_model = max_concurrency_per_model or settings.LLM_MAX_CONCURRENCY_PER_MODEL
+        self.default_timeout = default_timeout
+        self.transport = transport
+        self.cache = cache or llm_cache
+        self.breaker = breaker or CircuitBreaker()
+        self.health_probe_interval = health_probe_interval or settings.LLM_HEALTH_PROBE_INTERVAL
+        self._probe_task: Optional[asyncio.Task] = None
+
+        # The pooled client and semaphores are bound to the event loop they were created on
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        # In-process latency tracking per model
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _bind_to_running_loop(self):
+        """Recreate the pooled client and semaphores when the running event loop changes"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._client is not None and not self._client.is_closed:
+            return
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(self.default_timeout),
+            transport=self.transport
+        )
+        self._loop = loop
+        self._semaphores = {}
+        logger.info(f"LLM gateway client created for {self.base_url} (max connections: {self.max_connections})")
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop"""
+        self._bind_to_running_loop()
+        return self._client
+
+    def _get_semaphore(self, model: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a model"""
+        if model not in self._semaphores:
+            self._semaphores[model] = asyncio.Semaphore(self.max_concurrency_per_model)
+        return self._semaphores[model]
+
+    def _model_stats(self, model: str) -> Dict[str, Any]:
+        """Get or create the in-process stats bucket for a model"""
+        return self._stats.setdefault(model, {
+            "requests": 0,
+            "errors": 0,
+            "total_latency": 0.0,
+            "latencies": deque(maxlen=1000),
+            "first_token_latencies": deque(maxlen=1000)
+        })
+
+    def _record_call(self, model: str, duration: float, status: str):
+        """Record latency and outcome for a single call"""
+        stats = self._model_stats(model)
+        stats["requests"] += 1
+        stats["total_latency"] += duration
+        stats["latencies"].append(duration)
+        if status != "success":
+            stats["errors"] += 1
+
+        if status == "success":
+            self.breaker.record_success()
+        elif status == "cancelled":
+            self.breaker.record_cancelled()
+        else:
+            self.breaker.record_failure()
+
+        if PROMETHEUS_AVAILABLE:
+            LLM_REQUESTS_TOTAL.labels(model=model, status=status).inc()
+            LLM_REQUEST_DURATION.labels(model=model).observe(duration)
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str = DEFAULT_OLLAMA_MODEL,
+        timeout: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Run a non-streaming Ollama generation through the shared pool
+
+        Args:
+            prompt: Prompt text
+            model: Ollama model name
+            timeout: Per-call timeout in seconds (defaults to the gateway timeout)
+            options: Optional Ollama generation options
+            use_cache: Serve from / store into the response cache
+
+        Returns:
+            The generated response text
+
+        Raises:
+            LLMGatewayError: If Ollama is unreachable or returns a non-200 status
+            LLMDeadlineExceeded: If the request deadline passes first
+        """
+        cache_key = make_cache_key(model, prompt, options)
+        if use_cache:
+            cached = await self.cache.aget(cache_key, model=model)
+            if cached is not None:
+                return cached
+
+        return await run_within_deadline(
+            self._generate_request(prompt, model, timeout, options, cache_key, use_cache),
+            label=model
+        )
+
+    async def _generate_request(
+        self,
+        prompt: str,
+        model: str,
+        timeout: Optional[float],
+        options: Optional[Dict[str, Any]],
+        cache_key: str,
+        use_cache: bool
+    ) -> str:
+        """Perform a non-streaming generation request"""
+        client = self.get_client()
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        if options:
+            payload["options"] = options
+
+        async with self._get_semaphore(model):
+            if not self.breaker.allow_request():
+                raise LLMCircuitOpenError("Ollama circuit breaker is open")
+            if PROMETHEUS_AVAILABLE:
+                LLM_REQUESTS_IN_FLIGHT.labels(model=model).inc()
+            start_time = time.perf_counter()
+            status = "error"
+            try:
+                response = await client.post(
+                    "/api/generate",
+                    json=payload,
+                    timeout=timeout or self.default_timeout
+                )
+                if response.status_code != 200:
+                    raise LLMGatewayError(
+                        f"Ollama request failed with status {response.status_code}",
+                        status_code=response.status_code
+                    )
+                status = "success"
+                text = response.json().get("response", "")
+                if use_cache:
+                    await self.cache.aset(cache_key, text, model=model)
+                return text
+            except httpx.HTTPError as e:
+                raise LLMGatewayError(f"Ollama request failed: {e}") from e
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            finally:
+                self._record_call(model, time.perf_counter() - start_time, status)
+                if PROMETHEUS_AVAILABLE:
+                    LLM_REQUESTS_IN_FLIGHT.labels(model=model).dec()
+
+    async def generate_json_stream(
+        self,
+        prompt: str,
+        model: str = DEFAULT_OLLAMA_MODEL,
+        timeout: Optional[float] = None,
+        options: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Stream an Ollama generation and stop as soon as the first JSON object is complete
+
+        Args:
+            prompt: Prompt text
+            model: Ollama model name
+            timeout: Per-call timeout in seconds (defaults to the gateway timeout)
+            options: Optional Ollama generation options
+            use_cache: Serve from / store into the response cache
+
+        Returns:
+            The first complete JSON object text, or the full response if none was found
+
+        Raises:
+            LLMGatewayError: If Ollama is unreachable or returns a non-200 status
+            LLMDeadlineExceeded: If the request deadline passes first
+        """
+        cache_key = make_cache_key(model, prompt, options)
+        if use_cache:
+            cached = await self.cache.aget(cache_key, model=model)
+            if cached is not None:
+                return cached
+
+        return await run_within_deadline(
+            self._stream_request(prompt, model, timeout, options, cache_key, use_cache),
+            label=model
+        )
+
+    async def _stream_request(
+        self,
+        prompt: str,
+        model: str,
+        timeout: Optional[float],
+        options: Optional[Dict[str, Any]],
+        cache_key: str,
+        use_cache: bool
+    ) -> str:
+        """Perform a streaming generation request that stops at the first complete JSON object"""
+        client = self.get_client()
+        payload = {"model": model, "prompt": prompt, "stream": True}
+        if options:
+            payload["options"] = options
+
+        scanner = IncrementalJSONScanner()
+        async with self._get_semaphore(model):
+            if not self.breaker.allow_request():
+                raise LLMCircuitOpenError("Ollama circuit breaker is open")
+            if PROMETHEUS_AVAILABLE:
+                LLM_REQUESTS_IN_FLIGHT.labels(model=model).inc()
+            start_time = time.perf_counter()
+            status = "error"
+            try:
+                async with client.stream(
+                    "POST",
+                    "/api/generate",
+                    json=payload,
+                    timeout=timeout or self.default_timeout
+                ) as response:
+                    if response.status_code != 200:
+                        raise LLMGatewayError(
+                            f"Ollama request failed with status {response.status_code}",
+                            status_code=response.status_code
+                        )
+
+                    first_token = True
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        try:
+                            chunk = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(f"Skipping malformed Ollama stream line: {line[:80]}")
+                            continue
+
+                        token = chunk.get("response", "")
+                        if token and first_token:
+                            first_token = False
+                            self._record_first_token(model, time.perf_counter() - start_time)
+
+                        if scanner.feed(token):
+                            # Leaving the stream context closes the connection and stops generation
+                            if not chunk.get("done") and PROMETHEUS_AVAILABLE:
+                                LLM_STREAM_EARLY_STOPS.labels(model=model).inc()
+                            break
+                        if chunk.get("done"):
+                            break
+
+                status = "success"
+                text = scanner.result()
+                if use_cache:
+                    await self.cache.aset(cache_key, text, model=model)
+                return text
+            except httpx.HTTPError as e:
+                raise LLMGatewayError(f"Ollama request failed: {e}") from e
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            finally:
+                self._record_call(model, time.perf_counter() - start_time, status)
+                if PROMETHEUS_AVAILABLE:
+                    LLM_REQUESTS_IN_FLIGHT.labels(model=model).dec()
+
+    def _record_first_token(self, model: str, duration: float):
+        """Record time-to-first-token for a streamed call"""
+        stats = self._model_stats(model)
+        stats["first_token_latencies"].append(duration)
+
+        if PROMETHEUS_AVAILABLE:
+            LLM_TIME_TO_FIRST_TOKEN.labels(model=model).observe(duration)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-model latency statistics"""
+        summary = {}
+        for model, stats in self._stats.items():
+            latencies = sorted(stats["latencies"])
+            first_token_latencies = stats["first_token_latencies"]
+            summary[model] = {
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "average_latency": stats["total_latency"] / stats["requests"] if stats["requests"] else 0.0,
+                "p50_latency": latencies[int(len(latencies) * 0.50)] if latencies else 0.0,
+                "p95_latency": latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] if latencies else 0.0,
+                "average_time_to_first_token": sum(first_token_latencies) / len(first_token_latencies) if first_token_latencies else 0.0
+            }
+
+        return {
+            "base_url": self.base_url,
+            "max_connections": self.max_connections,
+            "max_concurrency_per_model": self.max_concurrency_per_model,
+            "cache": self.cache.get_stats(),
+            "circuit_breaker": self.breaker.get_stats(),
+            "models": summary
+        }
+
+    async def check_health(self) -> bool:
+        """Probe Ollama's /api/tags endpoint and feed the result to the breaker"""
+        try:
+            response = await self.get_client().get("/api/tags", timeout=5.0)
+            healthy = response.status_code == 200
+        except httpx.HTTPError:
+            healthy = False
+
+        self.breaker.record_probe(healthy)
+        if PROMETHEUS_AVAILABLE:
+            LLM_HEALTH_PROBES.labels(status="healthy" if healthy else "unhealthy").inc()
+        return healthy
+
+    async def _health_probe_loop(self):
+        """Probe Ollama periodically until cancelled"""
+        while True:
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"LLM health probe error: {e}")
+            await asyncio.sleep(self.health_probe_interval)
+
+    def start_health_probe(self):
+        """Start the background health probe on the running event loop"""
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._health_probe_loop())
+            logger.info(f"LLM health probe started (interval: {self.health_probe_interval}s)")
+
+    async def stop_health_probe(self):
+        """Stop the background health probe"""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    def is_available(self) -> bool:
+        """False while the circuit breaker is rejecting calls"""
+        return not self.breaker.is_open
+
+    async def aclose(self):
+        """Close the pooled client"""
+        await self.stop_health_probe()
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("LLM gateway client closed")
+        self._client = None
+        self._loop = None
+
+# Global LLM gateway instance
+llm_gateway = LLMGateway()
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the global LLM gateway instance"""
+    return llm_gateway
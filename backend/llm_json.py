@@ -0,0 +1,452 @@
+"""
+LLM JSON Extraction Module for CK Empire Builder
+Single fast path for pulling validated JSON out of model completions
+"""
+
+import re
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. LLM JSON parse metrics will be limited.")
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    LLM_JSON_PARSE_TOTAL = Counter(
+        'llm_json_parse_total',
+        'LLM JSON extraction attempts by output type and outcome (success, repaired, invalid, no_json)',
+        ['output_type', 'outcome']
+    )
+
+_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)```", re.DOTALL)
+
+_TYPE_CHECKS = {
+    "string": lambda value: isinstance(value, str),
+    "list": lambda value: isinstance(value, list),
+    "dict": lambda value: isinstance(value, dict),
+    "number": lambda value: (isinstance(value, (int, float)) and not isinstance(value, bool)) or _is_numeric_string(value),
+}
+
+def _is_numeric_string(value: Any) -> bool:
+    """Models often quote numbers, sometimes as "$1,200"; accept those that parse once cleaned"""
+    if not isinstance(value, str):
+        return False
+    try:
+        _to_number(value)
+        return True
+    except ValueError:
+        return False
+
+def _to_number(value: str) -> float:
+    """Parse a quoted number, ignoring currency signs and thousands separators"""
+    return float(value.replace("$", "").replace(",", "").strip())
+
+@dataclass
+class OutputSchema:
+    """Shape expected from one kind of LLM output"""
+    name: str
+    kind: str = "object"                                 # "object" or "array"
+    required: Tuple[str, ...] = ()
+    fields: Dict[str, str] = field(default_factory=dict)  # field -> string/number/list/dict
+    item: Optional["OutputSchema"] = None                # schema for array items
+    wrap_single: bool = False                            # accept a lone item for an array schema
+    unwrap_key: Optional[str] = None                     # accept {"<key>": [...]} for an array schema
+    partial: bool = False                                # keep an array with some invalid items, as None
+
+    def _item_ok(self, entry: Any) -> bool:
+        return self.item is None or self.item.validate(entry)
+
+    def validate(self, data: Any) -> bool:
+        """Check data against the schema"""
+        if self.kind == "array":
+            if not isinstance(data, list) or not data:
+                return False
+            if self.partial:
+                return any(self._item_ok(entry) for entry in data)
+            return all(self._item_ok(entry) for entry in data)
+
+        if not isinstance(data, dict):
+            return False
+        if any(key not in data for key in self.required):
+            return False
+        for key, type_name in self.fields.items():
+            if key in data and data[key] is not None and not _TYPE_CHECKS[type_name](data[key]):
+                return False
+        return True
+
+    def normalize(self, data: Any) -> Any:
+        """Convert quoted numbers in validated data to floats so callers can use them directly"""
+        if self.kind == "array":
+            if self.item is None:
+                return data
+            # Invalid items of a partial array stay in place as None so positions still line up
+            return [self.item.normalize(entry) if self._item_ok(entry) else None for entry in data]
+        numeric = [key for key, type_name in self.fields.items() if type_name == "number" and isinstance(data.get(key), str)]
+        if not numeric:
+            return data
+        return {**data, **{key: _to_number(data[key]) for key in numeric}}
+
+    def coerce(self, data: Any) -> Any:
+        """Adapt near-miss shapes (lone item, wrapped list) to the schema kind"""
+        if self.kind != "array":
+            return data
+        if isinstance(data, dict):
+            if self.unwrap_key and isinstance(data.get(self.unwrap_key), list):
+                return data[self.unwrap_key]
+            if self.wrap_single and (self.item is None or self.item.validate(data)):
+                return [data]
+        return data
+
+_IDEA_FIELDS = {
+    "title": "string",
+    "description": "string",
+    "target_audience": "string",
+    "viral_potential": "number",
+    "estimated_revenue": "number",
+    "keywords": "list",
+    "hashtags": "list",
+}
+
+_TREND = OutputSchema(
+    name="trend",
+    required=("trend_name",),
+    fields={
+        "trend_name": "string",
+        "impact_score": "number",
+        "viral_potential": "number",
+        "revenue_potential": "number",
+        "platform_optimization": "list",
+        "hashtags": "list",
+        "keywords": "list",
+    }
+)
+
+_NICHE_IDEA = OutputSchema(name="niche_idea", required=("title",), fields=_IDEA_FIELDS)
+
+SCHEMAS: Dict[str, OutputSchema] = {
+    "content_idea": OutputSchema(name="content_idea", required=("title", "description"), fields=_IDEA_FIELDS),
+    "content_ideas": OutputSchema(
+        name="content_ideas",
+        kind="array",
+        item=OutputSchema(name="content_idea", required=("title",), fields=_IDEA_FIELDS),
+        wrap_single=True,
+        unwrap_key="ideas"
+    ),
+    "niche_idea": _NICHE_IDEA,
+    "niche_batch": OutputSchema(name="niche_batch", kind="array", item=_NICHE_IDEA, unwrap_key="ideas", partial=True),
+    "optimized_content": OutputSchema(name="optimized_content", fields=_IDEA_FIELDS),
+    "trends": OutputSchema(name="trends", kind="array", item=_TREND, wrap_single=True, unwrap_key="trends"),
+    "business_idea": OutputSchema(
+        name="business_idea",
+        required=("title", "description"),
+        fields={
+            "title": "string",
+            "description": "string",
+            "initial_investment": "number",
+            "projected_revenue_year_1": "number",
+            "projected_revenue_year_2": "number",
+            "projected_revenue_year_3": "number",
+            "viral_potential": "number",
+        }
+    ),
+    "channel_adaptation": OutputSchema(
+        name="channel_adaptation",
+        required=("adapted_title",),
+        fields={"adapted_title": "string", "adapted_description": "string", "estimated_views": "number"}
+    ),
+    "monetization": OutputSchema(
+        name="monetization",
+        required=("monthly_views",),
+        fields={
+            "monthly_views": "dict",
+            "rpm_rates": "dict",
+            "affiliate_rates": "dict",
+            "product_margins": "dict",
+            "monetization_strategies": "dict",
+        }
+    ),
+    "quality_assessment": OutputSchema(
+        name="quality_assessment",
+        required=("quality_score",),
+        fields={"quality_score": "number", "viral_potential": "number", "engagement_likelihood": "number"}
+    ),
+    "repurpose": OutputSchema(
+        name="repurpose",
+        required=("adapted_title",),
+        fields={
+            "adapted_title": "string",
+            "adapted_description": "string",
+            "platform_hooks": "list",
+            "hashtags": "list",
+            "estimated_engagement": "number",
+        }
+    ),
+}
+
+class IncrementalJSONScanner:
+    """Tracks brace depth across streamed chunks to detect the end of the first JSON object"""
+
+    def __init__(self):
+        self.buffer = []
+        self.start = None
+        self.end = None
+        self._position = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume a chunk of generated text
+
+        Args:
+            chunk: Newly streamed text
+
+        Returns:
+            True once the first top-level JSON object is complete
+        """
+        if self.end is not None:
+            return True
+
+        self.buffer.append(chunk)
+        for char in chunk:
+            index = self._position
+            self._position += 1
+
+            if self.start is None:
+                if char == "{":
+                    self.start = index
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self._position
+                    return True
+        return False
+
+    @property
+    def text(self) -> str:
+        """All text received so far"""
+        return "".join(self.buffer)
+
+    def result(self) -> str:
+        """The completed JSON object, or all received text if none completed"""
+        text = self.text
+        if self.start is not None and self.end is not None:
+            return text[self.start:self.end]
+        return text
+
+def iter_json_spans(text: str, openers: str = "{[") -> Iterator[str]:
+    """
+    Yield balanced top-level {...} / [...] spans in order of appearance
+
+    One iterative scan that respects string literals, so braces inside values
+    never unbalance it. A mismatched closing bracket abandons the current span
+    and resumes scanning just after its opener, without recursion or copying.
+    """
+    closers = {"{": "}", "[": "]"}
+    stack: List[str] = []
+    start = None
+    in_string = False
+    escaped = False
+    index = 0
+    length = len(text)
+
+    while index < length:
+        char = text[index]
+        if start is None:
+            if char in openers:
+                start = index
+                stack = [closers[char]]
+                in_string = False
+                escaped = False
+            index += 1
+            continue
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in closers:
+            stack.append(closers[char])
+        elif char in "}]":
+            if char != stack[-1]:
+                # Mismatched bracket: abandon this span and rescan after its opener
+                index = start + 1
+                start = None
+                continue
+            stack.pop()
+            if not stack:
+                yield text[start:index + 1]
+                start = None
+        index += 1
+
+def strip_trailing_commas(text: str) -> str:
+    """Remove commas directly before a closing bracket, outside string literals"""
+    result = []
+    in_string = False
+    escaped = False
+    pending_comma = None
+
+    for char in text:
+        if in_string:
+            result.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if pending_comma is not None:
+            if char.isspace():
+                pending_comma.append(char)
+                continue
+            if char not in "}]":
+                result.append(",")
+            result.extend(pending_comma)
+            pending_comma = None
+
+        if char == ",":
+            pending_comma = []
+        else:
+            result.append(char)
+            if char == '"':
+                in_string = True
+
+    if pending_comma is not None:
+        result.append(",")
+        result.extend(pending_comma)
+    return "".join(result)
+
+def _loads(candidate: str) -> Tuple[bool, Any, bool]:
+    """Parse strictly, then with trailing commas removed; returns (ok, data, repaired)"""
+    try:
+        return True, json.loads(candidate), False
+    except (json.JSONDecodeError, ValueError):
+        pass
+    repaired = strip_trailing_commas(candidate)
+    if repaired != candidate:
+        try:
+            return True, json.loads(repaired), True
+        except (json.JSONDecodeError, ValueError):
+            pass
+    return False, None, False
+
+def _candidates(text: str, openers: str) -> Iterator[str]:
+    """Whole text first, then fenced blocks, then balanced spans"""
+    stripped = text.strip()
+    if stripped[:1] in openers:
+        yield stripped
+    for fenced in _FENCE_PATTERN.findall(text):
+        fenced = fenced.strip()
+        if fenced:
+            yield fenced
+            yield from iter_json_spans(fenced, openers)
+    yield from iter_json_spans(text, openers)
+
+class LLMJSONParser:
+    """Extracts and validates JSON from LLM output, tracking parse success per output type"""
+
+    def __init__(self, schemas: Optional[Dict[str, OutputSchema]] = None):
+        self.schemas = dict(SCHEMAS if schemas is None else schemas)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, output_type: str, outcome: str):
+        """Record a parse outcome"""
+        counts = self.stats.setdefault(output_type, {"success": 0, "repaired": 0, "invalid": 0, "no_json": 0})
+        counts[outcome] += 1
+        if PROMETHEUS_AVAILABLE:
+            LLM_JSON_PARSE_TOTAL.labels(output_type=output_type, outcome=outcome).inc()
+
+    def extract(self, text: Optional[str], output_type: str) -> Optional[Any]:
+        """
+        Extract the first JSON value in text that satisfies the output type's schema
+
+        Args:
+            text: Raw model completion
+            output_type: Key into the schema registry (e.g. "niche_idea", "trends")
+
+        Returns:
+            Parsed and schema-conformant JSON, or None if nothing usable was found
+        """
+        schema = self.schemas[output_type]
+        if not text:
+            self._record(output_type, "no_json")
+            return None
+
+        openers = "[{" if schema.kind == "array" else "{"
+        found_json = False
+        seen = set()
+        for candidate in _candidates(text, openers):
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+
+            ok, data, repaired = _loads(candidate)
+            if not ok:
+                continue
+            found_json = True
+            data = schema.coerce(data)
+            if schema.validate(data):
+                self._record(output_type, "repaired" if repaired else "success")
+                return schema.normalize(data)
+
+        if found_json:
+            self._record(output_type, "invalid")
+            logger.warning(f"LLM JSON for {output_type} did not match schema: {text[:100]}...")
+        else:
+            self._record(output_type, "no_json")
+            logger.warning(f"No JSON found in {output_type} response: {text[:100]}...")
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get parse success rates per output type"""
+        summary = {}
+        for output_type, counts in self.stats.items():
+            total = sum(counts.values())
+            parsed = counts["success"] + counts["repaired"]
+            summary[output_type] = {
+                **counts,
+                "total": total,
+                "success_rate": parsed / total * 100 if total else 0.0
+            }
+        return summary
+
+# Global LLM JSON parser instance
+llm_json_parser = LLMJSONParser()
+
+def get_llm_json_parser() -> LLMJSONParser:
+    """Get the global LLM JSON parser instance"""
+    return llm_json_parser
+
+def extract_json(text: Optional[str], output_type: str) -> Optional[Any]:
+    """Extract validated JSON using the global parser"""
+    return llm_json_parser.extract(text, output_type)
@@ -1,3 +1,8 @@
+import time
+
+# Startup is measured from the first import of this module
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -17,13 +22,18 @@ import zipfile
 from datetime import datetime, timedelta
 import json
 import csv
+import importlib
 
-from routers import projects, revenue, ethics, ai, performance, cloud, test, subscription, video, finance, analytics, auth, security, content_scheduler
 from database import init_db, get_db
 from config import settings, constants
 from monitoring import get_monitoring
+from llm_gateway import llm_gateway
+from openai_executor import openai_executor
+from video_jobs import video_render_queue
+from analytics_log import close_analytics_logs
 from middleware.common import CommonMiddleware, LoggingMiddleware, SecurityMiddleware, MetricsMiddleware
 from exceptions import register_exception_handlers
+from registry import services
 
 # Configure structured logging
 structlog.configure(
@@ -424,6 +434,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to start backup scheduler: {e}")
     
+    # Start Ollama health probe for the circuit breaker
+    try:
+        llm_gateway.start_health_probe()
+    except Exception as e:
+        logger.error(f"❌ Failed to start LLM health probe: {e}")
+    
+    # Managers are built lazily; report what startup actually initialized
+    app.state.startup_seconds = time.perf_counter() - _import_started
+    service_stats = services.get_stats()
+    logger.info(
+        f"🚀 Startup complete in {app.state.startup_seconds:.2f}s "
+        f"({service_stats['initialized']}/{service_stats['registered']} services initialized, "
+        f"{service_stats['total_init_seconds']:.2f}s in constructors)"
+    )
+    
     yield
     
     # Shutdown
@@ -435,6 +460,21 @@ async def lifespan(app: FastAPI):
             await backup_scheduler.stop_backup_scheduler()
     except Exception as e:
         logger.error(f"❌ Error stopping backup scheduler: {e}")
+    
+    # Close pooled LLM gateway connections
+    try:
+        await llm_gateway.aclose()
+    except Exception as e:
+        logger.error(f"❌ Error closing LLM gateway: {e}")
+    
+    # Stop OpenAI worker threads
+    openai_executor.shutdown()
+    
+    # Cancel queued renders and stop the render pool
+    video_render_queue.shutdown()
+    
+    # Sync buffered analytics records
+    close_analytics_logs()
 
 # Create FastAPI app with comprehensive documentation
 app = FastAPI(
@@ -660,21 +700,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(security.router, prefix="/api/v1")
-app.include_router(projects.router, prefix="/api/v1")
-app.include_router(revenue.router, prefix="/api/v1")
-app.include_router(ethics.router, prefix="/api/v1")
-app.include_router(ai.router, prefix="/api/v1")
-app.include_router(performance.router, prefix="/api/v1")
-app.include_router(cloud.router, prefix="/api/v1")
-app.include_router(test.router, prefix="/api/v1")
-app.include_router(subscription.router, prefix="/api/v1")
-app.include_router(video.router, prefix="/api/v1")
-app.include_router(finance.router, prefix="/api/v1")
-app.include_router(analytics.router, prefix="/api/v1")
-app.include_router(content_scheduler.router, prefix="/api/v1")
+# Routers in registration order; settings.DISABLED_ROUTERS skips a router and everything it imports
+ROUTER_MODULES = [
+    "auth", "security", "projects", "revenue", "ethics", "ai", "performance", "cloud",
+    "test", "subscription", "video", "finance", "analytics", "content_scheduler"
+]
+
+# Seconds spent importing each router module
+router_import_timings = {}
+
+def include_routers(app: FastAPI):
+    """Import and mount the enabled routers, timing each import"""
+    for name in ROUTER_MODULES:
+        if name in settings.DISABLED_ROUTERS:
+            logger.info(f"Router {name} disabled")
+            continue
+        started = time.perf_counter()
+        module = importlib.import_module(f"routers.{name}")
+        router_import_timings[name] = time.perf_counter() - started
+        app.include_router(module.router, prefix="/api/v1")
+
+include_routers(app)
 
 @app.get("/", 
     response_description="Root endpoint with API information",
@@ -747,6 +793,9 @@ async def metrics(request: Request):
             "total_content": 156,
             "cloud_provider": settings.CLOUD_PROVIDER.value,
             "cloud_enabled": settings.CLOUD_PROVIDER != "none",
+            "startup_seconds": getattr(request.app.state, "startup_seconds", None),
+            "services": services.get_stats(),
+            "router_import_seconds": router_import_timings,
             "prometheus_metrics": prometheus_metrics
         }
         
@@ -374,6 +374,24 @@ class PricingPredictionRequest(BaseModel):
     market_data: Optional[Dict[str, Any]] = Field(None, description="Market data")
     ml_model_version: str = Field("v2.1", description="ML model version")
     include_competitor_analysis: bool = Field(True, description="Include competitor analysis")
+    llm_enrichment: bool = Field(False, description="Add an LLM-written recommendation (price stays the model's)")
+
+class BatchPricingPredictionRequest(BaseModel):
+    """Batch pricing request for a collection"""
+    nft_metadata: List[Dict[str, Any]] = Field(..., min_length=1, max_length=100000, description="NFT metadata per item")
+    market_data: Optional[Dict[str, Any]] = Field(None, description="Market data")
+
+class CollectionRarityRequest(BaseModel):
+    """Items to add to a collection's rarity tables"""
+    collection_name: str = Field(..., min_length=1, description="Collection name")
+    nft_metadata: List[Dict[str, Any]] = Field(..., min_length=1, max_length=100000, description="Metadata with an attributes list per item")
+    ids: Optional[List[str]] = Field(None, description="Item IDs (token or production IDs), same order as nft_metadata")
+    leaderboard_size: int = Field(10, ge=0, le=1000, description="Rarest items to return")
+
+class NFTSaleRequest(BaseModel):
+    """Realized NFT sale, used to train the pricing model"""
+    production_id: str = Field(..., description="Production ID from the minting history")
+    sale_price_eth: float = Field(..., gt=0, description="Sale price in ETH")
 
 class PricingPredictionResponse(BaseModel):
     """Enhanced pricing prediction response with ML insights"""
@@ -759,6 +777,8 @@ class VideoResponse(BaseModel):
     output_path: Optional[str] = Field(None, description="Output file path")
     status: str = Field(..., description="Video generation status")
     created_at: Optional[str] = Field(None, description="Creation timestamp")
+    render_stats: Optional[Dict[str, Any]] = Field(None, description="Frames, redraws, render time and peak memory")
+    job_id: Optional[str] = Field(None, description="Render job ID for /video/jobs/{job_id}")
 
 class NFTRequest(BaseModel):
     """NFT minting request"""
@@ -782,6 +802,18 @@ class NFTResponse(BaseModel):
     metadata: Optional[dict] = Field(None, description="NFT metadata")
     created_at: Optional[str] = Field(None, description="Creation timestamp")
 
+class NFTBatchRequest(BaseModel):
+    """Batch NFT minting request"""
+    nfts: List[NFTRequest] = Field(..., min_length=1, max_length=1000, description="NFTs to mint")
+
+class NFTBatchResponse(BaseModel):
+    """Batch NFT minting response"""
+    nfts: List[NFTResponse] = Field(..., description="Minted NFTs in request order")
+    minted: int = Field(..., description="NFTs minted")
+    failed: int = Field(..., description="NFTs that failed to mint")
+    elapsed_seconds: float = Field(..., description="Batch wall time")
+    mints_per_minute: float = Field(..., description="Minting throughput")
+
 class AGIStateResponse(BaseModel):
     """AGI state response"""
     consciousness_score: float = Field(..., description="Consciousness score")
@@ -30,6 +30,7 @@ from pydantic import BaseModel
 from database import get_db
 from database import User, Subscription as DBSubscription
 from config import settings
+from registry import services
 
 logger = logging.getLogger(__name__)
 
@@ -868,5 +869,9 @@ class MonetizationManager:
                 'test_mode': True
             }
 
-# Global instance
-monetization_manager = MonetizationManager() 
\ No newline at end of file
+# Global instance (built on first use)
+monetization_manager = services.register("monetization_manager", MonetizationManager)
+
+def get_monetization_manager() -> MonetizationManager:
+    """Get the process-wide monetization manager"""
+    return services.get("monetization_manager")
@@ -0,0 +1,322 @@
+"""
+NFT Minter Module for CK Empire Builder
+Pipelined ERC-721 batch minting with locally tracked nonces, async receipts and gas-price retries
+"""
+
+import os
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import partial
+from typing import Dict, Any, List, Optional, Callable
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter, Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. NFT minting metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        NFT_MINT_CONCURRENCY = int(os.getenv("NFT_MINT_CONCURRENCY", "16"))
+        NFT_MINT_MAX_RETRIES = int(os.getenv("NFT_MINT_MAX_RETRIES", "3"))
+        NFT_MINT_RECEIPT_TIMEOUT = float(os.getenv("NFT_MINT_RECEIPT_TIMEOUT", "120"))
+        NFT_MINT_GAS_LIMIT = int(os.getenv("NFT_MINT_GAS_LIMIT", "2000000"))
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    NFT_MINTS_TOTAL = Counter('nft_mints_total', 'NFT mint transactions by outcome', ['status'])
+    NFT_MINTS_PER_MINUTE = Gauge('nft_mints_per_minute', 'Throughput of the most recent mint batch')
+
+# Contract ABI (simplified ERC-721)
+ERC721_MINT_ABI = [
+    {
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "tokenId", "type": "uint256"},
+            {"name": "uri", "type": "string"}
+        ],
+        "name": "mint",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+# Send errors fixed by re-pricing the same nonce
+GAS_PRICE_ERRORS = ("underpriced", "fee too low", "gas price too low", "less than block base fee")
+
+# Minimum bump nodes accept for replacing a pending transaction
+GAS_PRICE_BUMP = 1.125
+
+@dataclass
+class MintRequest:
+    """One token to mint"""
+    token_id: int
+    metadata_uri: str
+    to_address: Optional[str] = None  # defaults to the minting account
+
+@dataclass
+class MintResult:
+    """Outcome of one mint transaction"""
+    token_id: int
+    status: str = "pending"           # pending, sent, minted, failed
+    tx_hash: Optional[str] = None
+    nonce: Optional[int] = None
+    gas_price: Optional[int] = None
+    attempts: int = 0
+    block_number: Optional[int] = None
+    gas_used: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class BatchMinter:
+    """
+    Mints many tokens from one account without a round-trip wait per token
+
+    Transactions are signed and sent back to back with nonces tracked locally,
+    so the node queues them while receipts are collected concurrently.
+    Sends stay in nonce order because nodes (and eth-tester) reject nonce gaps.
+    """
+
+    def __init__(
+        self,
+        web3: Any,
+        private_key: str,
+        contract_address: str,
+        gas_limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        receipt_timeout: Optional[float] = None,
+        poll_interval: float = 0.5
+    ):
+        """
+        Args:
+            web3: Connected Web3 instance
+            private_key: Minting account key
+            contract_address: ERC-721 contract with mint(to, tokenId, uri)
+            gas_limit: Gas per mint transaction
+            max_concurrency: Receipts awaited at once
+            max_retries: Re-pricing attempts per transaction
+            receipt_timeout: Seconds to wait for a receipt before re-pricing
+            poll_interval: Seconds between receipt polls
+        """
+        from eth_account import Account
+        from eth_utils import to_checksum_address
+
+        self.web3 = web3
+        self._private_key = private_key
+        self.account = Account.from_key(private_key)
+        self.contract = web3.eth.contract(address=to_checksum_address(contract_address), abi=ERC721_MINT_ABI)
+        self.gas_limit = gas_limit or settings.NFT_MINT_GAS_LIMIT
+        self.max_concurrency = max_concurrency or settings.NFT_MINT_CONCURRENCY
+        self.max_retries = settings.NFT_MINT_MAX_RETRIES if max_retries is None else max_retries
+        self.receipt_timeout = receipt_timeout or settings.NFT_MINT_RECEIPT_TIMEOUT
+        self.poll_interval = poll_interval
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency + 1, thread_name_prefix="nft-mint")
+        self._send_lock: Optional[asyncio.Lock] = None
+        self._next_nonce: Optional[int] = None
+        self._chain_id: Optional[int] = None
+        self._stats = {"minted": 0, "failed": 0, "retries": 0, "nonce_resyncs": 0, "last_mints_per_minute": 0.0}
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking web3 call on the minter's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def _resync_nonce(self) -> int:
+        """Reload the next nonce from the node's pending pool"""
+        self._next_nonce = await self._run(self.web3.eth.get_transaction_count, self.account.address, "pending")
+        return self._next_nonce
+
+    def _sign(self, request: MintRequest, nonce: int, gas_price: int) -> Any:
+        """Build and sign a mint transaction"""
+        transaction = self.contract.functions.mint(
+            request.to_address or self.account.address,
+            request.token_id,
+            request.metadata_uri
+        ).build_transaction({
+            'from': self.account.address,
+            'nonce': nonce,
+            'gas': self.gas_limit,
+            'gasPrice': gas_price,
+            'chainId': self._chain_id
+        })
+        return self.account.sign_transaction(transaction)
+
+    def _send_raw(self, signed: Any) -> Any:
+        """Submit a signed transaction"""
+        # web3 v7 renamed rawTransaction to raw_transaction
+        raw = getattr(signed, "raw_transaction", None) or signed.rawTransaction
+        return self.web3.eth.send_raw_transaction(raw)
+
+    async def _gas_price(self, floor: int = 0) -> int:
+        """Current network gas price, at least floor"""
+        return max(await self._run(lambda: self.web3.eth.gas_price), floor)
+
+    async def _broadcast(self, request: MintRequest, result: MintResult, nonce: int, floor: int = 0):
+        """
+        Send one transaction at a fixed nonce, re-pricing when the node rejects the gas price
+
+        Raises:
+            Exception: The last send error once retries are exhausted
+        """
+        while True:
+            result.gas_price = await self._gas_price(floor)
+            result.attempts += 1
+            signed = await self._run(self._sign, request, nonce, result.gas_price)
+            try:
+                tx_hash = await self._run(self._send_raw, signed)
+            except Exception as e:
+                message = str(e).lower()
+                if "already known" in message:
+                    tx_hash = signed.hash
+                elif any(error in message for error in GAS_PRICE_ERRORS) and result.attempts <= self.max_retries:
+                    floor = int(result.gas_price * GAS_PRICE_BUMP) + 1
+                    self._stats["retries"] += 1
+                    logger.info(f"Gas price rejected for token {request.token_id}, retrying at {floor} wei")
+                    continue
+                else:
+                    raise
+            result.nonce = nonce
+            result.tx_hash = tx_hash.hex() if hasattr(tx_hash, "hex") else str(tx_hash)
+            result.status = "sent"
+            return
+
+    async def _submit(self, request: MintRequest, result: MintResult):
+        """Send a new transaction on the next local nonce"""
+        async with self._send_lock:
+            if self._next_nonce is None:
+                await self._resync_nonce()
+            while True:
+                try:
+                    await self._broadcast(request, result, self._next_nonce)
+                    self._next_nonce += 1
+                    return
+                except Exception as e:
+                    # Another sender used our nonce: reload it and try once more per retry budget
+                    if "nonce" in str(e).lower() and result.attempts <= self.max_retries:
+                        self._stats["nonce_resyncs"] += 1
+                        await self._resync_nonce()
+                        continue
+                    raise
+
+    def _get_receipt(self, tx_hash: str) -> Optional[Any]:
+        """Receipt for a transaction, or None while it is pending"""
+        try:
+            return self.web3.eth.get_transaction_receipt(tx_hash)
+        except Exception:
+            # TransactionNotFound until the transaction is mined
+            return None
+
+    async def _confirm(self, request: MintRequest, result: MintResult, semaphore: asyncio.Semaphore):
+        """Wait for a sent transaction, replacing it at a higher gas price if it stalls"""
+        tx_hashes = [result.tx_hash]
+        async with semaphore:
+            while True:
+                deadline = time.monotonic() + self.receipt_timeout
+                while time.monotonic() < deadline:
+                    for tx_hash in tx_hashes:
+                        receipt = await self._run(self._get_receipt, tx_hash)
+                        if receipt is not None:
+                            result.tx_hash = tx_hash
+                            result.block_number = receipt["blockNumber"]
+                            result.gas_used = receipt["gasUsed"]
+                            if receipt["status"] == 1:
+                                result.status = "minted"
+                            else:
+                                result.status = "failed"
+                                result.error = "transaction reverted"
+                            return
+                    await asyncio.sleep(self.poll_interval)
+
+                if result.attempts > self.max_retries:
+                    result.status = "failed"
+                    result.error = f"no receipt after {result.attempts} attempts"
+                    return
+
+                # Gas prices moved past ours: speed up with the same nonce
+                self._stats["retries"] += 1
+                logger.info(f"Token {request.token_id} stalled at {result.gas_price} wei, replacing")
+                try:
+                    await self._broadcast(request, result, result.nonce, int(result.gas_price * GAS_PRICE_BUMP) + 1)
+                except Exception as e:
+                    # e.g. "nonce too low": an earlier attempt was mined, keep polling for it
+                    logger.info(f"Replacement for token {request.token_id} not sent: {e}")
+                    continue
+                tx_hashes.append(result.tx_hash)
+
+    async def mint_batch(self, requests: List[MintRequest]) -> Dict[str, Any]:
+        """
+        Mint a batch of tokens
+
+        Args:
+            requests: Tokens to mint
+
+        Returns:
+            Per-token results with minted/failed counts and mints per minute
+        """
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+        if self._chain_id is None:
+            self._chain_id = await self._run(lambda: self.web3.eth.chain_id)
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = [MintResult(token_id=request.token_id) for request in requests]
+        confirmations = []
+
+        for request, result in zip(requests, results):
+            try:
+                await self._submit(request, result)
+            except Exception as e:
+                result.status = "failed"
+                result.error = str(e)
+                logger.error(f"❌ Failed to send mint for token {request.token_id}: {e}")
+                continue
+            confirmations.append(asyncio.create_task(self._confirm(request, result, semaphore)))
+
+        if confirmations:
+            await asyncio.gather(*confirmations)
+
+        elapsed = time.perf_counter() - started
+        minted = sum(1 for result in results if result.status == "minted")
+        failed = len(results) - minted
+        mints_per_minute = minted / elapsed * 60 if elapsed > 0 else 0.0
+
+        self._stats["minted"] += minted
+        self._stats["failed"] += failed
+        self._stats["last_mints_per_minute"] = mints_per_minute
+        if PROMETHEUS_AVAILABLE:
+            NFT_MINTS_TOTAL.labels(status="minted").inc(minted)
+            NFT_MINTS_TOTAL.labels(status="failed").inc(failed)
+            NFT_MINTS_PER_MINUTE.set(mints_per_minute)
+
+        logger.info(f"✅ Minted {minted}/{len(results)} tokens in {elapsed:.1f}s ({mints_per_minute:.0f} mints/minute)")
+        return {
+            "results": results,
+            "minted": minted,
+            "failed": failed,
+            "elapsed_seconds": elapsed,
+            "mints_per_minute": mints_per_minute
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get lifetime minting counters"""
+        return {**self._stats, "address": self.account.address, "next_nonce": self._next_nonce}
+
+    def shutdown(self):
+        """Stop the minter's worker threads"""
+        self._executor.shutdown(wait=False)
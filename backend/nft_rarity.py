@@ -0,0 +1,213 @@
+"""
+NFT Rarity Module for CK Empire Builder
+Collection-level statistical rarity: trait frequency tables, scores and ranks for every item at once
+"""
+
+import time
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Iterable
+
+from optional_imports import module_available, lazy_module
+
+# NumPy (imported on first use)
+NUMPY_AVAILABLE = module_available("numpy")
+if NUMPY_AVAILABLE:
+    np = lazy_module("numpy")
+else:
+    logging.warning("NumPy not available. Collection rarity scoring is disabled. Install with: pip install numpy")
+
+logger = logging.getLogger(__name__)
+
+# Traits derived from rarity itself (or unique per item) would make the score circular or meaningless
+DEFAULT_IGNORED_TRAITS = frozenset({"Rarity", "Rarity Score", "Base Price"})
+
+MISSING = 0  # value code for items without a trait
+
+class CollectionRarity:
+    """
+    Statistical rarity for one collection
+
+    Each item's score is the sum over trait types of 1 / frequency of its value
+    (items lacking a trait share a "missing" value). Traits are stored as an
+    integer code matrix with running counts per value, so adding items updates
+    the frequency tables incrementally and rescoring the whole collection is one
+    gather over the matrix.
+    """
+
+    def __init__(self, ignore_traits: Iterable[str] = DEFAULT_IGNORED_TRAITS, count_missing: bool = True):
+        """
+        Args:
+            ignore_traits: Trait types left out of scoring
+            count_missing: Treat a missing trait as a (rare) value of its own
+        """
+        self.ignore_traits = set(ignore_traits)
+        self.count_missing = count_missing
+
+        self._columns: Dict[str, int] = {}          # trait type -> column
+        self._value_codes: List[Dict[str, int]] = []  # per column: value -> code (1-based)
+        self._counts: List[Any] = []                 # per column: items per code
+        self._codes = np.zeros((1024, 0), dtype=np.int32)
+        self._size = 0
+        self._ids: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        self._cache: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _traits(self, item: Any) -> Dict[str, str]:
+        """trait_type -> value for an NFTMetadata or an OpenSea-style metadata dict"""
+        attributes = item.get("attributes", []) if isinstance(item, dict) else item.attributes
+        return {
+            attr["trait_type"]: str(attr["value"])
+            for attr in attributes or []
+            if "trait_type" in attr and attr["trait_type"] not in self.ignore_traits
+        }
+
+    def _add_column(self, trait_type: str):
+        """Start tracking a trait type; every existing item lacks it"""
+        self._columns[trait_type] = len(self._columns)
+        self._value_codes.append({})
+        self._counts.append(np.array([self._size], dtype=np.int64))
+        self._codes = np.hstack([self._codes, np.zeros((self._codes.shape[0], 1), dtype=np.int32)])
+
+    def add(self, items: Sequence[Any], ids: Optional[Sequence[Any]] = None) -> List[int]:
+        """
+        Add newly minted items and update frequency tables
+
+        Args:
+            items: NFTMetadata objects or dicts with an "attributes" list
+            ids: Optional identifiers (e.g. token or production IDs) for lookups
+
+        Returns:
+            Positions of the added items
+        """
+        started = time.perf_counter()
+        parsed = [self._traits(item) for item in items]
+        m = len(parsed)
+        if m == 0:
+            return []
+
+        for traits in parsed:
+            for trait_type in traits:
+                if trait_type not in self._columns:
+                    self._add_column(trait_type)
+
+        # Grow the code matrix geometrically
+        needed = self._size + m
+        if needed > self._codes.shape[0]:
+            grown = np.zeros((max(needed, self._codes.shape[0] * 2), self._codes.shape[1]), dtype=np.int32)
+            grown[:self._size] = self._codes[:self._size]
+            self._codes = grown
+
+        block = self._codes[self._size:needed]
+        for trait_type, column in self._columns.items():
+            codes = self._value_codes[column]
+            values = [traits.get(trait_type) for traits in parsed]
+            block[:, column] = [MISSING if value is None else codes.setdefault(value, len(codes) + 1) for value in values]
+
+            counts = self._counts[column]
+            if len(counts) < len(codes) + 1:
+                counts = np.concatenate([counts, np.zeros(len(codes) + 1 - len(counts), dtype=np.int64)])
+            counts += np.bincount(block[:, column], minlength=len(counts))
+            self._counts[column] = counts
+
+        positions = list(range(self._size, needed))
+        for position, item_id in zip(positions, ids if ids is not None else positions):
+            self._ids.append(item_id)
+            self._index[item_id] = position
+        self._size = needed
+        self._cache = None
+
+        logger.debug(f"Added {m} items to rarity tables in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return positions
+
+    def _compute(self) -> Dict[str, Any]:
+        """Scores, ranks and percentiles for every item"""
+        if self._cache is not None:
+            return self._cache
+
+        n = self._size
+        if n == 0 or not self._columns:
+            scores = np.zeros(n)
+        else:
+            # One flat lookup table so all columns are scored in a single gather
+            offsets = np.cumsum([0] + [len(counts) for counts in self._counts[:-1]])
+            frequencies = np.concatenate(self._counts).astype(float) / n
+            codes = self._codes[:n]
+            inverse = 1.0 / np.maximum(frequencies[codes + offsets], 1e-12)
+            if not self.count_missing:
+                inverse[codes == MISSING] = 0.0
+            scores = inverse.sum(axis=1)
+
+        # Rank 1 is rarest; identical trait sets share a rank
+        descending = -np.sort(-scores)
+        ranks = np.searchsorted(-descending, -scores, side="left") + 1
+        percentiles = 1.0 - (ranks - 1) / max(n, 1)
+
+        self._cache = {"scores": scores, "ranks": ranks, "percentiles": percentiles}
+        return self._cache
+
+    def scores(self):
+        """Statistical rarity score per item (higher is rarer)"""
+        return self._compute()["scores"]
+
+    def ranks(self):
+        """Rarity rank per item (1 = rarest)"""
+        return self._compute()["ranks"]
+
+    def percentiles(self):
+        """Share of the collection at or below each item's rarity (1.0 = rarest)"""
+        return self._compute()["percentiles"]
+
+    def frequency_table(self) -> Dict[str, Dict[str, int]]:
+        """trait_type -> value -> items with that value ("None" for missing)"""
+        table = {}
+        for trait_type, column in self._columns.items():
+            counts = self._counts[column]
+            values = {value: int(counts[code]) for value, code in self._value_codes[column].items()}
+            if counts[MISSING]:
+                values["None"] = int(counts[MISSING])
+            table[trait_type] = values
+        return table
+
+    def item(self, item_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Rarity breakdown for one item
+
+        Args:
+            item_id: ID passed to add (or position when none was given)
+        """
+        position = self._index.get(item_id)
+        if position is None:
+            return None
+        computed = self._compute()
+        traits = {}
+        for trait_type, column in self._columns.items():
+            code = int(self._codes[position, column])
+            value = next((v for v, c in self._value_codes[column].items() if c == code), None)
+            traits[trait_type] = {"value": value, "frequency": float(self._counts[column][code] / self._size)}
+        return {
+            "id": item_id,
+            "score": float(computed["scores"][position]),
+            "rank": int(computed["ranks"][position]),
+            "percentile": float(computed["percentiles"][position]),
+            "traits": traits
+        }
+
+    def leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Rarest items first"""
+        computed = self._compute()
+        order = np.argsort(computed["ranks"], kind="stable")[:limit]
+        return [
+            {"id": self._ids[i], "score": float(computed["scores"][i]), "rank": int(computed["ranks"][i])}
+            for i in order
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get collection size and trait cardinality"""
+        return {
+            "items": self._size,
+            "trait_types": len(self._columns),
+            "distinct_values": {trait_type: len(self._value_codes[column]) for trait_type, column in self._columns.items()}
+        }
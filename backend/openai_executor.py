@@ -0,0 +1,131 @@
+"""
+OpenAI Executor Module for CK Empire Builder
+Runs blocking OpenAI SDK calls on a bounded thread pool so the event loop stays responsive
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter, Histogram, Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. OpenAI executor metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        OPENAI_MAX_WORKERS = int(os.getenv("OPENAI_MAX_WORKERS", "8"))
+        OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    OPENAI_REQUESTS_TOTAL = Counter('openai_requests_total', 'Total OpenAI SDK calls', ['operation', 'model', 'status'])
+    OPENAI_REQUEST_DURATION = Histogram(
+        'openai_request_duration_seconds',
+        'OpenAI SDK call duration in seconds',
+        ['operation', 'model'],
+        buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+    )
+    OPENAI_REQUESTS_IN_FLIGHT = Gauge('openai_requests_in_flight', 'OpenAI SDK calls currently in flight')
+
+class OpenAIExecutor:
+    """Bounded thread-pool executor for synchronous OpenAI client calls"""
+
+    def __init__(self, max_workers: Optional[int] = None, max_concurrency: Optional[int] = None):
+        self.max_workers = max_workers or settings.OPENAI_MAX_WORKERS
+        self.max_concurrency = max_concurrency or settings.OPENAI_MAX_CONCURRENCY
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._latencies: Dict[str, deque] = {}
+        self._errors: Dict[str, int] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool lazily"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="openai")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limiter for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable, *args, operation: str = "chat", **kwargs) -> Any:
+        """
+        Run a blocking OpenAI call off the event loop
+
+        Args:
+            func: Blocking SDK callable, e.g. client.chat.completions.create
+            operation: Operation label for metrics
+            *args, **kwargs: Passed through to func; a "model" kwarg is also used as a metric label
+
+        Returns:
+            Whatever func returns
+        """
+        model = str(kwargs.get("model") or "unknown")
+        async with self._get_semaphore():
+            if PROMETHEUS_AVAILABLE:
+                OPENAI_REQUESTS_IN_FLIGHT.inc()
+            start_time = time.perf_counter()
+            status = "error"
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_executor(), lambda: func(*args, **kwargs))
+                status = "success"
+                return result
+            finally:
+                duration = time.perf_counter() - start_time
+                self._latencies.setdefault(operation, deque(maxlen=1000)).append(duration)
+                if status != "success":
+                    self._errors[operation] = self._errors.get(operation, 0) + 1
+                if PROMETHEUS_AVAILABLE:
+                    OPENAI_REQUESTS_IN_FLIGHT.dec()
+                    OPENAI_REQUESTS_TOTAL.labels(operation=operation, model=model, status=status).inc()
+                    OPENAI_REQUEST_DURATION.labels(operation=operation, model=model).observe(duration)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-operation latency statistics"""
+        operations = {}
+        for operation, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            operations[operation] = {
+                "requests": len(ordered),
+                "errors": self._errors.get(operation, 0),
+                "average_latency": sum(ordered) / len(ordered) if ordered else 0.0,
+                "p95_latency": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] if ordered else 0.0
+            }
+
+        return {
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "operations": operations
+        }
+
+    def shutdown(self):
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+# Global OpenAI executor instance
+openai_executor = OpenAIExecutor()
+
+def get_openai_executor() -> OpenAIExecutor:
+    """Get the global OpenAI executor instance"""
+    return openai_executor
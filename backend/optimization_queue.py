@@ -0,0 +1,243 @@
+"""
+Optimization Queue Module for CK Empire Builder
+Priority queue of low-performing content drained by rate-limited concurrent workers
+"""
+
+import os
+import time
+import heapq
+import asyncio
+import itertools
+import logging
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter, Histogram, Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. Optimization queue metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        OPTIMIZATION_WORKERS = int(os.getenv("OPTIMIZATION_WORKERS", "3"))
+        OPTIMIZATION_RATE_PER_MINUTE = float(os.getenv("OPTIMIZATION_RATE_PER_MINUTE", "10"))
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    OPTIMIZATION_QUEUE_DEPTH = Gauge('optimization_queue_depth', 'Content items waiting for optimization')
+    OPTIMIZATION_ITEMS_TOTAL = Counter('optimization_items_total', 'Content items optimized by outcome', ['status'])
+    OPTIMIZATION_DURATION = Histogram(
+        'optimization_duration_seconds',
+        'Time to optimize one content item',
+        buckets=[0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0]
+    )
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+class RateLimiter:
+    """Async token bucket; a rate of 0 disables limiting"""
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        if self.rate <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class OptimizationQueue:
+    """Worst-first queue of content below the quality threshold, kept current as scores change"""
+
+    def __init__(self, threshold: float, workers: Optional[int] = None, rate_per_minute: Optional[float] = None):
+        """
+        Args:
+            threshold: Items at or above this quality score leave the queue
+            workers: Concurrent optimization workers
+            rate_per_minute: Max optimizations started per minute across workers (0 = unlimited)
+        """
+        self.threshold = threshold
+        self.workers = workers or settings.OPTIMIZATION_WORKERS
+        self.rate_per_minute = settings.OPTIMIZATION_RATE_PER_MINUTE if rate_per_minute is None else rate_per_minute
+
+        self._heap: List[Tuple[float, float, int, str]] = []
+        self._entries: Dict[str, Tuple[float, float, int, str]] = {}
+        self._items: Dict[str, Any] = {}
+        self._sequence = itertools.count()
+        self._in_flight: set = set()
+        self._requeue: Dict[str, Tuple[float, float]] = {}
+        self._available: Optional[asyncio.Event] = None
+        self._running = False
+
+        self.stats = {"optimized": 0, "failed": 0, "busy_seconds": 0.0}
+        self._started_at: Optional[float] = None
+
+    @staticmethod
+    def priority(quality_score: float, revenue_impact: float) -> Tuple[float, float]:
+        """Lowest quality first; ties go to the item with the most revenue at stake"""
+        return (quality_score, -revenue_impact)
+
+    def upsert(self, item_id: str, item: Any, quality_score: float, revenue_impact: float = 0.0) -> bool:
+        """
+        Add or re-prioritize an item after its performance changed
+
+        Args:
+            item_id: Stable identifier (content_id)
+            item: Object handed to the worker handler
+            quality_score: Current quality score
+            revenue_impact: Revenue affected by the item's quality
+
+        Returns:
+            True if the item is queued
+        """
+        if quality_score >= self.threshold:
+            self.remove(item_id)
+            return False
+
+        self._items[item_id] = item
+        if item_id in self._in_flight:
+            # Re-queued by the worker once the current pass finishes
+            self._requeue[item_id] = (quality_score, revenue_impact)
+            return True
+
+        entry = (*self.priority(quality_score, revenue_impact), next(self._sequence), item_id)
+        # Superseded heap entries are skipped lazily on pop
+        self._entries[item_id] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+        self._update_depth()
+        if self._available is not None:
+            self._available.set()
+        return True
+
+    def remove(self, item_id: str):
+        """Drop an item, e.g. once it passes the threshold"""
+        self._entries.pop(item_id, None)
+        self._items.pop(item_id, None)
+        self._requeue.pop(item_id, None)
+        self._update_depth()
+
+    def pop(self) -> Optional[Tuple[str, Any]]:
+        """Take the worst live item, or None when the queue is empty"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            item_id = entry[3]
+            if self._entries.get(item_id) is not entry:
+                continue
+            del self._entries[item_id]
+            self._update_depth()
+            return item_id, self._items[item_id]
+        return None
+
+    def peek(self, count: int = 5) -> List[Any]:
+        """Worst queued items without removing them"""
+        return [self._items[entry[3]] for entry in heapq.nsmallest(count, self._entries.values())]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._entries or item_id in self._in_flight
+
+    def _update_depth(self):
+        if PROMETHEUS_AVAILABLE:
+            OPTIMIZATION_QUEUE_DEPTH.set(len(self._entries))
+
+    async def run(self, handler: Handler):
+        """
+        Drain the queue with concurrent, rate-limited workers until stop() is called
+
+        Args:
+            handler: Coroutine that optimizes one item; upserting its new score re-queues it
+        """
+        self._available = asyncio.Event()
+        self._running = True
+        self._started_at = time.monotonic()
+        limiter = RateLimiter(self.rate_per_minute, burst=self.workers)
+        logger.info(f"Optimization queue started: {self.workers} workers, {self.rate_per_minute}/min, {len(self)} queued")
+
+        async def worker():
+            while self._running:
+                if not self._entries:
+                    self._available.clear()
+                    await self._available.wait()
+                    continue
+                await limiter.acquire()
+                popped = self.pop()
+                if popped is None:
+                    continue
+                await self._process(handler, *popped)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.workers)))
+        finally:
+            self._running = False
+
+    async def _process(self, handler: Handler, item_id: str, item: Any):
+        """Run the handler for one item and record the outcome"""
+        self._in_flight.add(item_id)
+        started = time.perf_counter()
+        status = "success"
+        try:
+            await handler(item)
+            self.stats["optimized"] += 1
+        except Exception as e:
+            status = "error"
+            self.stats["failed"] += 1
+            logger.error(f"Optimization failed for {item_id}: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats["busy_seconds"] += elapsed
+            self._in_flight.discard(item_id)
+            # Items whose score did not change are dropped until their performance changes again
+            if item_id in self._requeue:
+                self.upsert(item_id, self._items.get(item_id, item), *self._requeue.pop(item_id))
+            if PROMETHEUS_AVAILABLE:
+                OPTIMIZATION_ITEMS_TOTAL.labels(status=status).inc()
+                OPTIMIZATION_DURATION.observe(elapsed)
+
+    def stop(self):
+        """Stop workers after their current item"""
+        self._running = False
+        if self._available is not None:
+            self._available.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and optimization throughput"""
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        done = self.stats["optimized"] + self.stats["failed"]
+        return {
+            "queue_depth": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "workers": self.workers,
+            "rate_per_minute": self.rate_per_minute,
+            "running": self._running,
+            "optimized": self.stats["optimized"],
+            "failed": self.stats["failed"],
+            "throughput_per_minute": done / uptime * 60 if uptime > 0 else 0.0,
+            "average_duration": self.stats["busy_seconds"] / done if done else 0.0
+        }
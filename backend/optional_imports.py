@@ -0,0 +1,66 @@
+"""
+Optional Imports Module for CK Empire Builder
+Cheap availability checks for heavy optional dependencies, which are imported on first use
+"""
+
+import time
+import logging
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent importing each lazily loaded module
+import_timings: Dict[str, float] = {}
+
+def module_available(*names: str) -> bool:
+    """
+    Check that modules are installed without importing them
+
+    Args:
+        *names: Module names (e.g. "cv2", "eth_account")
+
+    Returns:
+        True if every module can be found
+    """
+    for name in names:
+        try:
+            if importlib.util.find_spec(name) is None:
+                return False
+        except (ImportError, ValueError):
+            return False
+    return True
+
+class LazyModule(ModuleType):
+    """Stand-in that imports the real module on first attribute access"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self.__name__)
+            import_timings[self.__name__] = time.perf_counter() - started
+            logger.info(f"Imported {self.__name__} on first use in {import_timings[self.__name__] * 1000:.0f}ms")
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any):
+        # e.g. stripe.api_key = ... must reach the real module
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+def lazy_module(name: str) -> LazyModule:
+    """Module proxy that defers `import name` until it is used"""
+    return LazyModule(name)
@@ -0,0 +1,272 @@
+"""
+Performance Store Module for CK Empire Builder
+Append-only, fixed-schema content performance log indexed by content_id
+"""
+
+import os
+import csv
+import json
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterator, Callable
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        PERFORMANCE_STORE_PATH = "data/content_performance.jsonl"
+        PERFORMANCE_STORE_COMPACT_RATIO = 3.0
+
+logger = logging.getLogger(__name__)
+
+# Fixed record schema: field -> converter applied on write
+PERFORMANCE_SCHEMA = {
+    "content_id": str,
+    "title": str,
+    "content_type": str,
+    "channel": str,
+    "views": int,
+    "engagement_rate": float,
+    "revenue": float,
+    "viral_potential": float,
+    "quality_score": float,
+    "improvement_suggestions": list,
+    "source": str,
+    "created_at": str,
+    "updated_at": str,
+}
+
+LEGACY_CSV_PATH = "data/content_performance_analytics.csv"
+
+def _coerce(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep schema fields only, converted to their schema types"""
+    clean = {}
+    for field, kind in PERFORMANCE_SCHEMA.items():
+        if field not in record or record[field] is None:
+            continue
+        value = record[field]
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif kind is list:
+            value = list(value) if isinstance(value, (list, tuple)) else [v for v in str(value).split("|") if v]
+        elif kind is int:
+            value = int(float(value))
+        else:
+            value = kind(value)
+        clean[field] = value
+    return clean
+
+class PerformanceStore:
+    """Append-only JSONL log of full ("put") and delta ("update") records with an in-memory content_id index"""
+
+    def __init__(self, path: Optional[str] = None, compact_ratio: Optional[float] = None, legacy_csv_path: Optional[str] = LEGACY_CSV_PATH):
+        """
+        Args:
+            path: Log file path
+            compact_ratio: Compact on load when log lines exceed this multiple of live records
+            legacy_csv_path: CSV imported once when the log does not exist yet
+        """
+        self.path = Path(path or settings.PERFORMANCE_STORE_PATH)
+        self.compact_ratio = compact_ratio or settings.PERFORMANCE_STORE_COMPACT_RATIO
+        self.legacy_csv_path = Path(legacy_csv_path) if legacy_csv_path else None
+
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._log_lines = 0
+        self._writer = None
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def _ensure_loaded(self):
+        """Replay the log into the index on first use"""
+        if self._index is not None:
+            return
+
+        with self._lock:
+            if self._index is not None:
+                return
+            self._index = {}
+            self._log_lines = 0
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn write from a crash; later records still apply
+                            continue
+                        self._log_lines += 1
+                        self._apply(entry)
+                if self._index and self._log_lines > len(self._index) * self.compact_ratio:
+                    self.compact()
+            elif self.legacy_csv_path and self.legacy_csv_path.exists():
+                self._import_legacy_csv()
+
+    def _apply(self, entry: Dict[str, Any]):
+        """Apply one log entry to the index"""
+        content_id = entry.get("content_id")
+        if not content_id:
+            return
+        op = entry.pop("op", "put")
+        if op == "put" or content_id not in self._index:
+            self._index[content_id] = entry
+        else:
+            self._index[content_id].update(entry)
+
+    def subscribe(self, listener: Callable[[Dict[str, Any]], None]):
+        """Call listener with a copy of each record after it is stored or updated"""
+        self._listeners.append(listener)
+
+    def _notify(self, record: Dict[str, Any]):
+        """Tell listeners about a changed record"""
+        for listener in self._listeners:
+            try:
+                listener(dict(record))
+            except Exception as e:
+                logger.error(f"Performance store listener failed: {e}")
+
+    def _append(self, entry: Dict[str, Any]):
+        """Write one log entry"""
+        if self._writer is None:
+            self._writer = open(self.path, 'a', encoding='utf-8')
+        self._writer.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._writer.flush()
+        self._log_lines += 1
+
+    def _import_legacy_csv(self):
+        """One-time import of the old mixed-schema CSV"""
+        imported = 0
+        with open(self.legacy_csv_path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                record = dict(row)
+                record["views"] = row.get("views") or row.get("mock_views") or 0
+                record["engagement_rate"] = row.get("engagement_rate") or row.get("mock_engagement_rate") or 0.0
+                record["revenue"] = row.get("revenue_generated") or row.get("mock_revenue") or 0.0
+                record["source"] = "legacy_csv"
+                try:
+                    self.put(record)
+                    imported += 1
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Skipping legacy performance row {row.get('content_id')}: {e}")
+        logger.info(f"Imported {imported} legacy performance records from {self.legacy_csv_path}")
+
+    def put(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a full performance record
+
+        Args:
+            record: Fields from PERFORMANCE_SCHEMA; content_id is required
+
+        Returns:
+            The stored record
+        """
+        self._ensure_loaded()
+        clean = _coerce(record)
+        if not clean.get("content_id"):
+            raise ValueError("content_id is required")
+
+        now = datetime.utcnow().isoformat()
+        clean.setdefault("created_at", now)
+        clean.setdefault("updated_at", now)
+        with self._lock:
+            self._append({"op": "put", **clean})
+            self._index[clean["content_id"]] = clean
+        self._notify(clean)
+        return clean
+
+    def update(self, content_id: str, **changes) -> Optional[Dict[str, Any]]:
+        """
+        Record only the fields that changed
+
+        Args:
+            content_id: Record to update
+            **changes: New field values
+
+        Returns:
+            The merged record, or None if the content_id is unknown
+        """
+        self._ensure_loaded()
+        with self._lock:
+            current = self._index.get(content_id)
+            if current is None:
+                return None
+
+            delta = {k: v for k, v in _coerce(changes).items() if current.get(k) != v and k != "content_id"}
+            if not delta:
+                return current
+            delta["updated_at"] = datetime.utcnow().isoformat()
+            self._append({"op": "update", "content_id": content_id, **delta})
+            current.update(delta)
+        self._notify(current)
+        return current
+
+    def get(self, content_id: str) -> Optional[Dict[str, Any]]:
+        """Current state of one record"""
+        self._ensure_loaded()
+        record = self._index.get(content_id)
+        return dict(record) if record else None
+
+    def records(self, source: Optional[str] = None, channel: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Current state of every record, optionally filtered"""
+        self._ensure_loaded()
+        for record in list(self._index.values()):
+            if source is not None and record.get("source") != source:
+                continue
+            if channel is not None and record.get("channel", "").lower() != channel.lower():
+                continue
+            yield dict(record)
+
+    def compact(self):
+        """Rewrite the log as one put per live record and swap it in atomically"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for record in self._index.values():
+                    f.write(json.dumps({"op": "put", **record}, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            logger.info(f"Compacted performance log from {self._log_lines} to {len(self._index)} lines")
+            self._log_lines = len(self._index)
+
+    def flush(self):
+        """Force written records to disk"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+                os.fsync(self._writer.fileno())
+
+    def close(self):
+        """Close the log file"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._index)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store size"""
+        self._ensure_loaded()
+        return {
+            "records": len(self._index),
+            "log_lines": self._log_lines,
+            "path": str(self.path)
+        }
+
+# Global performance store instance
+performance_store = PerformanceStore()
+
+def get_performance_store() -> PerformanceStore:
+    """Get the global performance store instance"""
+    return performance_store
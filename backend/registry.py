@@ -0,0 +1,192 @@
+"""
+Service Registry Module for CK Empire Builder
+Process-wide, lazily constructed manager singletons with startup timing
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Callable, Optional
+
+# Prometheus metrics
+try:
+    from prometheus_client import Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. Service startup metrics will be limited.")
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    SERVICE_INIT_SECONDS = Gauge('service_init_seconds', 'Time spent constructing a process-wide service', ['service'])
+
+class ServiceRegistry:
+    """Builds each registered service once, on first use, and records how long it took"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._timings: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._created_at = time.perf_counter()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> "LazyService":
+        """
+        Register a service factory
+
+        Args:
+            name: Registry key (e.g. "ai_module")
+            factory: Zero-argument callable that builds the service
+
+        Returns:
+            Proxy that builds the service on first attribute access
+        """
+        with self._lock:
+            self._factories[name] = factory
+        return LazyService(self, name)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a service, building it on first use
+
+        Args:
+            name: Registry key
+
+        Returns:
+            The shared service instance
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            # Factories may resolve other services, hence the re-entrant lock
+            if name in self._instances:
+                return self._instances[name]
+            if name not in self._factories:
+                raise KeyError(f"Service not registered: {name}")
+
+            started = time.perf_counter()
+            instance = self._factories[name]()
+            elapsed = time.perf_counter() - started
+
+            self._instances[name] = instance
+            self._timings[name] = {
+                "init_seconds": elapsed,
+                "since_registry_created": started - self._created_at
+            }
+            if PROMETHEUS_AVAILABLE:
+                SERVICE_INIT_SECONDS.labels(service=name).set(elapsed)
+            logger.info(f"Initialized service {name} in {elapsed * 1000:.1f}ms")
+            return instance
+
+    def is_initialized(self, name: str) -> bool:
+        """Whether a service has been built"""
+        return name in self._instances
+
+    def override(self, name: str, instance: Any):
+        """Replace a service instance (tests and embedding)"""
+        with self._lock:
+            self._instances[name] = instance
+
+    def reset(self, name: Optional[str] = None):
+        """Forget built instances so the next use rebuilds them"""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+                self._timings.clear()
+            else:
+                self._instances.pop(name, None)
+                self._timings.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get initialization state and timings per service"""
+        services = {
+            name: {"initialized": name in self._instances, **self._timings.get(name, {})}
+            for name in self._factories
+        }
+        return {
+            "services": services,
+            "initialized": len(self._instances),
+            "registered": len(self._factories),
+            "total_init_seconds": sum(t["init_seconds"] for t in self._timings.values())
+        }
+
+class LazyService:
+    """
+    Module-level stand-in that forwards attribute access to the registry's instance
+
+    __class__ reports the service's class, so isinstance() checks pass, and the
+    common container, truthiness, call and comparison dunders are forwarded.
+    Either resolves (builds) the service. type(proxy) is still LazyService.
+    """
+
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry: ServiceRegistry, name: str):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_name", name)
+
+    def _resolve(self) -> Any:
+        return self._registry.get(self._name)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+    def __setattr__(self, attr: str, value: Any):
+        setattr(self._resolve(), attr, value)
+
+    def __delattr__(self, attr: str):
+        delattr(self._resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self._registry.is_initialized(self._name) else "lazy"
+        return f"<LazyService {self._name} ({state})>"
+
+    @property
+    def __class__(self):
+        return type(self._resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._resolve()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._resolve()[key]
+
+    def __setitem__(self, key: Any, value: Any):
+        self._resolve()[key] = value
+
+    def __delitem__(self, key: Any):
+        del self._resolve()[key]
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._resolve() == (other._resolve() if isinstance(other, LazyService) else other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(self._resolve())
+
+    def __str__(self) -> str:
+        return str(self._resolve())
+
+# Global service registry instance
+services = ServiceRegistry()
+
+def get_service(name: str) -> Any:
+    """Get a service from the global registry"""
+    return services.get(name)
@@ -3,7 +3,7 @@ AI Router for CK Empire Builder
 Handles content generation, video production, NFT automation, AGI evolution, and empire strategies
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
 from sqlalchemy.orm import Session
 import logging
 from datetime import datetime
@@ -13,7 +13,7 @@ import asyncio
 from database import get_db
 from models import (
     ContentIdeaRequest, ContentIdeaResponse, VideoRequest, VideoResponse,
-    NFTRequest, NFTResponse, AGIStateResponse, DecisionRequest, DecisionResponse,
+    NFTRequest, NFTResponse, NFTBatchRequest, NFTBatchResponse, AGIStateResponse, DecisionRequest, DecisionResponse,
     SuccessResponse, EmpireStrategyRequest, EmpireStrategyResponse, FinancialMetricsResponse,
     FineTuningRequest, FineTuningResponse, FineTuningStatusResponse
 )
@@ -35,6 +35,9 @@ except ImportError:
     FineTuningStatusResponse = None
 
 from ai import ai_module, ContentType, VideoStyle, NFTStatus, StrategyType
+from llm_gateway import request_deadline
+from video_jobs import video_render_queue
+from strategy_evaluation import RUN_ID_PATTERN
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -191,11 +194,17 @@ async def start_fine_tuning(
         raise HTTPException(status_code=500, detail=f"Failed to start fine-tuning: {str(e)}")
 
 @router.post("/ai/fine-tuning/test-accuracy", response_model=Dict[str, Any])
-async def test_fine_tuning_accuracy():
+async def test_fine_tuning_accuracy(
+    concurrency: Optional[int] = None,
+    run_id: Optional[str] = Query(None, pattern=RUN_ID_PATTERN, description="Checkpointed run to resume")
+):
     """
     Test fine-tuning accuracy with mock dataset
     
     Returns accuracy metrics and test results
+    
+    - **concurrency**: Max evaluation calls in flight
+    - **run_id**: Resume an interrupted evaluation from its checkpoint
     """
     try:
         logger.info("Testing fine-tuning accuracy")
@@ -215,7 +224,7 @@ async def test_fine_tuning_accuracy():
         ]
         
         # Test accuracy
-        accuracy_results = await ai_module.test_fine_tuning_accuracy(test_inputs)
+        accuracy_results = await ai_module.test_fine_tuning_accuracy(test_inputs, concurrency=concurrency, run_id=run_id)
         
         logger.info(f"✅ Fine-tuning accuracy test completed: {accuracy_results['accuracy']:.2%}")
         return accuracy_results
@@ -271,6 +280,7 @@ async def get_strategy_types():
 @router.post("/ai/ideas", response_model=List[ContentIdeaResponse])
 async def generate_content_ideas(
     request: ContentIdeaRequest,
+    latency_budget: Optional[float] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -279,16 +289,18 @@ async def generate_content_ideas(
     - **topic**: Topic for content generation
     - **count**: Number of ideas to generate (default: 5)
     - **content_type**: Specific content type (optional)
+    - **latency_budget**: Seconds to wait for the model before serving template ideas
     """
     try:
         logger.info(f"Generating {request.count} content ideas for topic: {request.topic}")
         
-        # Generate ideas using AI module
-        ideas = await ai_module.generate_viral_content_ideas(
-            topic=request.topic,
-            count=request.count,
-            content_type=request.content_type
-        )
+        # Generate ideas using AI module, bounded by the request latency budget
+        with request_deadline(latency_budget):
+            ideas = await ai_module.generate_viral_content_ideas(
+                topic=request.topic,
+                count=request.count,
+                content_type=request.content_type
+            )
         
         # Convert to response format
         responses = []
@@ -325,6 +337,8 @@ async def generate_video(
     - **script**: Video script/content
     - **style**: Video style (zack_snyder, cinematic, documentary, viral, corporate)
     - **duration**: Video duration in seconds
+    
+    Returns as soon as the render is queued; poll /video/jobs/{job_id} for progress.
     """
     try:
         logger.info(f"Generating video with style: {request.style}")
@@ -351,16 +365,48 @@ async def generate_video(
             resolution=video_project.resolution,
             output_path=video_project.output_path,
             status=video_project.status,
-            created_at=video_project.created_at
+            created_at=video_project.created_at,
+            render_stats=video_project.render_stats,
+            job_id=video_project.job_id
         )
         
-        logger.info(f"✅ Generated video: {video_project.output_path}")
+        logger.info(f"✅ Queued video {video_project.job_id}: {video_project.output_path}")
         return response
         
     except Exception as e:
         logger.error(f"❌ Failed to generate video: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to generate video: {str(e)}")
 
+@router.get("/video/jobs", response_model=List[Dict[str, Any]])
+async def list_video_jobs(limit: int = 50):
+    """
+    List recent render jobs, newest first
+    """
+    return [job.to_dict() for job in video_render_queue.list_jobs(limit)]
+
+@router.get("/video/jobs/{job_id}", response_model=Dict[str, Any])
+async def get_video_job(job_id: str):
+    """
+    Get a render job's status and progress (frames written / total frames)
+    """
+    job = video_render_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Render job not found: {job_id}")
+    return job.to_dict()
+
+@router.delete("/video/jobs/{job_id}", response_model=Dict[str, Any])
+async def cancel_video_job(job_id: str):
+    """
+    Cancel a queued or running render job
+    """
+    job = video_render_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Render job not found: {job_id}")
+    if not video_render_queue.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"Render job already {job.status}")
+    logger.info(f"🛑 Cancellation requested for render {job_id}")
+    return video_render_queue.get(job_id).to_dict()
+
 @router.post("/nft/mint", response_model=NFTResponse)
 async def mint_nft(
     request: NFTRequest,
@@ -412,6 +458,51 @@ async def mint_nft(
         logger.error(f"❌ Failed to mint NFT: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to mint NFT: {str(e)}")
 
+@router.post("/nft/mint-batch", response_model=NFTBatchResponse)
+async def mint_nft_batch(
+    request: NFTBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Create and mint a batch of NFTs with pipelined transactions
+    
+    - **nfts**: NFTs to mint (same fields as /nft/mint)
+    """
+    try:
+        logger.info(f"Minting batch of {len(request.nfts)} NFTs")
+        
+        batch = await ai_module.create_nft_batch([nft.dict() for nft in request.nfts])
+        
+        response = NFTBatchResponse(
+            nfts=[
+                NFTResponse(
+                    name=nft_project.name,
+                    description=nft_project.description,
+                    image_path=nft_project.image_path,
+                    price_eth=nft_project.price_eth,
+                    price_usd=nft_project.price_usd,
+                    collection=nft_project.collection,
+                    status=nft_project.status.value,
+                    token_id=nft_project.token_id,
+                    transaction_hash=nft_project.transaction_hash,
+                    metadata=nft_project.metadata,
+                    created_at=nft_project.created_at
+                )
+                for nft_project in batch["projects"]
+            ],
+            minted=batch["minted"],
+            failed=batch["failed"],
+            elapsed_seconds=batch["elapsed_seconds"],
+            mints_per_minute=batch["mints_per_minute"]
+        )
+        
+        logger.info(f"✅ Minted {batch['minted']}/{len(request.nfts)} NFTs ({batch['mints_per_minute']:.0f} mints/minute)")
+        return response
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to mint NFT batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to mint NFT batch: {str(e)}")
+
 @router.get("/ai/agi-state", response_model=AGIStateResponse)
 async def get_agi_state():
     """
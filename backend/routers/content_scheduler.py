@@ -5,11 +5,13 @@ Provides API endpoints for managing automated content generation
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import asyncio
 import logging
 
 from content_scheduler import content_scheduler, start_content_scheduler, stop_content_scheduler
+from llm_gateway import llm_gateway, request_deadline
+from llm_json import llm_json_parser
 
 logger = logging.getLogger(__name__)
 
@@ -56,10 +58,15 @@ async def get_scheduler_status():
         raise HTTPException(status_code=500, detail=f"Failed to get scheduler status: {str(e)}")
 
 @router.post("/generate-content")
-async def manual_generate_content():
-    """Manually trigger content generation"""
+async def manual_generate_content(latency_budget: Optional[float] = None):
+    """Manually trigger content generation
+    
+    LLM calls share the request latency budget; once it is spent, template
+    fallbacks are served while the model answers finish warming the cache.
+    """
     try:
-        content = await content_scheduler.manual_generate_content()
+        with request_deadline(latency_budget):
+            content = await content_scheduler.manual_generate_content()
         
         # Convert content to serializable format
         content_data = []
@@ -162,31 +169,31 @@ async def get_supported_channels():
 async def test_ollama_connection():
     """Test Ollama connection"""
     try:
-        import httpx
+        client = llm_gateway.get_client()
+        response = await client.post(
+            "/api/generate",
+            json={
+                "model": "llama2",
+                "prompt": "Hello, this is a test.",
+                "stream": False
+            },
+            timeout=10.0
+        )
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{content_scheduler.ollama_url}/api/generate",
-                json={
-                    "model": "llama2",
-                    "prompt": "Hello, this is a test.",
-                    "stream": False
-                },
-                timeout=10.0
-            )
-            
-            if response.status_code == 200:
-                return {
-                    "status": "success",
-                    "message": "Ollama connection successful",
-                    "response": response.json()
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": f"Ollama connection failed: {response.status_code}",
-                    "response": response.text
-                }
+        if response.status_code == 200:
+            return {
+                "status": "success",
+                "message": "Ollama connection successful",
+                "response": response.json(),
+                "gateway": llm_gateway.get_stats(),
+                "json_parse": llm_json_parser.get_stats()
+            }
+        else:
+            return {
+                "status": "error",
+                "message": f"Ollama connection failed: {response.status_code}",
+                "response": response.text
+            }
     except Exception as e:
         logger.error(f"Ollama test failed: {e}")
         return {
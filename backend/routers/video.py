@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from typing import Dict, Any, Optional
+import time
 import logging
 from datetime import datetime
 
@@ -12,6 +13,9 @@ try:
         NFTGenerationResponse,
         PricingPredictionRequest,
         PricingPredictionResponse,
+        BatchPricingPredictionRequest,
+        NFTSaleRequest,
+        CollectionRarityRequest,
         VideoStyleResponse,
         NFTMetadataResponse,
         AIMintingConfigResponse,
@@ -26,6 +30,9 @@ except ImportError:
     NFTGenerationResponse = None
     PricingPredictionRequest = None
     PricingPredictionResponse = None
+    BatchPricingPredictionRequest = None
+    NFTSaleRequest = None
+    CollectionRarityRequest = None
     VideoStyleResponse = None
     NFTMetadataResponse = None
     AIMintingConfigResponse = None
@@ -48,7 +55,7 @@ async def generate_nft_with_ai(request: VideoProductionRequest):
         )
         
         # Step 2: Create enhanced video metadata
-        video_metadata = await video_manager.create_enhanced_video_metadata(video_prompt, request.style)
+        video_metadata = await video_manager.create_enhanced_video_metadata(video_prompt, request.style, request.duration)
         
         # Step 3: Generate AI-optimized NFT metadata
         nft_metadata = await video_manager.generate_optimized_nft_metadata(video_metadata)
@@ -164,7 +171,8 @@ async def predict_enhanced_nft_pricing(request: PricingPredictionRequest):
         # Predict enhanced pricing
         pricing_prediction = await video_manager.predict_enhanced_nft_pricing(
             nft_metadata=nft_obj,
-            market_data=request.market_data
+            market_data=request.market_data,
+            enrich=request.llm_enrichment
         )
         
         return PricingPredictionResponse(
@@ -184,6 +192,109 @@ async def predict_enhanced_nft_pricing(request: PricingPredictionRequest):
         logging.error(f"Error predicting enhanced NFT pricing: {e}")
         raise HTTPException(status_code=500, detail=f"Enhanced pricing prediction failed: {str(e)}")
 
+@router.post("/nft/pricing/batch")
+async def predict_nft_pricing_batch(request: BatchPricingPredictionRequest):
+    """Price a whole collection in one vectorized pass of the local model"""
+    try:
+        from ..video import NFTMetadata
+        started = time.perf_counter()
+        nft_objs = [
+            NFTMetadata(
+                name=item.get("name", "Unknown NFT"),
+                description=item.get("description", ""),
+                image_url=item.get("image_url", ""),
+                animation_url=item.get("animation_url"),
+                attributes=item.get("attributes", []),
+                external_url=item.get("external_url", ""),
+                seller_fee_basis_points=item.get("seller_fee_basis_points", 500),
+                collection=item.get("collection", {}),
+                ai_generated=item.get("ai_generated", True),
+                minting_timestamp=datetime.now(),
+                blockchain_metadata=item.get("blockchain_metadata", {}),
+                rarity_score=item.get("rarity_score", 0.5),
+                market_analysis=item.get("market_analysis", {})
+            )
+            for item in request.nft_metadata
+        ]
+        
+        predictions = video_manager.predict_nft_pricing_many(nft_objs, request.market_data)
+        
+        return {
+            "predictions": [
+                {
+                    "name": nft_obj.name,
+                    "predicted_price": prediction.predicted_price,
+                    "confidence": prediction.confidence,
+                    "factors": prediction.factors
+                }
+                for nft_obj, prediction in zip(nft_objs, predictions)
+            ],
+            "count": len(predictions),
+            "model": video_manager.pricing_model.get_stats(),
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            "status": "completed"
+        }
+        
+    except Exception as e:
+        logging.error(f"Error predicting batch NFT pricing: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch pricing prediction failed: {str(e)}")
+
+@router.post("/nft/sale")
+async def record_nft_sale(request: NFTSaleRequest):
+    """Record a realized sale price for pricing model training"""
+    if not video_manager.record_nft_sale(request.production_id, request.sale_price_eth):
+        raise HTTPException(status_code=404, detail=f"Production not found: {request.production_id}")
+    return {"production_id": request.production_id, "sale_price_eth": request.sale_price_eth, "status": "recorded"}
+
+@router.post("/nft/rarity")
+async def add_collection_rarity(request: CollectionRarityRequest):
+    """Add items to a collection and rescore rarity for the whole collection"""
+    if request.ids is not None and len(request.ids) != len(request.nft_metadata):
+        raise HTTPException(status_code=422, detail="ids must match nft_metadata in length")
+    try:
+        started = time.perf_counter()
+        engine = video_manager.add_to_collection_rarity(request.collection_name, request.nft_metadata, request.ids)
+        if engine is None:
+            raise HTTPException(status_code=503, detail="Collection rarity requires NumPy")
+        leaderboard = engine.leaderboard(request.leaderboard_size)
+        
+        return {
+            "collection_name": request.collection_name,
+            "added": len(request.nft_metadata),
+            "stats": engine.get_stats(),
+            "leaderboard": leaderboard,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            "status": "completed"
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Error scoring collection rarity: {e}")
+        raise HTTPException(status_code=500, detail=f"Collection rarity scoring failed: {str(e)}")
+
+@router.get("/nft/rarity/{collection_name}")
+async def get_collection_rarity(collection_name: str, limit: int = 10):
+    """Trait frequency tables and rarest items of a collection"""
+    engine = video_manager.collection_rarity.get(collection_name)
+    if engine is None:
+        raise HTTPException(status_code=404, detail=f"Collection not found: {collection_name}")
+    return {
+        "collection_name": collection_name,
+        "stats": engine.get_stats(),
+        "trait_frequencies": engine.frequency_table(),
+        "leaderboard": engine.leaderboard(limit)
+    }
+
+@router.get("/nft/rarity/{collection_name}/{item_id}")
+async def get_item_rarity(collection_name: str, item_id: str):
+    """Rarity score, rank and per-trait frequencies of one item"""
+    engine = video_manager.collection_rarity.get(collection_name)
+    item = engine.item(item_id) if engine else None
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Item not found: {collection_name}/{item_id}")
+    return item
+
 @router.get("/styles", response_model=VideoStyleResponse)
 async def get_enhanced_video_styles():
     """Get enhanced video styles with AI minting capabilities"""
@@ -0,0 +1,256 @@
+"""
+Singleflight Module for CK Empire Builder
+Coalesces concurrent identical calls in-process and across workers via Redis
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import hashlib
+import logging
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
+
+# Redis for cross-worker coalescing
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    logging.warning("redis.asyncio not available. Singleflight will coalesce in-process only. Install with: pip install redis")
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. Singleflight metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    SINGLEFLIGHT_CALLS = Counter(
+        'singleflight_calls_total',
+        'Singleflight calls by outcome (leader, shared, cached, redis_cached, redis_shared)',
+        ['group', 'outcome']
+    )
+
+def make_flight_key(*parts: Any) -> str:
+    """Hash call arguments into a compact singleflight key"""
+    raw = "\x1f".join(str(part) for part in parts)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class SingleFlight:
+    """Share one in-flight call and its short-lived result between identical callers"""
+
+    def __init__(
+        self,
+        group: str,
+        result_ttl: float = 30.0,
+        redis_url: Optional[str] = None,
+        use_redis: bool = True,
+        lock_timeout: float = 60.0,
+        poll_interval: float = 0.1,
+        max_results: int = 1000,
+        redis_backoff: float = 1.0,
+        redis_max_backoff: float = 60.0
+    ):
+        self.group = group
+        self.result_ttl = result_ttl
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.use_redis = use_redis and REDIS_AVAILABLE
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.max_results = max_results
+        self.redis_backoff = redis_backoff
+        self.redis_max_backoff = redis_max_backoff
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._results: Dict[str, Tuple[float, Any]] = {}
+        self._redis = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Redis is skipped until this monotonic time after a failure
+        self._redis_retry_at = 0.0
+        self._redis_delay = redis_backoff
+        self.redis_errors = 0
+        self.stats = {"leader": 0, "shared": 0, "cached": 0, "redis_cached": 0, "redis_shared": 0}
+
+    def _record(self, outcome: str):
+        """Record a call outcome"""
+        self.stats[outcome] += 1
+        if PROMETHEUS_AVAILABLE:
+            SINGLEFLIGHT_CALLS.labels(group=self.group, outcome=outcome).inc()
+
+    def _get_redis(self):
+        """Get the Redis client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            self._redis = aioredis.from_url(self.redis_url, socket_connect_timeout=1, socket_timeout=2)
+            self._redis_loop = loop
+        return self._redis
+
+    def _redis_failed(self, action: str, error: Exception):
+        """Back off from Redis exponentially after an error"""
+        self.redis_errors += 1
+        self._redis_retry_at = time.monotonic() + self._redis_delay
+        logger.warning(f"Singleflight Redis {action} failed for {self.group}, retrying Redis in {self._redis_delay:.0f}s: {error}")
+        self._redis_delay = min(self._redis_delay * 2, self.redis_max_backoff)
+
+    def _redis_ok(self):
+        """Reset the backoff once Redis answers again"""
+        self._redis_delay = self.redis_backoff
+
+    def _get_cached(self, key: str) -> Tuple[bool, Any]:
+        """Get an unexpired local result"""
+        entry = self._results.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] < time.monotonic():
+            self._results.pop(key, None)
+            return False, None
+        return True, entry[1]
+
+    def _store(self, key: str, value: Any):
+        """Store a local result, pruning expired entries when full"""
+        if len(self._results) >= self.max_results:
+            now = time.monotonic()
+            for stale_key in [k for k, (expires, _) in self._results.items() if expires < now]:
+                self._results.pop(stale_key, None)
+            while len(self._results) >= self.max_results:
+                self._results.pop(next(iter(self._results)))
+        self._results[key] = (time.monotonic() + self.result_ttl, value)
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        encode: Optional[Callable[[Any], str]] = None,
+        decode: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """
+        Run func once per key across concurrent callers
+
+        Args:
+            key: Identity of the call
+            func: Coroutine factory that produces the result
+            encode: Serializer for sharing results via Redis (Redis is skipped without it)
+            decode: Deserializer matching encode
+
+        Returns:
+            The shared result
+        """
+        found, value = self._get_cached(key)
+        if found:
+            self._record("cached")
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            self._record("shared")
+            return await asyncio.shield(task)
+
+        self._record("leader")
+        task = asyncio.ensure_future(self._execute(key, func, encode, decode))
+        self._inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._inflight.get(key) is task:
+                self._inflight.pop(key, None)
+
+    async def _execute(self, key: str, func: Callable[[], Awaitable[Any]], encode, decode) -> Any:
+        """Run the call, coordinating with other workers when Redis is configured"""
+        if self.use_redis and encode and decode and time.monotonic() >= self._redis_retry_at:
+            try:
+                value = await self._execute_distributed(key, func, encode, decode)
+            except _LeaderCallError as e:
+                raise e.original
+            except Exception as e:
+                # func has not run yet, so running it locally does not duplicate the call
+                self._redis_failed("coordination", e)
+                value = await func()
+        else:
+            value = await func()
+
+        self._store(key, value)
+        return value
+
+    async def _execute_distributed(self, key: str, func: Callable[[], Awaitable[Any]], encode, decode) -> Any:
+        """Elect one worker per key via a Redis lock and share its encoded result"""
+        client = self._get_redis()
+        result_key = f"singleflight:{self.group}:result:{key}"
+        lock_key = f"singleflight:{self.group}:lock:{key}"
+
+        cached = await client.get(result_key)
+        self._redis_ok()
+        if cached is not None:
+            self._record("redis_cached")
+            return decode(cached.decode("utf-8") if isinstance(cached, bytes) else cached)
+
+        token = uuid.uuid4().hex
+        if await client.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)):
+            try:
+                value = await self._call(func)
+                # From here on the value exists: Redis errors must not cause a second call
+                try:
+                    await client.set(result_key, encode(value), px=int(self.result_ttl * 1000))
+                except Exception as e:
+                    self._redis_failed("publish", e)
+                return value
+            finally:
+                try:
+                    current = await client.get(lock_key)
+                    if current is not None and (current.decode("utf-8") if isinstance(current, bytes) else current) == token:
+                        await client.delete(lock_key)
+                except Exception as e:
+                    # The lock expires on its own after lock_timeout
+                    self._redis_failed("unlock", e)
+
+        # Another worker is computing this key; wait for its result
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            cached = await client.get(result_key)
+            if cached is not None:
+                self._record("redis_shared")
+                return decode(cached.decode("utf-8") if isinstance(cached, bytes) else cached)
+            if not await client.exists(lock_key):
+                break
+
+        return await self._call(func)
+
+    @staticmethod
+    async def _call(func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func, tagging its failures so they are not mistaken for Redis errors"""
+        try:
+            return await func()
+        except Exception as e:
+            raise _LeaderCallError(e) from e
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get singleflight statistics"""
+        return {
+            "group": self.group,
+            "in_flight": len(self._inflight),
+            "cached_results": len(self._results),
+            "result_ttl": self.result_ttl,
+            "redis_enabled": self.use_redis,
+            "redis_errors": self.redis_errors,
+            **self.stats
+        }
+
+class _LeaderCallError(Exception):
+    """Wraps a failure of the wrapped call so it is not mistaken for a Redis error"""
+
+    def __init__(self, original: Exception):
+        self.original = original
+        super().__init__(str(original))
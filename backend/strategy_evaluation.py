@@ -0,0 +1,201 @@
+"""
+Strategy Evaluation Module for CK Empire Builder
+Concurrent, resumable accuracy and latency evaluation of strategy models
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import asyncio
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple, Union
+
+from llm_gateway import llm_gateway
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        EVALUATION_CONCURRENCY = int(os.getenv("EVALUATION_CONCURRENCY", "8"))
+        EVALUATION_CHECKPOINT_DIR = "data/evaluations"
+
+logger = logging.getLogger(__name__)
+
+ModelCaller = Callable[[str], Awaitable[str]]
+TestCase = Union[str, Tuple[str, str]]
+
+RUN_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+class StrategyEvaluator:
+    """Runs every (model, input) pair with bounded concurrency and checkpoints each result"""
+
+    def __init__(
+        self,
+        ai_module,
+        concurrency: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None,
+        use_cache: bool = False
+    ):
+        self.ai_module = ai_module
+        self.concurrency = concurrency or settings.EVALUATION_CONCURRENCY
+        self.checkpoint_dir = Path(checkpoint_dir or settings.EVALUATION_CHECKPOINT_DIR)
+        self.use_cache = use_cache
+
+    def available_models(self) -> Dict[str, ModelCaller]:
+        """Strategy backends that can be evaluated in this process"""
+        ai = self.ai_module
+        models: Dict[str, ModelCaller] = {}
+        if ai.client and ai.fine_tuned_model:
+            models[ai.fine_tuned_model] = lambda text: ai._call_fine_tuned_model(text, use_cache=self.use_cache, fallback=False)
+        # No mock fallback: a failed call must count as an error, not as a canned answer
+        models["gpt-4"] = lambda text: ai._call_enhanced_base_model(text, use_cache=self.use_cache, fallback=False)
+        models["ollama:llama2"] = lambda text: llm_gateway.generate(
+            ai._build_strategy_prompt(text), model="llama2", timeout=60.0, use_cache=self.use_cache
+        )
+        return models
+
+    def checkpoint_path(self, run_id: str) -> Path:
+        """
+        Checkpoint file for a run
+
+        Raises:
+            ValueError: If run_id is not a plain identifier or escapes checkpoint_dir
+        """
+        if not re.fullmatch(RUN_ID_PATTERN, run_id):
+            raise ValueError(f"Invalid run_id: {run_id!r}")
+        root = self.checkpoint_dir.resolve()
+        path = (root / f"strategy_eval_{run_id}.jsonl").resolve()
+        if path.parent != root:
+            raise ValueError(f"Invalid run_id: {run_id!r}")
+        return path
+
+    def _load_checkpoint(self, path: Path) -> List[Dict[str, Any]]:
+        """Read results already recorded for this run"""
+        if not path.exists():
+            return []
+        results = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    results.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted run
+                    continue
+        return results
+
+    async def evaluate(
+        self,
+        test_cases: List[TestCase],
+        models: Optional[List[str]] = None,
+        run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate strategy-type accuracy and latency for each model
+
+        Args:
+            test_cases: Inputs, or (input, expected strategy type value) pairs
+            models: Model names to evaluate (defaults to all available)
+            run_id: Resume an earlier run by id
+
+        Returns:
+            Per-model accuracy, confusion matrix and latency percentiles
+        """
+        callers = self.available_models()
+        selected = {name: callers[name] for name in (models or callers) if name in callers}
+        run_id = run_id or f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        path = self.checkpoint_path(run_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        cases = [case if isinstance(case, tuple) else (case, None) for case in test_cases]
+        # Entries for inputs or models outside this run's selection are left out of the report
+        wanted = {(name, text) for name in selected for text, _ in cases}
+        results = [r for r in self._load_checkpoint(path) if (r["model"], r["input"]) in wanted]
+        done = {(r["model"], r["input"]) for r in results}
+        pending = [(name, text, expected) for name in selected for text, expected in cases if (name, text) not in done]
+        if done:
+            logger.info(f"Resuming evaluation {run_id}: {len(done)} done, {len(pending)} pending")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        write_lock = asyncio.Lock()
+        started = time.perf_counter()
+
+        with open(path, 'a', encoding='utf-8') as checkpoint:
+            async def run_one(name: str, text: str, expected: Optional[str]):
+                async with semaphore:
+                    record = {"model": name, "input": text, "expected": expected, "predicted": None, "error": None}
+                    call_start = time.perf_counter()
+                    try:
+                        response = await selected[name](text)
+                        record["predicted"] = self.ai_module._determine_enhanced_strategy_type(response, text).value
+                    except Exception as e:
+                        record["error"] = str(e)
+                    record["latency"] = time.perf_counter() - call_start
+                    if record["expected"] is None:
+                        record["expected"] = self.ai_module._determine_enhanced_strategy_type(text, text).value
+
+                async with write_lock:
+                    checkpoint.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    checkpoint.flush()
+                results.append(record)
+
+            await asyncio.gather(*(run_one(*item) for item in pending))
+
+        wall_time = time.perf_counter() - started
+        report = self._build_report(results, list(selected), wall_time, len(pending))
+        report.update({
+            "run_id": run_id,
+            "checkpoint_path": str(path),
+            "concurrency": self.concurrency,
+            "resumed_results": len(done),
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        return report
+
+    def _build_report(self, results: List[Dict[str, Any]], models: List[str], wall_time: float, executed: int) -> Dict[str, Any]:
+        """Aggregate raw results per model"""
+        per_model = {}
+        for name in models:
+            rows = [r for r in results if r["model"] == name]
+            # Failed calls count against accuracy but not towards latency
+            latencies = sorted(r["latency"] for r in rows if not r["error"])
+            correct = sum(1 for r in rows if r["predicted"] == r["expected"])
+
+            confusion: Dict[str, Dict[str, int]] = {}
+            for r in rows:
+                predicted = r["predicted"] or "error"
+                confusion.setdefault(r["expected"], {})
+                confusion[r["expected"]][predicted] = confusion[r["expected"]].get(predicted, 0) + 1
+
+            per_model[name] = {
+                "accuracy": correct / len(rows) if rows else 0.0,
+                "correct_predictions": correct,
+                "total_predictions": len(rows),
+                "errors": sum(1 for r in rows if r["error"]),
+                "confusion_matrix": confusion,
+                "latency": {
+                    "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+                    "p50": _percentile(latencies, 0.50),
+                    "p90": _percentile(latencies, 0.90),
+                    "p95": _percentile(latencies, 0.95),
+                    "p99": _percentile(latencies, 0.99),
+                    "max": latencies[-1] if latencies else 0.0
+                }
+            }
+
+        return {
+            "models": per_model,
+            "wall_time": wall_time,
+            "throughput_per_second": executed / wall_time if wall_time > 0 else 0.0
+        }
@@ -0,0 +1,352 @@
+"""
+Fake Ollama Server for CK Empire Builder
+Local stand-in for the Ollama API with configurable latency, token rate and failures,
+returning canned JSON in the shapes ContentScheduler and AIModule parse.
+
+Usage:
+    python tests/load/fake_ollama.py --port 11435 --latency-mean 0.8 --failure-rate 0.05
+    OLLAMA_URL=http://localhost:11435 uvicorn main:app
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+@dataclass
+class FakeOllamaConfig:
+    """Latency, throughput and failure profile of the fake server"""
+    latency_distribution: str = "lognormal"  # fixed, uniform, normal, lognormal
+    latency_mean: float = 0.5                # seconds before the first token
+    latency_jitter: float = 0.25             # spread (stddev / half-width / sigma)
+    tokens_per_second: float = 40.0          # 0 disables per-token pacing
+    failure_rate: float = 0.0                # fraction of generate calls that fail
+    failure_status: int = 500
+    trailing_text: bool = True               # append chatter after streamed JSON
+    models: List[str] = field(default_factory=lambda: ["llama2", "llama3.2"])
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "FakeOllamaConfig":
+        """Build a config from FAKE_OLLAMA_* environment variables"""
+        seed = os.getenv("FAKE_OLLAMA_SEED")
+        return cls(
+            latency_distribution=os.getenv("FAKE_OLLAMA_LATENCY_DISTRIBUTION", "lognormal"),
+            latency_mean=float(os.getenv("FAKE_OLLAMA_LATENCY_MEAN", "0.5")),
+            latency_jitter=float(os.getenv("FAKE_OLLAMA_LATENCY_JITTER", "0.25")),
+            tokens_per_second=float(os.getenv("FAKE_OLLAMA_TOKENS_PER_SECOND", "40")),
+            failure_rate=float(os.getenv("FAKE_OLLAMA_FAILURE_RATE", "0")),
+            failure_status=int(os.getenv("FAKE_OLLAMA_FAILURE_STATUS", "500")),
+            trailing_text=os.getenv("FAKE_OLLAMA_TRAILING_TEXT", "true").lower() == "true",
+            seed=int(seed) if seed else None
+        )
+
+class LatencyModel:
+    """Samples first-token latency from the configured distribution"""
+
+    def __init__(self, config: FakeOllamaConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+
+    def sample(self) -> float:
+        """Draw one latency in seconds"""
+        mean, jitter = self.config.latency_mean, self.config.latency_jitter
+        distribution = self.config.latency_distribution
+        if distribution == "fixed":
+            value = mean
+        elif distribution == "uniform":
+            value = self.rng.uniform(mean - jitter, mean + jitter)
+        elif distribution == "normal":
+            value = self.rng.gauss(mean, jitter)
+        elif distribution == "lognormal":
+            # Parameterised so the median equals latency_mean and jitter is sigma
+            value = mean * self.rng.lognormvariate(0.0, jitter) if mean > 0 else 0.0
+        else:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        return max(0.0, value)
+
+    def should_fail(self) -> bool:
+        """Decide whether this call fails"""
+        return self.rng.random() < self.config.failure_rate
+
+def _extract_quoted(prompt: str, pattern: str, default: str) -> str:
+    """Pull a quoted or line value out of a prompt"""
+    match = re.search(pattern, prompt)
+    return match.group(1).strip() if match else default
+
+def _content_idea(topic: str, index: int = 0) -> Dict[str, Any]:
+    """Canned viral content idea"""
+    return {
+        "title": f"{topic.title()} Secrets Nobody Tells You #{index + 1}",
+        "description": f"A fast, authentic deep-dive into {topic} with a hook in the first 3 seconds",
+        "content_type": "video",
+        "target_audience": f"{topic} enthusiasts aged 18-35",
+        "viral_potential": round(0.75 + (index % 5) * 0.04, 2),
+        "estimated_revenue": 650.0 + index * 50,
+        "keywords": [topic.lower(), "2025", "trending"],
+        "hashtags": [f"#{re.sub(r'[^A-Za-z0-9]', '', topic) or 'content'}", "#viral", "#2025"]
+    }
+
+def _niche_idea(niche: str, variation_type: str, index: int = 0) -> Dict[str, Any]:
+    """Canned niche content idea"""
+    idea = _content_idea(niche, index)
+    idea.update({
+        "title": f"{variation_type.replace('_', ' ').title()}: {niche.title()} in 2025",
+        "variation_type": variation_type,
+        "niche_focus": niche,
+        "trends_included": ["Short-form content", "AI-enhanced creativity"]
+    })
+    return idea
+
+def build_payload(prompt: str) -> Any:
+    """Pick a canned response matching the prompt the backend sent"""
+    if "Repurpose this viral content idea" in prompt:
+        channel = _extract_quoted(prompt, r"Repurpose this viral content idea for ([^:\n]+):", "youtube")
+        original = _extract_quoted(prompt, r"Original: ([^\n]+)", "Viral idea")
+        return {
+            "adapted_title": f"{channel.title()} cut: {original}",
+            "adapted_description": f"Optimized for {channel} audiences with a strong opening hook",
+            "platform_hooks": ["Wait for the end", "You won't believe #3"],
+            "optimal_posting_time": "18:00",
+            "hashtags": ["#viral", "#2025", f"#{channel.lower()}"],
+            "content_format": "short_form",
+            "estimated_engagement": 0.82
+        }
+
+    if "Assess the quality" in prompt:
+        return {
+            "quality_score": 0.86,
+            "viral_potential": 0.83,
+            "engagement_likelihood": 0.79,
+            "shareability": 0.81,
+            "trend_relevance": 0.87,
+            "overall_assessment": "high_quality"
+        }
+
+    if "Adapt this content for" in prompt:
+        channel = _extract_quoted(prompt, r"Adapt this content for ([^:\n]+):", "YouTube")
+        original = _extract_quoted(prompt, r"- Title: ([^\n]+)", "Content")
+        return {
+            "adapted_title": f"{channel} version: {original}",
+            "adapted_description": f"Adapted for {channel} with platform-native pacing",
+            "content_script": "Hook (0-3s) -> Value (3-45s) -> Call to action (45-60s)",
+            "key_hooks": ["Stop scrolling", "The one trick that works"],
+            "optimal_hashtags": ["#2025", "#growth", "#viral"],
+            "posting_strategy": "Post at peak hours, reply to comments within the first hour",
+            "engagement_tips": ["Ask a question", "Pin a comment"],
+            "estimated_views": 25000,
+            "estimated_engagement_rate": 0.07
+        }
+
+    if "monetization strategies for the following social media channels" in prompt:
+        channels = ["YouTube", "TikTok", "Instagram", "LinkedIn", "Twitter"]
+        return {
+            "monthly_views": {c: 30000 + i * 15000 for i, c in enumerate(channels)},
+            "rpm_rates": {c: 2.0 + i * 1.25 for i, c in enumerate(channels)},
+            "affiliate_rates": {c: 0.08 + i * 0.03 for i, c in enumerate(channels)},
+            "product_margins": {c: 0.18 + i * 0.04 for i, c in enumerate(channels)},
+            "monetization_strategies": {c: ["Sponsorships", "Affiliate Links", "Digital Products"] for c in channels}
+        }
+
+    if "business idea" in prompt:
+        return {
+            "title": "AI-Powered Micro-Course Studio",
+            "description": "Turns short-form content into paid micro-courses with automated editing",
+            "target_market": "Creators and small education businesses",
+            "unique_value_proposition": "Course production in hours instead of weeks",
+            "initial_investment": 15000,
+            "projected_revenue_year_1": 60000,
+            "projected_revenue_year_2": 180000,
+            "projected_revenue_year_3": 420000,
+            "growth_rate": 1.4,
+            "risk_level": "medium",
+            "timeline_months": 6,
+            "key_resources": ["AI tooling", "Creator partnerships"],
+            "competitive_advantages": ["Speed", "Multi-platform distribution"],
+            "revenue_streams": ["Subscriptions", "Revenue share"],
+            "scalability_potential": "high",
+            "trend_alignment": ["AI-enhanced business models", "Educational value"],
+            "viral_potential": 0.78
+        }
+
+    if "distinct content ideas for the niche" in prompt:
+        niche = _extract_quoted(prompt, r'for the niche: "([^"]+)"', "general")
+        variations = re.findall(r"^\s*\d+\.\s*([A-Za-z_]+)", prompt, re.MULTILINE)
+        count = int(_extract_quoted(prompt, r"Generate (\d+) distinct", str(len(variations) or 1)))
+        variations = (variations or ["educational"]) * count
+        return [_niche_idea(niche, variations[i], i) for i in range(count)]
+
+    if "content idea for the niche" in prompt:
+        niche = _extract_quoted(prompt, r'for the niche: "([^"]+)"', "general")
+        variation_type = _extract_quoted(prompt, r"Generate an? ([A-Za-z_]+) content idea", "educational")
+        return _niche_idea(niche, variation_type)
+
+    if "content trends for 2025" in prompt:
+        names = ["Micro-documentaries", "AI co-hosts", "Faceless explainers", "Live shopping", "Community challenges"]
+        return [
+            {
+                "trend_name": name,
+                "category": "Content Format",
+                "impact_score": round(0.9 - i * 0.05, 2),
+                "content_adaptation": f"Use {name.lower()} for short-form hooks",
+                "viral_potential": round(0.85 - i * 0.04, 2),
+                "hashtags": ["#2025", "#trend"]
+            }
+            for i, name in enumerate(names)
+        ]
+
+    topic = _extract_quoted(prompt, r'about:? "?([^"\n]+)"?', "content")
+    idea = _content_idea(topic)
+    if "2025 TREND OPTIMIZATION" in prompt or "2025 OPTIMIZATION CONTEXT" in prompt:
+        idea.update({
+            "engagement_metrics": {"likes": 0.08, "shares": 0.03, "comments": 0.02},
+            "platform_optimization": ["YouTube Shorts", "TikTok", "Instagram Reels"]
+        })
+    return idea
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into token-sized chunks that keep whitespace"""
+    return re.findall(r"\s*\S{1,6}", text) or [text]
+
+def create_app(config: Optional[FakeOllamaConfig] = None) -> FastAPI:
+    """
+    Create the fake Ollama application
+
+    Args:
+        config: Latency and failure profile (defaults from FAKE_OLLAMA_* env vars)
+
+    Returns:
+        FastAPI app serving /api/generate and /api/tags
+    """
+    config = config or FakeOllamaConfig.from_env()
+    latency = LatencyModel(config)
+    stats = {"requests": 0, "streamed": 0, "failures": 0}
+    app = FastAPI(title="Fake Ollama")
+    app.state.config = config
+    app.state.stats = stats
+
+    @app.get("/api/tags")
+    async def tags():
+        return {
+            "models": [
+                {"name": f"{model}:latest", "model": f"{model}:latest", "size": 3825819519, "modified_at": datetime.utcnow().isoformat() + "Z"}
+                for model in config.models
+            ]
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    @app.post("/api/generate")
+    async def generate(request: Request):
+        body = await request.json()
+        model = body.get("model", "llama2")
+        prompt = body.get("prompt", "")
+        stream = body.get("stream", True)
+        stats["requests"] += 1
+
+        await asyncio.sleep(latency.sample())
+        if latency.should_fail():
+            stats["failures"] += 1
+            return JSONResponse(status_code=config.failure_status, content={"error": "simulated model failure"})
+
+        text = json.dumps(build_payload(prompt), indent=2)
+        started = time.perf_counter()
+
+        if not stream:
+            if config.tokens_per_second > 0:
+                await asyncio.sleep(len(_tokenize(text)) / config.tokens_per_second)
+            return {
+                "model": model,
+                "created_at": datetime.utcnow().isoformat() + "Z",
+                "response": text,
+                "done": True,
+                "eval_count": len(_tokenize(text)),
+                "total_duration": int((time.perf_counter() - started) * 1e9)
+            }
+
+        stats["streamed"] += 1
+        if config.trailing_text:
+            text += "\n\nLet me know if you want more ideas!"
+
+        async def token_stream():
+            tokens = _tokenize(text)
+            delay = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+            for token in tokens:
+                yield json.dumps({"model": model, "response": token, "done": False}) + "\n"
+                if delay:
+                    await asyncio.sleep(delay)
+            yield json.dumps({
+                "model": model,
+                "response": "",
+                "done": True,
+                "eval_count": len(tokens),
+                "total_duration": int((time.perf_counter() - started) * 1e9)
+            }) + "\n"
+
+        return StreamingResponse(token_stream(), media_type="application/x-ndjson")
+
+    return app
+
+def start_in_thread(config: Optional[FakeOllamaConfig] = None, host: str = "127.0.0.1", port: int = 11435) -> str:
+    """
+    Run the fake server in a daemon thread
+
+    Returns:
+        Base URL to use as OLLAMA_URL
+    """
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_app(config), host=host, port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="fake-ollama", daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.05)
+    return f"http://{host}:{port}"
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    defaults = FakeOllamaConfig.from_env()
+    parser = argparse.ArgumentParser(description="Fake Ollama server for benchmarks and load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.getenv("FAKE_OLLAMA_PORT", "11435")))
+    parser.add_argument("--latency-distribution", choices=["fixed", "uniform", "normal", "lognormal"], default=defaults.latency_distribution)
+    parser.add_argument("--latency-mean", type=float, default=defaults.latency_mean)
+    parser.add_argument("--latency-jitter", type=float, default=defaults.latency_jitter)
+    parser.add_argument("--tokens-per-second", type=float, default=defaults.tokens_per_second)
+    parser.add_argument("--failure-rate", type=float, default=defaults.failure_rate)
+    parser.add_argument("--failure-status", type=int, default=defaults.failure_status)
+    parser.add_argument("--no-trailing-text", action="store_true")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+
+    config = FakeOllamaConfig(
+        latency_distribution=args.latency_distribution,
+        latency_mean=args.latency_mean,
+        latency_jitter=args.latency_jitter,
+        tokens_per_second=args.tokens_per_second,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        trailing_text=not args.no_trailing_text,
+        seed=args.seed
+    )
+
+    import uvicorn
+    print(f"🦙 Fake Ollama listening on http://{args.host}:{args.port} — export OLLAMA_URL=http://{args.host}:{args.port}")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    sys.exit(main())
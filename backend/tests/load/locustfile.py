@@ -1,3 +1,4 @@
+import os
 import time
 import random
 import json
@@ -375,7 +376,68 @@ class ReadOnlyUser(CKEmpireUser):
         """Frequent performance checks"""
         self.get_performance_metrics()
 
+class LLMPipelineUser(HttpUser):
+    """Load testing user for the Ollama-backed content pipeline
+    
+    Run the backend with OLLAMA_URL pointing at tests/load/fake_ollama.py
+    (or pass --fake-ollama) to get repeatable model latency.
+    """
+    
+    wait_time = between(1, 3)
+    weight = 1
+    
+    @task(3)
+    def generate_content_ideas(self):
+        """Test Ollama-backed idea generation under a latency budget"""
+        idea_data = {
+            "topic": random.choice(["AI tools", "personal finance", "fitness", "travel hacks"]),
+            "content_type": "video",
+            "target_audience": "creators",
+            "tone": "energetic",
+            "length": "short"
+        }
+        
+        with self.client.post("/api/v1/ai/ideas?latency_budget=3.0", json=idea_data, name="/api/v1/ai/ideas", catch_response=True) as response:
+            if response.status_code == 200 and isinstance(response.json(), list):
+                response.success()
+            else:
+                response.failure(f"Idea generation failed with status {response.status_code}")
+    
+    @task(1)
+    def scheduler_generate_content(self):
+        """Test the multi-channel repurposing pipeline"""
+        with self.client.post("/api/v1/content-scheduler/generate-content?latency_budget=10.0", name="/api/v1/content-scheduler/generate-content", catch_response=True) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Scheduler generation failed with status {response.status_code}")
+    
+    @task(1)
+    def ollama_connection(self):
+        """Test the Ollama connectivity probe"""
+        with self.client.post("/api/v1/content-scheduler/test-ollama", catch_response=True) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Ollama test failed with status {response.status_code}")
+
 # Custom event handlers for monitoring
+@events.init_command_line_parser.add_listener
+def add_fake_ollama_arguments(parser):
+    """Add options for running the fake Ollama server alongside Locust"""
+    parser.add_argument("--fake-ollama", action="store_true", default=False, help="Start tests/load/fake_ollama.py in-process")
+    parser.add_argument("--fake-ollama-port", type=int, default=int(os.getenv("FAKE_OLLAMA_PORT", "11435")))
+
+@events.init.add_listener
+def start_fake_ollama(environment, **kwargs):
+    """Start the fake Ollama server when requested"""
+    options = environment.parsed_options
+    if options and getattr(options, "fake_ollama", False):
+        from fake_ollama import start_in_thread
+        
+        url = start_in_thread(port=options.fake_ollama_port)
+        print(f"🦙 Fake Ollama running at {url} — start the backend with OLLAMA_URL={url}")
+
 @events.test_start.add_listener
 def on_test_start(environment, **kwargs):
     """Called when a test is starting"""
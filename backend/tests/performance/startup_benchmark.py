@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for CK Empire Builder
+Measures cold import time, peak RSS and the slowest imports (via python -X importtime)
+
+Usage (from backend/):
+    python tests/performance/startup_benchmark.py
+    python tests/performance/startup_benchmark.py --module main --runs 5 --json results.json
+    python tests/performance/startup_benchmark.py --baseline results.json --max-regression 20
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Modules that should stay out of a cold start unless a code path needs them
+HEAVY_MODULES = ["cv2", "numpy", "pandas", "matplotlib", "PIL", "web3", "eth_account", "openai", "stripe", "moviepy"]
+
+# Runs inside a fresh interpreter for each measurement
+CHILD_SCRIPT = """
+import json, resource, sys, time, importlib
+started = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - started
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is kilobytes on Linux and bytes on macOS
+rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+print(json.dumps({{
+    "import_seconds": elapsed,
+    "peak_rss_mb": rss_mb,
+    "heavy_modules_loaded": [m for m in {heavy!r} if m in sys.modules]
+}}))
+"""
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Parse `import time: self [us] | cumulative | package` lines"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "top_level": not name.startswith("  ")
+            })
+        except ValueError:
+            continue
+    return rows
+
+def run_once(module: str) -> Dict[str, Any]:
+    """Import a module in a cold interpreter and collect timings"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    wall_seconds = time.perf_counter() - started
+
+    result_line = proc.stdout.strip().splitlines()[-1] if proc.stdout.strip() else ""
+    if proc.returncode != 0 or not result_line.startswith("{"):
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {module} failed:\n" + "\n".join(errors[-15:]))
+
+    result = json.loads(result_line)
+    result["process_seconds"] = wall_seconds
+    result["imports"] = parse_importtime(proc.stderr)
+    return result
+
+def benchmark(module: str, runs: int, top: int) -> Dict[str, Any]:
+    """Repeat cold imports and summarize"""
+    samples = [run_once(module) for _ in range(runs)]
+    import_times = [s["import_seconds"] for s in samples]
+    process_times = [s["process_seconds"] for s in samples]
+    rss = [s["peak_rss_mb"] for s in samples]
+
+    # Slowest top-level imports from the median run
+    median_run = sorted(samples, key=lambda s: s["import_seconds"])[len(samples) // 2]
+    slowest = sorted((row for row in median_run["imports"] if row["top_level"]), key=lambda r: r["cumulative_ms"], reverse=True)
+
+    return {
+        "module": module,
+        "runs": runs,
+        "import_seconds": {"median": statistics.median(import_times), "min": min(import_times), "max": max(import_times)},
+        "process_seconds": {"median": statistics.median(process_times), "min": min(process_times)},
+        "peak_rss_mb": {"median": statistics.median(rss), "max": max(rss)},
+        "modules_imported": len(median_run["imports"]),
+        "heavy_modules_loaded": median_run["heavy_modules_loaded"],
+        "slowest_imports": [
+            {"module": row["module"].strip(), "cumulative_ms": round(row["cumulative_ms"], 1)} for row in slowest[:top]
+        ]
+    }
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Regressions beyond max_regression percent against a baseline report"""
+    failures = []
+    for module, result in report["results"].items():
+        previous = baseline.get("results", {}).get(module)
+        if not previous:
+            continue
+        for metric in ("import_seconds", "peak_rss_mb"):
+            before = previous[metric]["median"]
+            after = result[metric]["median"]
+            if before > 0 and (after - before) / before * 100 > max_regression:
+                failures.append(f"{module} {metric}: {before:.3f} -> {after:.3f} (+{(after - before) / before * 100:.1f}%)")
+    return failures
+
+def print_report(report: Dict[str, Any]):
+    """Human-readable summary"""
+    print(f"🚀 Cold start benchmark ({report['python']})")
+    for module, result in report["results"].items():
+        print(f"\n📦 import {module}  ({result['runs']} runs)")
+        print(f"   import time   median {result['import_seconds']['median'] * 1000:.0f}ms  min {result['import_seconds']['min'] * 1000:.0f}ms")
+        print(f"   process time  median {result['process_seconds']['median'] * 1000:.0f}ms")
+        print(f"   peak RSS      median {result['peak_rss_mb']['median']:.1f}MB")
+        print(f"   modules       {result['modules_imported']}")
+        print(f"   heavy loaded  {', '.join(result['heavy_modules_loaded']) or 'none'}")
+        for row in result["slowest_imports"]:
+            print(f"     {row['cumulative_ms']:8.1f}ms  {row['module']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure backend cold-start import time and RSS")
+    parser.add_argument("--module", action="append", help="Module to import (repeatable, default: main, ai, dashboard)")
+    parser.add_argument("--runs", type=int, default=3, help="Cold imports per module")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    parser.add_argument("--json", help="Write the report to this file")
+    parser.add_argument("--baseline", help="Earlier --json report to compare against")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="Allowed median regression in percent")
+    args = parser.parse_args()
+
+    report = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": sys.version.split()[0],
+        "results": {}
+    }
+    for module in args.module or ["main", "ai", "dashboard"]:
+        try:
+            report["results"][module] = benchmark(module, args.runs, args.top)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+
+    if not report["results"]:
+        sys.exit(1)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            failures = compare(report, json.load(f), args.max_regression)
+        if failures:
+            print("\n❌ Startup regressions:")
+            for failure in failures:
+                print(f"   {failure}")
+            sys.exit(1)
+        print(f"\n✅ Within {args.max_regression:.0f}% of baseline")
+
+if __name__ == "__main__":
+    main()
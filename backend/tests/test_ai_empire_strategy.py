@@ -385,6 +385,75 @@ class TestAIEmpireStrategy:
             # Verify fine-tuned model was called
             mock_call.assert_called_once_with("Test input")
 
+    @pytest.mark.asyncio
+    async def test_identical_strategy_requests_are_coalesced(self, ai_module, mock_openai_response):
+        """Test concurrent identical requests share one model call and result"""
+        ai_module.strategy_flight.use_redis = False
+
+        async def slow_call(user_input, use_cache=True):
+            await asyncio.sleep(0.1)
+            return mock_openai_response
+
+        with patch.object(ai_module, '_call_enhanced_base_model', side_effect=slow_call) as mock_call:
+            results = await asyncio.gather(*(
+                ai_module.generate_custom_strategy("Revenue hedefi $20K, AI öneri ver") for _ in range(5)
+            ))
+
+            mock_call.assert_called_once()
+            assert all(strategy is results[0][0] for strategy, _ in results)
+            assert ai_module.strategy_flight.stats["shared"] == 4
+
+    @pytest.mark.asyncio
+    async def test_slow_completion_does_not_block_event_loop(self, ai_module):
+        """Test the event loop keeps serving other tasks during a slow OpenAI call"""
+        import time
+
+        def slow_create(**kwargs):
+            time.sleep(0.5)
+            completion = Mock()
+            completion.choices = [Mock(message=Mock(content="Strateji Türü: Scale-Up"))]
+            return completion
+
+        ai_module.client = Mock()
+        ai_module.client.chat.completions.create.side_effect = slow_create
+
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        try:
+            response = await ai_module._call_enhanced_base_model("Slow input", use_cache=False)
+        finally:
+            heartbeat_task.cancel()
+
+        assert response == "Strateji Türü: Scale-Up"
+        # A blocked loop would record no ticks while the completion sleeps
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_batched_niche_ideas_replace_only_bad_items(self, ai_module):
+        """Test one malformed item in a batched completion falls back to mock content for that slot only"""
+        response = """[
+            {"title": "Real idea 1", "viral_potential": 0.9, "estimated_revenue": 120},
+            {"title": "Broken idea", "viral_potential": "high", "estimated_revenue": "$50"},
+            {"title": "Real idea 3", "viral_potential": "0.8", "estimated_revenue": "$1,200"}
+        ]"""
+
+        with patch("ai.llm_gateway.generate", new_callable=AsyncMock, return_value=response), \
+                patch.object(ai_module, "_track_niche_content_analytics", new_callable=AsyncMock):
+            ideas = await ai_module.generate_niche_content_ideas("fitness", channels=3, mode="batched")
+
+        assert len(ideas) == 3
+        assert ideas[0].title == "Real idea 1"
+        assert ideas[1].title != "Broken idea"
+        assert ideas[2].title == "Real idea 3"
+        assert ideas[2].estimated_revenue == 1200.0
+
     def test_strategy_parsing_edge_cases(self, ai_module):
         """Test strategy parsing with edge cases"""
         # Test with minimal response
@@ -0,0 +1,79 @@
+"""
+Test Analytics Log
+Tests for append-only analytics streams with rotation and indexed reads
+"""
+
+import json
+import pytest
+
+from analytics_log import AnalyticsLog
+
+class TestAnalyticsLog:
+    """Test class for AnalyticsLog"""
+
+    @pytest.fixture
+    def log(self, tmp_path):
+        log = AnalyticsLog("business_ideas", log_dir=str(tmp_path), fsync_batch=4, rotate_bytes=400, legacy_path=None)
+        yield log
+        log.close()
+
+    def test_append_and_tail(self, log):
+        """Test records come back newest last and generated_at is stamped"""
+        for i in range(5):
+            log.append({"idea_title": f"Idea {i}"})
+
+        recent = log.tail(3)
+
+        assert [record["idea_title"] for record in recent] == ["Idea 2", "Idea 3", "Idea 4"]
+        assert all("generated_at" in record for record in recent)
+        assert len(log) == 5
+
+    def test_rotation_keeps_counts_and_tail_across_segments(self, log, tmp_path):
+        """Test sealed segments are indexed and tail reads back through them"""
+        for i in range(40):
+            log.append({"idea_title": f"Idea {i}", "generated_at": f"2025-01-01T00:00:{i:02d}"})
+
+        stats = log.get_stats()
+        assert stats["segments"] >= 2
+        assert len(log) == 40
+        assert [record["idea_title"] for record in log.tail(15)] == [f"Idea {i}" for i in range(25, 40)]
+
+        index = json.loads((tmp_path / "business_ideas.index.json").read_text())
+        assert sum(segment["count"] for segment in index["segments"]) + len(log._offsets) == 40
+
+    def test_since_skips_older_records(self, log):
+        """Test time-window reads return only records at or after the cutoff"""
+        for i in range(40):
+            log.append({"idea_title": f"Idea {i}", "generated_at": f"2025-01-01T00:00:{i:02d}"})
+
+        recent = list(log.since("2025-01-01T00:00:35"))
+
+        assert [record["idea_title"] for record in recent] == [f"Idea {i}" for i in range(35, 40)]
+
+    def test_reopen_recovers_from_torn_write(self, log, tmp_path):
+        """Test a restarted log drops a half-written line and keeps appending"""
+        for i in range(3):
+            log.append({"idea_title": f"Idea {i}"})
+        log.flush()
+        log.close()
+        with open(tmp_path / "business_ideas.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"idea_title": "Torn')
+
+        reopened = AnalyticsLog("business_ideas", log_dir=str(tmp_path), rotate_bytes=400, legacy_path=None)
+        reopened.append({"idea_title": "Idea 3"})
+
+        assert len(reopened) == 4
+        assert reopened.tail(1)[0]["idea_title"] == "Idea 3"
+        reopened.close()
+
+    def test_legacy_json_is_imported_once(self, tmp_path):
+        """Test the old JSON array seeds a new stream"""
+        legacy = tmp_path / "business_ideas_analytics.json"
+        legacy.write_text(json.dumps([{"idea_title": "Old", "generated_at": "2024-01-01T00:00:00"}]))
+
+        log = AnalyticsLog("business_ideas", log_dir=str(tmp_path / "analytics"), legacy_path=str(legacy))
+        log.append({"idea_title": "New"})
+        log.close()
+        reopened = AnalyticsLog("business_ideas", log_dir=str(tmp_path / "analytics"), legacy_path=str(legacy))
+
+        assert [record["idea_title"] for record in reopened.records()] == ["Old", "New"]
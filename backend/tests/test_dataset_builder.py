@@ -0,0 +1,70 @@
+"""
+Test Fine-Tuning Dataset Builder
+Tests for the streaming, deduplicated JSONL dataset writer
+"""
+
+import json
+import pytest
+
+from dataset_builder import FineTuningDatasetBuilder
+
+class TestFineTuningDatasetBuilder:
+    """Test class for the fine-tuning dataset builder"""
+
+    @pytest.fixture
+    def builder(self, tmp_path):
+        """Create a builder with small shards"""
+        return FineTuningDatasetBuilder(str(tmp_path / "dataset.jsonl"), shard_size=3)
+
+    @staticmethod
+    def examples(count, offset=0):
+        """Generate distinct input/output pairs"""
+        for i in range(offset, offset + count):
+            yield {"input": f"Prompt {i}", "output": f"Strategy {i}"}
+
+    def test_append_skips_duplicates_and_invalid(self, builder):
+        """Test duplicate pairs and incomplete records are not written"""
+        stats = builder.append([
+            {"input": "Low budget", "output": "Lean startup"},
+            {"input": "Low  budget ", "output": "Lean startup"},
+            {"input": "Low budget", "output": ""},
+        ])
+
+        assert stats == {"added": 1, "duplicates": 1, "invalid": 1}
+        assert len(builder) == 1
+
+    def test_records_are_sharded(self, builder):
+        """Test examples roll over into fixed-size shards and stream back in order"""
+        builder.append(self.examples(7))
+
+        shards = builder.shard_paths()
+        assert [path.name for path in shards] == ["dataset.jsonl", "dataset.00001.jsonl", "dataset.00002.jsonl"]
+        assert sum(1 for _ in open(shards[0], encoding="utf-8")) == 3
+        assert [record["input"] for record in builder.iter_records()] == [f"Prompt {i}" for i in range(7)]
+
+    def test_index_persists_across_instances(self, builder, tmp_path):
+        """Test a new builder dedupes against the stored index and keeps filling the last shard"""
+        builder.append(self.examples(4))
+
+        reopened = FineTuningDatasetBuilder(str(tmp_path / "dataset.jsonl"), shard_size=3)
+        stats = reopened.append(self.examples(4, offset=2))
+        assert stats["added"] == 2
+        assert stats["duplicates"] == 2
+        assert len(reopened) == 6
+        assert reopened.get_stats()["shards"] == 2
+
+    def test_index_is_rebuilt_when_missing(self, builder):
+        """Test the hash index is recovered from the dataset files"""
+        builder.append(self.examples(5))
+        builder.index_path.unlink()
+
+        reopened = FineTuningDatasetBuilder(str(builder.path), shard_size=3)
+        assert reopened.append(self.examples(5))["duplicates"] == 5
+        assert reopened.index_path.exists()
+
+    def test_written_lines_are_json(self, builder):
+        """Test each line holds exactly the input/output pair"""
+        builder.append([{"input": "Düşük bütçe", "output": "Lean", "extra": 1}])
+
+        line = builder.path.read_text(encoding="utf-8").strip()
+        assert json.loads(line) == {"input": "Düşük bütçe", "output": "Lean"}
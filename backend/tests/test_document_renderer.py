@@ -0,0 +1,70 @@
+"""
+Test Document Renderer
+Tests for precompiled, deduplicated business documents
+"""
+
+import pytest
+
+pytest.importorskip("jinja2")
+
+from document_renderer import DocumentRenderer
+
+IDEA = {
+    "title": "Smart <Home> Energy",
+    "description": "Energy management for homes",
+    "projected_revenue_year_1": 100000,
+    "projected_revenue_year_2": 250000,
+    "projected_revenue_year_3": 500000,
+    "key_resources": ["Engineers", "Installers"],
+    "risk_level": "medium"
+}
+
+def context(idea=IDEA):
+    revenues = [idea["projected_revenue_year_1"], idea["projected_revenue_year_2"], idea["projected_revenue_year_3"]]
+    return {
+        "idea": idea,
+        "roi": {"roi_percentage": 42.0, "annualized_roi": 12.5, "payback_period": 2.5},
+        "dcf": {"npv": 150000, "irr": 18.0},
+        "revenue_years": [
+            {"year": i + 1, "revenue": revenue, "growth": (revenue / revenues[i - 1] - 1) * 100 if i else None, "margin": 15 + 5 * i}
+            for i, revenue in enumerate(revenues)
+        ]
+    }
+
+class TestDocumentRenderer:
+    """Test class for DocumentRenderer"""
+
+    @pytest.fixture
+    def renderer(self, tmp_path):
+        return DocumentRenderer(output_dir=str(tmp_path))
+
+    def test_render_escapes_and_formats(self, renderer):
+        """Test values are HTML-escaped and money/growth filters apply"""
+        html = renderer.render("business_plan.html", context())
+
+        assert "Smart &lt;Home&gt; Energy" in html
+        assert "<li>Engineers</li>" in html
+        assert "<td>$250,000</td><td>150.0%</td>" in html
+        assert "42.00%" in html
+
+    async def test_identical_documents_are_written_once(self, renderer, tmp_path):
+        """Test a repeat render returns the existing file without rewriting it"""
+        first, created = await renderer.render_to_file("business_ebook.html", context(), prefix="business_ebook_test")
+        second, created_again = await renderer.render_to_file("business_ebook.html", context(), prefix="business_ebook_test")
+
+        assert first == second
+        assert created is True and created_again is False
+        assert len(list(tmp_path.glob("business_ebook_test_*.html"))) == 1
+        assert renderer.get_stats()["deduplicated"] == 1
+        assert renderer.get_stats()["templates_compiled"] == 1
+
+    async def test_changed_content_gets_a_new_file(self, renderer, tmp_path):
+        """Test different inputs hash to different documents"""
+        first, _ = await renderer.render_to_file("business_plan.html", context(), prefix="business_plan_test")
+        second, _ = await renderer.render_to_file(
+            "business_plan.html", context(dict(IDEA, description="Solar first")), prefix="business_plan_test"
+        )
+
+        assert first != second
+        assert "Solar first" in open(second, encoding="utf-8").read()
+        assert not list(tmp_path.glob(".*.tmp"))
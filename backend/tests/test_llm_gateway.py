@@ -0,0 +1,195 @@
+"""
+Test LLM Gateway
+Tests for the shared pooled Ollama client
+"""
+
+import pytest
+import asyncio
+import json
+import httpx
+
+from llm_gateway import (
+    LLMGateway, LLMGatewayError, LLMCircuitOpenError, LLMDeadlineExceeded, CircuitBreaker, request_deadline
+)
+from llm_cache import LLMResponseCache, make_cache_key
+
+class TestLLMGateway:
+    """Test class for the LLM gateway"""
+
+    @pytest.fixture
+    def ollama_transport(self):
+        """Mock Ollama transport that echoes the requested model"""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            payload = json.loads(request.read())
+            if payload["model"] == "broken":
+                return httpx.Response(500, text="model error")
+            if payload["model"] == "slow":
+                await asyncio.sleep(0.3)
+            if payload["stream"]:
+                tokens = ['Here you go: ', '{"title": ', '"Test {Idea}"', '}', ' Hope this helps!']
+                lines = [json.dumps({"response": token, "done": False}) for token in tokens]
+                lines.append(json.dumps({"response": "", "done": True}))
+                return httpx.Response(200, content="\n".join(lines).encode())
+            return httpx.Response(200, json={"response": '{"title": "Test Idea"}', "done": True})
+
+        return httpx.MockTransport(handler)
+
+    @pytest.fixture
+    def gateway(self, ollama_transport, tmp_path):
+        """Create gateway instance bound to the mock transport"""
+        return LLMGateway(
+            base_url="http://ollama.test",
+            max_concurrency_per_model=2,
+            transport=ollama_transport,
+            cache=LLMResponseCache(path=str(tmp_path / "llm_cache.db"))
+        )
+
+    async def test_generate_returns_response_text(self, gateway):
+        """Test successful generation returns the response field"""
+        result = await gateway.generate("Hello", model="llama2")
+        assert result == '{"title": "Test Idea"}'
+
+        stats = gateway.get_stats()
+        assert stats["models"]["llama2"]["requests"] == 1
+        assert stats["models"]["llama2"]["errors"] == 0
+        await gateway.aclose()
+
+    async def test_generate_raises_on_error_status(self, gateway):
+        """Test non-200 responses raise LLMGatewayError"""
+        with pytest.raises(LLMGatewayError) as exc_info:
+            await gateway.generate("Hello", model="broken")
+
+        assert exc_info.value.status_code == 500
+        assert gateway.get_stats()["models"]["broken"]["errors"] == 1
+        await gateway.aclose()
+
+    async def test_client_is_reused_across_calls(self, gateway):
+        """Test the pooled client is shared between concurrent calls"""
+        client = gateway.get_client()
+        await asyncio.gather(*(gateway.generate(f"Prompt {i}") for i in range(6)))
+
+        assert gateway.get_client() is client
+        assert gateway.get_stats()["models"]["llama2"]["requests"] == 6
+        await gateway.aclose()
+
+    async def test_repeated_prompt_is_served_from_cache(self, gateway):
+        """Test identical prompts only reach Ollama once unless bypassed"""
+        await gateway.generate("Same prompt")
+        await gateway.generate("Same prompt")
+        assert gateway.get_stats()["models"]["llama2"]["requests"] == 1
+        assert gateway.cache.stats["hits"] == 1
+
+        await gateway.generate("Same prompt", use_cache=False)
+        assert gateway.get_stats()["models"]["llama2"]["requests"] == 2
+        await gateway.aclose()
+
+    async def test_stream_returns_first_json_object(self, gateway):
+        """Test streamed generation stops at the closing brace of the first object"""
+        result = await gateway.generate_json_stream("Stream please", model="llama3.2")
+
+        assert json.loads(result) == {"title": "Test {Idea}"}
+        stats = gateway.get_stats()["models"]["llama3.2"]
+        assert stats["requests"] == 1
+        assert stats["average_time_to_first_token"] > 0
+        await gateway.aclose()
+
+    async def test_deadline_serves_fallback_and_warms_cache(self, gateway):
+        """Test a slow model call raises at the deadline but still lands in the cache"""
+        with request_deadline(0.05):
+            with pytest.raises(LLMDeadlineExceeded):
+                await gateway.generate("Slow prompt", model="slow")
+
+        # Let the background call finish
+        await asyncio.sleep(0.5)
+
+        with request_deadline(0.05):
+            result = await gateway.generate("Slow prompt", model="slow")
+        assert result == '{"title": "Test Idea"}'
+        assert gateway.get_stats()["models"]["slow"]["requests"] == 1
+        await gateway.aclose()
+
+    async def test_breaker_opens_after_consecutive_failures(self, ollama_transport, tmp_path):
+        """Test calls short-circuit once the failure threshold is reached"""
+        gateway = LLMGateway(
+            base_url="http://ollama.test",
+            transport=ollama_transport,
+            cache=LLMResponseCache(path=str(tmp_path / "llm_cache.db")),
+            breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        )
+        for _ in range(2):
+            with pytest.raises(LLMGatewayError):
+                await gateway.generate("Hello", model="broken")
+
+        assert not gateway.is_available()
+        with pytest.raises(LLMCircuitOpenError):
+            await gateway.generate("Hello", model="llama2")
+        assert gateway.get_stats()["models"]["broken"]["requests"] == 2
+        assert "llama2" not in gateway.get_stats()["models"]
+        await gateway.aclose()
+
+    def test_breaker_half_open_recovery(self):
+        """Test a healthy probe lets trial calls through and successes close the circuit"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, half_open_max_calls=1, success_threshold=1)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.record_probe(healthy=True)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+class TestLLMResponseCache:
+    """Test class for the disk-backed LLM response cache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a small cache instance for testing"""
+        return LLMResponseCache(path=str(tmp_path / "llm_cache.db"), ttl=3600, max_entries=3, max_bytes=1024 * 1024)
+
+    def test_key_depends_on_model_prompt_and_params(self):
+        """Test cache keys change with any request component"""
+        base = make_cache_key("llama2", "prompt", {"temperature": 0.7})
+        assert base == make_cache_key("llama2", "prompt", {"temperature": 0.7})
+        assert base != make_cache_key("llama3.2", "prompt", {"temperature": 0.7})
+        assert base != make_cache_key("llama2", "other prompt", {"temperature": 0.7})
+        assert base != make_cache_key("llama2", "prompt", {"temperature": 0.2})
+
+    def test_lru_eviction(self, cache):
+        """Test least recently used entries are evicted first"""
+        for key in ("a", "b", "c"):
+            cache.set(key, f"value-{key}")
+        assert cache.get("a") == "value-a"
+
+        cache.set("d", "value-d")
+        assert cache.get("b") is None
+        assert cache.get("a") == "value-a"
+        assert cache.get_stats()["entries"] == 3
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test entries older than the TTL are not served"""
+        cache = LLMResponseCache(path=str(tmp_path / "ttl.db"), ttl=1)
+        cache.set("key", "value")
+        cache._get_connection().execute("UPDATE llm_cache SET created_at = created_at - 10")
+        assert cache.get("key") is None
+
+    async def test_async_access_runs_off_the_event_loop(self, cache):
+        """Test aget/aset do their SQLite work on the cache worker thread"""
+        import threading
+
+        loop_thread = threading.get_ident()
+        threads = []
+        original_get = cache.get
+
+        def tracking_get(key, model="unknown"):
+            threads.append(threading.get_ident())
+            return original_get(key, model)
+
+        cache.get = tracking_get
+        assert await cache.aset("key", "value") is True
+        assert await cache.aget("key") == "value"
+        assert threads and loop_thread not in threads
+        cache.close()
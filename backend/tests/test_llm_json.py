@@ -0,0 +1,85 @@
+"""
+Test LLM JSON Extraction
+Tests for the shared completion-to-JSON parser
+"""
+
+import pytest
+
+from llm_json import LLMJSONParser, IncrementalJSONScanner, iter_json_spans, strip_trailing_commas
+
+class TestLLMJSONParser:
+    """Test class for LLM JSON extraction"""
+
+    @pytest.fixture
+    def parser(self):
+        """Create a parser with fresh stats"""
+        return LLMJSONParser()
+
+    def test_extracts_object_from_fenced_chatter(self, parser):
+        """Test code fences, surrounding prose and trailing commas are tolerated"""
+        text = 'Sure! Here it is:\n```json\n{"title": "Grow {fast}", "hashtags": ["#a", "#b",],}\n```\nEnjoy!'
+        data = parser.extract(text, "niche_idea")
+
+        assert data == {"title": "Grow {fast}", "hashtags": ["#a", "#b"]}
+        assert parser.get_stats()["niche_idea"]["repaired"] == 1
+
+    def test_skips_objects_that_fail_schema(self, parser):
+        """Test the first schema-conformant object wins"""
+        text = '{"note": "draft"} and the final answer {"quality_score": "0.9"}'
+        assert parser.extract(text, "quality_assessment") == {"quality_score": 0.9}
+
+        assert parser.extract('{"quality_score": "high"}', "quality_assessment") is None
+        stats = parser.get_stats()["quality_assessment"]
+        assert stats["success"] == 1
+        assert stats["invalid"] == 1
+        assert stats["success_rate"] == 50.0
+
+    def test_array_schemas_wrap_and_unwrap(self, parser):
+        """Test array outputs accept a lone item or an {"ideas": [...]} wrapper"""
+        assert parser.extract('Trends: [{"trend_name": "A"}, {"trend_name": "B"}]', "trends") == [
+            {"trend_name": "A"}, {"trend_name": "B"}
+        ]
+        assert parser.extract('{"trend_name": "Solo"}', "trends") == [{"trend_name": "Solo"}]
+        assert parser.extract('{"ideas": [{"title": "x"}]}', "niche_batch") == [{"title": "x"}]
+
+    def test_quoted_numbers_are_converted(self, parser):
+        """Test numeric strings that pass validation come back as floats"""
+        data = parser.extract('{"title": "x", "viral_potential": "0.8", "estimated_revenue": "$1,200"}', "niche_idea")
+
+        assert data["viral_potential"] == 0.8
+        assert data["estimated_revenue"] == 1200.0
+        assert isinstance(data["estimated_revenue"], float)
+
+        ideas = parser.extract('[{"title": "a", "estimated_revenue": "$50"}]', "content_ideas")
+        assert ideas == [{"title": "a", "estimated_revenue": 50.0}]
+
+    def test_batch_keeps_positions_of_malformed_items(self, parser):
+        """Test a bad item in a partial array becomes None instead of rejecting the batch"""
+        text = '[{"title": "a", "viral_potential": "0.9"}, {"title": "b", "viral_potential": "high"}, {"title": "c"}]'
+
+        assert parser.extract(text, "niche_batch") == [{"title": "a", "viral_potential": 0.9}, None, {"title": "c"}]
+        assert parser.extract('[{"title": "b", "estimated_revenue": "lots"}]', "niche_batch") is None
+
+    def test_no_json_is_recorded(self, parser):
+        """Test plain text counts as a failed parse"""
+        assert parser.extract("I cannot help with that.", "business_idea") is None
+        assert parser.get_stats()["business_idea"]["no_json"] == 1
+
+    def test_span_scan_and_comma_repair_respect_strings(self):
+        """Test brackets and commas inside string literals are left alone"""
+        assert list(iter_json_spans('x {"a": "}"} y [1, [2]] {"b"')) == ['{"a": "}"}', '[1, [2]]']
+        assert strip_trailing_commas('{"a": ",]", "b": [1, 2,],}') == '{"a": ",]", "b": [1, 2]}'
+
+    def test_span_scan_survives_many_mismatched_brackets(self):
+        """Test mismatched brackets are skipped iteratively, without recursion"""
+        text = '{]' * 5000 + ' {"ok": [1]} ' + '[}' * 5000
+
+        assert list(iter_json_spans(text)) == ['{"ok": [1]}']
+        assert list(iter_json_spans('{"a": [1}, {"b": 2}')) == ['{"b": 2}']
+
+    def test_incremental_scanner_stops_at_first_object(self):
+        """Test the streaming scanner completes on the closing brace"""
+        scanner = IncrementalJSONScanner()
+        assert not scanner.feed('Here: {"title": "a}')
+        assert scanner.feed('b"} trailing')
+        assert scanner.result() == '{"title": "a}b"}'
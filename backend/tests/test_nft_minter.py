@@ -0,0 +1,89 @@
+"""
+Test NFT Minter
+Tests for pipelined batch minting against an in-process eth-tester chain
+"""
+
+import pytest
+
+pytest.importorskip("eth_tester")
+web3 = pytest.importorskip("web3")
+from eth_account import Account
+
+from nft_minter import BatchMinter, MintRequest
+
+CONTRACT_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+class TestBatchMinter:
+    """Test class for BatchMinter"""
+
+    @pytest.fixture
+    def w3(self):
+        """Fresh in-process chain"""
+        return web3.Web3(web3.EthereumTesterProvider())
+
+    @pytest.fixture
+    def account(self, w3):
+        """Funded minting account"""
+        account = Account.create()
+        w3.eth.send_transaction({"from": w3.eth.accounts[0], "to": account.address, "value": 10 * 10**18})
+        return account
+
+    @pytest.fixture
+    def minter(self, w3, account):
+        """Minter polling quickly for the auto-mining test chain"""
+        minter = BatchMinter(w3, account.key.hex(), CONTRACT_ADDRESS, max_concurrency=8, max_retries=3,
+                             receipt_timeout=5, poll_interval=0.01)
+        yield minter
+        minter.shutdown()
+
+    @staticmethod
+    def requests(count, start=1):
+        return [MintRequest(token_id=i, metadata_uri=f"ipfs://metadata/{i}.json") for i in range(start, start + count)]
+
+    async def test_batch_uses_consecutive_local_nonces(self, minter, w3, account):
+        """Test a batch mints every token on consecutive nonces and reports throughput"""
+        report = await minter.mint_batch(self.requests(25))
+
+        assert report["minted"] == 25
+        assert report["failed"] == 0
+        assert [result.nonce for result in report["results"]] == list(range(25))
+        assert all(result.block_number is not None for result in report["results"])
+        assert report["mints_per_minute"] > 0
+        assert w3.eth.get_transaction_count(account.address) == 25
+        assert minter.get_stats()["next_nonce"] == 25
+
+    async def test_underpriced_send_is_repriced(self, minter, w3):
+        """Test a gas price rejection re-signs the same nonce at a higher price"""
+        send_raw = minter._send_raw
+        calls = []
+
+        def flaky_send(signed):
+            calls.append(signed)
+            if len(calls) == 1:
+                raise ValueError({"code": -32000, "message": "transaction underpriced"})
+            return send_raw(signed)
+
+        minter._send_raw = flaky_send
+        report = await minter.mint_batch(self.requests(1))
+        result = report["results"][0]
+
+        assert result.status == "minted"
+        assert result.attempts == 2
+        assert result.gas_price > w3.eth.gas_price
+        assert minter.get_stats()["retries"] == 1
+
+    async def test_stale_nonce_is_resynced(self, minter, w3, account):
+        """Test a transaction sent outside the minter does not break the next batch"""
+        await minter.mint_batch(self.requests(2))
+
+        external = account.sign_transaction({
+            "to": account.address, "value": 0, "gas": 21000, "gasPrice": w3.eth.gas_price,
+            "nonce": w3.eth.get_transaction_count(account.address), "chainId": w3.eth.chain_id
+        })
+        w3.eth.send_raw_transaction(external.rawTransaction)
+
+        report = await minter.mint_batch(self.requests(2, start=3))
+
+        assert report["minted"] == 2
+        assert [result.nonce for result in report["results"]] == [3, 4]
+        assert minter.get_stats()["nonce_resyncs"] == 1
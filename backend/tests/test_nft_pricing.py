@@ -0,0 +1,118 @@
+"""
+Test NFT Pricing
+Tests for the local vectorized NFT pricing model
+"""
+
+import time
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nft_pricing import NFTPricingModel, pricing_features, rule_based_price, STYLES
+
+def make_features(rng, style=None, rarity_level="Epic"):
+    return {
+        "rarity_score": rng.random(),
+        "style": style or rng.choice(STYLES),
+        "effects": rng.randint(1, 6),
+        "ai_enhanced": rng.random() > 0.3,
+        "duration": rng.choice([15, 30, 60, 120, 300]),
+        "rarity_level": rarity_level,
+        "base_price": 1.5
+    }
+
+class FakeMetadata:
+    """Just the NFTMetadata fields pricing reads"""
+    def __init__(self, attributes, rarity_score=0.8, ai_generated=True):
+        self.attributes = attributes
+        self.rarity_score = rarity_score
+        self.ai_generated = ai_generated
+
+class TestNFTPricingModel:
+    """Test class for NFTPricingModel"""
+
+    @pytest.fixture
+    def rng(self):
+        return random.Random(7)
+
+    def test_features_from_metadata(self):
+        """Test attributes are parsed into numeric pricing features"""
+        metadata = FakeMetadata([
+            {"trait_type": "Style", "value": "Action"},
+            {"trait_type": "Effects", "value": 3},
+            {"trait_type": "Duration", "value": 120},
+            {"trait_type": "Rarity", "value": "Legendary"},
+            {"trait_type": "Base Price", "value": "2.0 ETH"}
+        ])
+        features = pricing_features(metadata)
+
+        assert features["style"] == "Action"
+        assert features["duration"] == 120
+        assert features["base_price"] == 2.0
+        assert rule_based_price(features) == pytest.approx(2.0 * 2.0 * 1.3 * 1.4)
+
+    def test_untrained_model_matches_rule_based_price(self, rng):
+        """Test the model falls back to the heuristic until it has sales"""
+        model = NFTPricingModel()
+        rows = [make_features(rng) for _ in range(20)]
+        prices = model.predict_many(rows)["prices"]
+
+        assert np.allclose(prices, [rule_based_price(row) for row in rows])
+        assert model.maybe_fit([{"pricing_features": rows[0]}]) is False
+        assert model.weights is None
+
+    def test_sales_recorded_after_prediction_trigger_a_refit(self, rng):
+        """Test predict, then record sales on existing history, then predict again learns from them"""
+        model = NFTPricingModel(min_samples=10, refit_every=25)
+        history = [{"production_id": f"prod_{i}", "pricing_features": make_features(rng)} for i in range(30)]
+
+        assert model.maybe_fit(history) is False
+        untrained = model.predict_many([history[0]["pricing_features"]])["prices"][0]
+
+        # Sales land on existing minting records, the history does not grow
+        for record in history:
+            record["sale_price"] = rule_based_price(record["pricing_features"]) * 2.0
+
+        assert model.maybe_fit(history) is True
+        assert model.weights is not None
+        assert model.predict_many([history[0]["pricing_features"]])["prices"][0] > untrained * 1.5
+        assert model.maybe_fit(history) is False
+
+    def test_learns_style_premium_from_sales(self, rng):
+        """Test realized sale prices shift predictions per style"""
+        records = []
+        for i in range(400):
+            features = make_features(rng)
+            premium = 1.8 if features["style"] == "Sci-Fi" else 1.0
+            records.append({
+                "production_id": f"prod_{i}",
+                "pricing_features": features,
+                "sale_price": rule_based_price(features) * premium * rng.uniform(0.95, 1.05)
+            })
+
+        model = NFTPricingModel(l2=0.1)
+        assert model.fit(records) == 400
+
+        sci_fi = make_features(rng, style="Sci-Fi")
+        action = dict(sci_fi, style="Action")
+        prices = model.predict_many([sci_fi, action])["prices"]
+
+        assert prices[0] / prices[1] == pytest.approx(1.8, rel=0.1)
+        assert model.get_stats()["trained"] is True
+        assert model.residual_std < 0.1
+
+    def test_predict_many_is_fast(self, rng):
+        """Test pricing 5,000 items takes milliseconds"""
+        model = NFTPricingModel(min_samples=5)
+        model.fit([{"pricing_features": make_features(rng), "sale_price": rng.uniform(0.5, 5)} for _ in range(100)])
+        rows = [make_features(rng) for _ in range(5000)]
+
+        started = time.perf_counter()
+        batch = model.predict_many(rows)
+        elapsed = time.perf_counter() - started
+
+        assert batch["prices"].shape == (5000,)
+        assert np.all(batch["prices"] > 0)
+        assert np.all((batch["confidence"] > 0) & (batch["confidence"] <= 1))
+        assert elapsed < 0.5
@@ -0,0 +1,88 @@
+"""
+Test NFT Rarity
+Tests for collection-level statistical rarity scoring
+"""
+
+import time
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nft_rarity import CollectionRarity
+
+def nft(**traits):
+    return {"attributes": [{"trait_type": trait_type, "value": value} for trait_type, value in traits.items()]}
+
+class TestCollectionRarity:
+    """Test class for CollectionRarity"""
+
+    @pytest.fixture
+    def collection(self):
+        collection = CollectionRarity()
+        collection.add([
+            nft(Style="Action", Effects=3),
+            nft(Style="Action", Effects=3),
+            nft(Style="Action", Effects=4),
+            nft(Style="Sci-Fi", Effects=3)
+        ], ids=["a", "b", "c", "d"])
+        return collection
+
+    def test_scores_are_inverse_trait_frequencies(self, collection):
+        """Test each score sums 1 / frequency over trait types"""
+        scores = collection.scores()
+
+        assert scores[0] == pytest.approx(4 / 3 + 4 / 3)
+        assert scores[2] == pytest.approx(4 / 3 + 4 / 1)
+        assert scores[3] == pytest.approx(4 / 1 + 4 / 3)
+        assert collection.frequency_table() == {"Style": {"Action": 3, "Sci-Fi": 1}, "Effects": {"3": 3, "4": 1}}
+
+    def test_ranks_share_ties(self, collection):
+        """Test rank 1 is rarest and identical trait sets share a rank"""
+        assert list(collection.ranks()) == [3, 3, 1, 1]
+        assert collection.item("c")["rank"] == 1
+        assert collection.item("a")["percentile"] == pytest.approx(0.5)
+
+    def test_incremental_updates_rescore_everyone(self, collection):
+        """Test adding items updates counts, adds new traits and changes existing scores"""
+        before = collection.item("d")["score"]
+        collection.add([nft(Style="Sci-Fi", Effects=3, Background="Gold")], ids=["e"])
+
+        assert len(collection) == 5
+        assert collection.frequency_table()["Style"]["Sci-Fi"] == 2
+        assert collection.frequency_table()["Background"] == {"Gold": 1, "None": 4}
+        assert collection.item("e")["rank"] == 1
+        assert collection.item("d")["score"] != before
+
+    def test_ignored_traits_do_not_score(self):
+        """Test derived rarity traits are left out"""
+        collection = CollectionRarity()
+        collection.add([nft(Style="Action", Rarity="Legendary"), nft(Style="Action", Rarity="Rare")])
+
+        assert "Rarity" not in collection.frequency_table()
+        assert collection.scores()[0] == collection.scores()[1]
+
+    def test_scales_to_100k_items(self):
+        """Test a 100k-item collection builds and rescores quickly"""
+        rng = random.Random(3)
+        palette = {f"Trait {t}": [f"v{i}" for i in range(2 + t * 3)] for t in range(8)}
+        items = [nft(**{trait: rng.choice(values) for trait, values in palette.items()}) for _ in range(100_000)]
+
+        collection = CollectionRarity()
+        started = time.perf_counter()
+        for i in range(0, len(items), 10_000):
+            collection.add(items[i:i + 10_000])
+        ranks = collection.ranks()
+        elapsed = time.perf_counter() - started
+
+        assert len(collection) == 100_000
+        assert ranks.min() == 1
+        assert sum(collection.frequency_table()["Trait 0"].values()) == 100_000
+
+        started = time.perf_counter()
+        collection.add([nft(**{trait: values[0] for trait, values in palette.items()})])
+        collection.scores()
+        rescore = time.perf_counter() - started
+
+        assert elapsed < 10
+        assert rescore < 0.5
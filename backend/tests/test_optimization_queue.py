@@ -0,0 +1,69 @@
+"""
+Test Optimization Queue
+Tests for the prioritized, rate-limited content optimization queue
+"""
+
+import asyncio
+import pytest
+
+from optimization_queue import OptimizationQueue, RateLimiter
+
+class TestOptimizationQueue:
+    """Test class for the optimization queue"""
+
+    @pytest.fixture
+    def queue(self):
+        return OptimizationQueue(threshold=0.6, workers=2, rate_per_minute=0)
+
+    def test_pops_worst_quality_then_highest_revenue(self, queue):
+        """Test ordering by quality score, ties broken by revenue impact"""
+        queue.upsert("a", "a", 0.5, 10.0)
+        queue.upsert("b", "b", 0.2, 1.0)
+        queue.upsert("c", "c", 0.5, 100.0)
+
+        assert [queue.pop()[0] for _ in range(3)] == ["b", "c", "a"]
+        assert queue.pop() is None
+
+    def test_score_changes_reprioritize_or_remove(self, queue):
+        """Test upserts replace stale entries and passing items leave the queue"""
+        queue.upsert("a", "a", 0.1)
+        queue.upsert("b", "b", 0.3)
+        queue.upsert("a", "a", 0.4)
+        queue.upsert("b", "b", 0.9)
+
+        assert len(queue) == 1
+        assert queue.pop()[0] == "a"
+        assert queue.pop() is None
+
+    async def test_workers_drain_and_requeue_until_threshold(self, queue):
+        """Test workers run concurrently and re-queue items still below the threshold"""
+        scores = {"a": 0.1, "b": 0.4, "c": 0.55}
+        for item_id, score in scores.items():
+            queue.upsert(item_id, item_id, score)
+
+        async def handler(item_id):
+            await asyncio.sleep(0.01)
+            scores[item_id] = round(scores[item_id] + 0.1, 2)
+            queue.upsert(item_id, item_id, scores[item_id])
+
+        task = asyncio.create_task(queue.run(handler))
+        for _ in range(200):
+            if not len(queue) and not queue.get_stats()["in_flight"]:
+                break
+            await asyncio.sleep(0.01)
+        queue.stop()
+        await task
+
+        assert all(score >= 0.6 for score in scores.values())
+        stats = queue.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["optimized"] == 5 + 2 + 1
+
+    async def test_rate_limiter_spaces_acquisitions(self):
+        """Test the token bucket holds callers to the configured rate"""
+        limiter = RateLimiter(rate_per_minute=600, burst=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            await limiter.acquire()
+        assert loop.time() - started >= 0.18
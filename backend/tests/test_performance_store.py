@@ -0,0 +1,73 @@
+"""
+Test Performance Store
+Tests for the append-only content performance log
+"""
+
+import json
+import pytest
+
+from performance_store import PerformanceStore
+
+class TestPerformanceStore:
+    """Test class for the performance store"""
+
+    @pytest.fixture
+    def store_path(self, tmp_path):
+        return str(tmp_path / "performance.jsonl")
+
+    @pytest.fixture
+    def store(self, store_path):
+        return PerformanceStore(path=store_path, legacy_csv_path=None)
+
+    def test_updates_append_only_changed_fields(self, store, store_path):
+        """Test an update writes a small delta instead of rewriting the record"""
+        store.put({"content_id": "yt_1", "title": "Hook", "views": "1200", "quality_score": 0.5, "unknown": "dropped"})
+        store.update("yt_1", quality_score=0.6, title="Hook")
+
+        with open(store_path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 2
+        assert "unknown" not in lines[0] and lines[0]["views"] == 1200
+        assert set(lines[1]) == {"op", "content_id", "quality_score", "updated_at"}
+        assert store.get("yt_1")["quality_score"] == 0.6
+
+    def test_index_is_rebuilt_from_log(self, store, store_path):
+        """Test a new instance replays puts and deltas"""
+        store.put({"content_id": "a", "channel": "TikTok", "views": 10})
+        store.put({"content_id": "b", "channel": "youtube", "views": 20})
+        store.update("a", views=15)
+        store.close()
+
+        reopened = PerformanceStore(path=store_path, legacy_csv_path=None)
+        assert len(reopened) == 2
+        assert reopened.get("a")["views"] == 15
+        assert [r["content_id"] for r in reopened.records(channel="tiktok")] == ["a"]
+        assert reopened.update("missing", views=1) is None
+
+    def test_compaction_on_load(self, store, store_path):
+        """Test a log dominated by deltas is compacted to one line per record"""
+        store.put({"content_id": "a", "views": 0})
+        for views in range(1, 10):
+            store.update("a", views=views)
+        store.close()
+
+        reopened = PerformanceStore(path=store_path, compact_ratio=3.0, legacy_csv_path=None)
+        assert reopened.get("a")["views"] == 9
+        assert reopened.get_stats()["log_lines"] == 1
+        with open(store_path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 1
+
+    def test_legacy_csv_import(self, tmp_path):
+        """Test both old CSV column layouts are mapped onto the fixed schema"""
+        legacy = tmp_path / "legacy.csv"
+        legacy.write_text(
+            "content_id,title,channel,viral_potential,quality_score,mock_views,mock_engagement_rate,mock_revenue,created_at,performance_date\n"
+            "tiktok_1,Clip,tiktok,0.8,0.7,5000,0.06,3.0,2025-08-04T08:00:00,2025-08-04T08:00:00\n",
+            encoding="utf-8"
+        )
+        store = PerformanceStore(path=str(tmp_path / "performance.jsonl"), legacy_csv_path=str(legacy))
+
+        record = store.get("tiktok_1")
+        assert record["views"] == 5000
+        assert record["revenue"] == 3.0
+        assert record["source"] == "legacy_csv"
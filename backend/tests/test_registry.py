@@ -0,0 +1,84 @@
+"""
+Test Service Registry
+Tests for lazily built, process-wide services
+"""
+
+import pytest
+
+from registry import ServiceRegistry
+
+class Counter:
+    """Service that counts its own constructions"""
+    built = 0
+
+    def __init__(self):
+        Counter.built += 1
+        self.value = 1
+
+class TestServiceRegistry:
+    """Test class for the service registry"""
+
+    @pytest.fixture
+    def registry(self):
+        Counter.built = 0
+        return ServiceRegistry()
+
+    def test_register_does_not_build(self, registry):
+        """Test registration and the proxy stay lazy until first attribute access"""
+        proxy = registry.register("counter", Counter)
+
+        assert Counter.built == 0
+        assert not registry.is_initialized("counter")
+        assert "lazy" in repr(proxy)
+
+        assert proxy.value == 1
+        assert Counter.built == 1
+        assert registry.get_stats()["services"]["counter"]["initialized"]
+
+    def test_instance_is_shared(self, registry):
+        """Test every lookup returns the same instance"""
+        proxy = registry.register("counter", Counter)
+        proxy.value = 5
+
+        assert registry.get("counter") is registry.get("counter")
+        assert registry.get("counter").value == 5
+        assert Counter.built == 1
+
+    def test_factories_can_resolve_other_services(self, registry):
+        """Test nested resolution during construction"""
+        registry.register("counter", Counter)
+        registry.register("pair", lambda: (registry.get("counter"), registry.get("counter")))
+
+        first, second = registry.get("pair")
+        assert first is second
+        assert registry.get_stats()["initialized"] == 2
+
+    def test_override_and_reset(self, registry):
+        """Test replacing and rebuilding instances"""
+        registry.register("counter", Counter)
+        registry.override("counter", "stub")
+        assert registry.get("counter") == "stub"
+
+        registry.reset("counter")
+        assert isinstance(registry.get("counter"), Counter)
+
+    def test_unknown_service(self, registry):
+        """Test lookups of unregistered names fail clearly"""
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+    def test_proxy_passes_isinstance_and_truthiness(self, registry):
+        """Test the proxy reports the service's class and forwards common dunders"""
+        proxy = registry.register("counter", Counter)
+        empty = registry.register("empty", list)
+
+        assert isinstance(proxy, Counter)
+        assert proxy.__class__ is Counter
+        assert bool(proxy) is True
+        assert Counter.built == 1
+
+        assert not empty
+        empty.append("item")
+        assert len(empty) == 1 and "item" in empty and list(empty) == ["item"]
+        assert empty[0] == "item"
+        assert empty == ["item"]
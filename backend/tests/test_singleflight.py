@@ -0,0 +1,110 @@
+"""
+Test Singleflight
+Tests for in-process and Redis-coordinated call coalescing
+"""
+
+import json
+import pytest
+import asyncio
+
+from singleflight import SingleFlight
+
+class FakeRedis:
+    """In-memory client whose operations can be made to fail"""
+
+    def __init__(self):
+        self.data = {}
+        self.fail_on = set()
+        self.calls = 0
+
+    def _maybe_fail(self, op):
+        self.calls += 1
+        if op in self.fail_on:
+            raise ConnectionError(f"redis {op} down")
+
+    async def get(self, key):
+        self._maybe_fail("get")
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None):
+        self._maybe_fail("set_result" if ":result:" in key else "set")
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        self._maybe_fail("delete")
+        self.data.pop(key, None)
+
+    async def exists(self, key):
+        self._maybe_fail("exists")
+        return key in self.data
+
+class TestSingleFlight:
+    """Test class for SingleFlight"""
+
+    @pytest.fixture
+    def redis(self):
+        return FakeRedis()
+
+    @pytest.fixture
+    def flight(self, redis):
+        flight = SingleFlight("test", result_ttl=0.0, redis_backoff=10.0)
+        flight.use_redis = True
+        flight._get_redis = lambda: redis
+        return flight
+
+    @pytest.fixture
+    def counter(self):
+        state = {"calls": 0}
+
+        async def func():
+            state["calls"] += 1
+            await asyncio.sleep(0.01)
+            return {"value": state["calls"]}
+
+        state["func"] = func
+        return state
+
+    async def test_concurrent_callers_share_one_call(self, counter):
+        """Test identical in-process calls run once"""
+        flight = SingleFlight("test", use_redis=False)
+        results = await asyncio.gather(*(flight.do("k", counter["func"]) for _ in range(5)))
+
+        assert counter["calls"] == 1
+        assert all(result == {"value": 1} for result in results)
+        assert flight.stats["shared"] == 4
+
+    @pytest.mark.parametrize("failing_op", ["set_result", "delete"])
+    async def test_redis_failure_after_call_does_not_rerun_it(self, flight, redis, counter, failing_op):
+        """Test a publish or unlock error returns the leader's value instead of calling again"""
+        redis.fail_on.add(failing_op)
+        result = await flight.do("k", counter["func"], encode=json.dumps, decode=json.loads)
+
+        assert result == {"value": 1}
+        assert counter["calls"] == 1
+        assert flight.get_stats()["redis_errors"] == 1
+
+    async def test_unreachable_redis_backs_off(self, flight, redis, counter):
+        """Test Redis is not retried on every call while it is down"""
+        redis.fail_on.add("get")
+        await flight.do("a", counter["func"], encode=json.dumps, decode=json.loads)
+        calls_after_failure = redis.calls
+        await flight.do("b", counter["func"], encode=json.dumps, decode=json.loads)
+
+        assert counter["calls"] == 2
+        assert redis.calls == calls_after_failure
+        assert flight.get_stats()["redis_errors"] == 1
+
+    async def test_leader_errors_are_not_retried(self, flight):
+        """Test an exception from func propagates once"""
+        calls = []
+
+        async def broken():
+            calls.append(1)
+            raise ValueError("model failed")
+
+        with pytest.raises(ValueError):
+            await flight.do("k", broken, encode=json.dumps, decode=json.loads)
+        assert len(calls) == 1
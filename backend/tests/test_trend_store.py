@@ -0,0 +1,65 @@
+"""
+Test Trend Store
+Tests for the bounded, indexed trend store used in prompt optimization
+"""
+
+import pytest
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List
+
+from trend_store import TrendStore
+
+@dataclass
+class Trend:
+    trend_name: str
+    category: str
+    impact_score: float
+    platform_optimization: List[str]
+    content_adaptation: str = "Adapt it"
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+class TestTrendStore:
+    """Test class for the trend store"""
+
+    @pytest.fixture
+    def store(self):
+        """Create a store with a video scope"""
+        return TrendStore(scopes={"video": ["TikTok", "YouTube Shorts"]}, max_trends=3, top_k=2, half_life_days=30)
+
+    def test_dedupes_on_trend_name(self, store):
+        """Test re-adding a trend replaces it and moves its index entries"""
+        store.extend([Trend("Short Video", "Video", 0.5, ["TikTok"])])
+        store.extend([Trend("short  video", "Video", 0.9, ["LinkedIn"])])
+
+        assert len(store) == 1
+        assert store.top(platforms=["TikTok"]) == []
+        assert store.top(platforms=["linkedin"])[0].impact_score == 0.9
+
+    def test_bounded_by_decayed_score(self, store):
+        """Test eviction drops the weakest trend after decay"""
+        old = datetime.utcnow() - timedelta(days=90)
+        store.extend([
+            Trend("Old Giant", "A", 0.99, ["TikTok"], created_at=old),
+            Trend("Fresh", "A", 0.6, ["TikTok"]),
+            Trend("Newer", "B", 0.7, ["TikTok"]),
+            Trend("Newest", "B", 0.8, ["TikTok"]),
+        ])
+
+        assert len(store) == 3
+        assert "Old Giant" not in [t.trend_name for t in store]
+        assert [t.trend_name for t in store.top(category="b")] == ["Newest", "Newer"]
+
+    def test_prompt_fragment_per_scope(self, store):
+        """Test scope fragments include platform-agnostic trends and are prebuilt"""
+        store.extend([
+            Trend("Shorts", "Video", 0.8, ["YouTube Shorts"]),
+            Trend("AI Everything", "Tech", 0.9, ["All platforms"]),
+            Trend("B2B Threads", "Text", 0.95, ["LinkedIn"]),
+        ])
+
+        fragment = store.prompt_fragment("video")
+        assert fragment.index("AI Everything") < fragment.index("Shorts")
+        assert "B2B Threads" not in fragment
+        assert "B2B Threads" in store.prompt_fragment("unknown")
+        assert store.prompt_fragment("video") is fragment
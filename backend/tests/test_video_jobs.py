@@ -0,0 +1,105 @@
+"""
+Test Video Jobs
+Tests for the render job queue: job handles, progress and cancellation
+"""
+
+import time
+import threading
+import pytest
+
+from video_jobs import VideoRenderQueue, RenderCancelled
+
+# Lets a test hold renders until it has inspected the queue
+release = threading.Event()
+
+def fake_render(job_id, output_path, script, duration, fps, size, progress, cancelled):
+    """Stand-in for render_job that reports one progress step per second of video"""
+    total_frames = duration * fps
+    for second in range(1, duration + 1):
+        release.wait(5)
+        progress[job_id] = second * fps
+        if cancelled.get(job_id):
+            raise RenderCancelled(job_id)
+    return {"frames": total_frames, "redraws": duration}
+
+def failing_render(job_id, output_path, script, duration, fps, size, progress, cancelled):
+    raise RuntimeError("codec missing")
+
+class TestVideoRenderQueue:
+    """Test class for VideoRenderQueue"""
+
+    @pytest.fixture
+    def queue(self):
+        """Thread-backed queue so the fake render shares the test's memory"""
+        release.set()
+        queue = VideoRenderQueue(max_workers=1, use_processes=False, render_fn=fake_render, max_jobs=10)
+        yield queue
+        release.set()
+        queue.shutdown()
+
+    async def test_submit_returns_handle_immediately(self, queue):
+        """Test submit returns a queued job and wait reports completion"""
+        release.clear()
+        job = queue.submit("Epic empire story", 3, "/tmp/video.mp4", fps=24)
+
+        assert job.status == "queued"
+        assert job.total_frames == 72
+        assert queue.get(job.job_id) is job
+
+        release.set()
+        finished = await queue.wait(job.job_id)
+        assert finished.status == "completed"
+        assert finished.frames_written == 72
+        assert finished.progress == 1.0
+        assert finished.stats == {"frames": 72, "redraws": 3}
+
+    async def test_cancel_queued_job(self, queue):
+        """Test a job still waiting for a worker is cancelled outright"""
+        release.clear()
+        running = queue.submit("first", 2, "/tmp/a.mp4", job_id="first")
+        waiting = queue.submit("second", 2, "/tmp/b.mp4", job_id="second")
+
+        assert queue.cancel("second") is True
+        assert waiting.status == "cancelled"
+
+        release.set()
+        assert await queue.wait("first") is running
+        assert running.status == "completed"
+        assert queue.cancel("first") is False
+
+    async def test_cancel_running_job(self, queue):
+        """Test a running job stops at its next progress report"""
+        release.clear()
+        job = queue.submit("long story", 30, "/tmp/long.mp4", job_id="long")
+        while queue._futures["long"].running() is False:
+            time.sleep(0.01)
+
+        assert queue.cancel("long") is True
+        assert job.status == "cancelling"
+
+        release.set()
+        finished = await queue.wait("long")
+        assert finished.status == "cancelled"
+        assert finished.frames_written < finished.total_frames
+
+    async def test_failed_render_and_callback(self):
+        """Test failures are recorded and on_done sees the final job"""
+        queue = VideoRenderQueue(max_workers=1, use_processes=False, render_fn=failing_render)
+        seen = []
+        job = queue.submit("story", 1, "/tmp/fail.mp4", on_done=seen.append)
+        await queue.wait(job.job_id)
+        queue.shutdown()
+
+        assert job.status == "failed"
+        assert job.error == "codec missing"
+        assert seen == [job]
+
+    async def test_finished_jobs_are_evicted(self, queue):
+        """Test only max_jobs jobs are kept once they have finished"""
+        for i in range(12):
+            await queue.wait(queue.submit("story", 1, f"/tmp/{i}.mp4", job_id=f"job-{i}").job_id)
+        queue.submit("story", 1, "/tmp/last.mp4", job_id="last")
+
+        assert queue.get("job-0") is None
+        assert queue.get("last") is not None
+        assert len(queue.list_jobs(limit=100)) <= 10
@@ -0,0 +1,60 @@
+"""
+Test Video Render
+Tests for streaming, buffer-reusing video frame generation
+"""
+
+import tracemalloc
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from video_render import iter_script_frames, render_script_video
+
+SMALL = (320, 180)
+
+class TestVideoRender:
+    """Test class for the streaming frame writer"""
+
+    def test_frames_reuse_one_buffer(self):
+        """Test every frame is the same buffer, redrawn once per second"""
+        stats = {}
+        buffers = {id(frame) for frame in iter_script_frames("Epic empire story", 3, fps=24, size=SMALL, stats=stats)}
+
+        assert len(buffers) == 1
+        assert stats == {"frames": 72, "redraws": 3}
+
+    def test_overlay_changes_each_second(self):
+        """Test the buffer content is redrawn when the overlay text changes"""
+        frames = iter_script_frames("Epic empire story", 2, fps=2, size=SMALL)
+        first = next(frames).copy()
+        same_second = next(frames).copy()
+        next_second = next(frames).copy()
+
+        assert first.any()
+        assert (first == same_second).all()
+        assert not (first == next_second).all()
+
+    def test_peak_memory_is_independent_of_duration(self):
+        """Test traced peak memory does not grow with video length"""
+        def peak_for(duration):
+            tracemalloc.start()
+            for _ in iter_script_frames("Epic empire story", duration, fps=24, size=SMALL):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        frame_bytes = SMALL[0] * SMALL[1] * 3
+        assert peak_for(30) < peak_for(1) + frame_bytes
+
+    def test_render_writes_file_and_reports_progress(self, tmp_path):
+        """Test frames stream to disk with per-second progress"""
+        output = tmp_path / "video.mp4"
+        progress = []
+
+        stats = render_script_video(str(output), "Epic empire story", 2, fps=12, size=SMALL, progress=lambda done, total: progress.append((done, total)))
+
+        assert output.exists() and output.stat().st_size > 0
+        assert stats["frames"] == 24 and stats["redraws"] == 2
+        assert progress == [(12, 24), (24, 24)]
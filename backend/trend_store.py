@@ -0,0 +1,191 @@
+"""
+Trend Store Module for CK Empire Builder
+Bounded, indexed trend collection with decayed ranking and prebuilt prompt fragments
+"""
+
+import os
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Callable, Set
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        TREND_STORE_MAX_TRENDS = int(os.getenv("TREND_STORE_MAX_TRENDS", "200"))
+        TREND_DECAY_HALF_LIFE_DAYS = float(os.getenv("TREND_DECAY_HALF_LIFE_DAYS", "30"))
+
+logger = logging.getLogger(__name__)
+
+WILDCARD_PLATFORMS = {"all platforms", "all", "multi-platform", "cross-platform"}
+_WILDCARD_KEY = "*"
+
+def _normalize(value: str) -> str:
+    """Case- and whitespace-insensitive index key"""
+    return " ".join(str(value).lower().split())
+
+class TrendStore:
+    """Keeps the strongest trends, indexed by platform and category, with prompt text ready per scope"""
+
+    def __init__(
+        self,
+        scopes: Optional[Dict[str, List[str]]] = None,
+        formatter: Optional[Callable[[List[Any]], str]] = None,
+        max_trends: Optional[int] = None,
+        top_k: int = 3,
+        half_life_days: Optional[float] = None,
+        refresh_interval: float = 3600.0
+    ):
+        """
+        Args:
+            scopes: Scope name (e.g. a content type) -> platforms it draws trends from
+            formatter: Renders a ranked trend list into prompt text
+            max_trends: Trends kept after eviction of the lowest decayed scores
+            top_k: Trends included in each prompt fragment
+            half_life_days: Days for a trend's impact_score to halve (0 disables decay)
+            refresh_interval: Seconds before decayed rankings and fragments are rebuilt
+        """
+        self.scopes = {scope: [_normalize(p) for p in platforms] for scope, platforms in (scopes or {}).items()}
+        self.formatter = formatter or self._default_formatter
+        self.max_trends = max_trends or settings.TREND_STORE_MAX_TRENDS
+        self.top_k = top_k
+        self.half_life_days = settings.TREND_DECAY_HALF_LIFE_DAYS if half_life_days is None else half_life_days
+        self.refresh_interval = refresh_interval
+
+        self._trends: Dict[str, Any] = {}
+        self._by_platform: Dict[str, Set[str]] = {}
+        self._by_category: Dict[str, Set[str]] = {}
+        self._fragments: Dict[str, str] = {}
+        self._built_at: Optional[float] = None
+
+    @staticmethod
+    def _default_formatter(trends: List[Any]) -> str:
+        """Fallback rendering when no formatter is supplied"""
+        if not trends:
+            return "No specific trends identified for this content type."
+        return "\n".join(f"- {trend.trend_name}: {trend.content_adaptation}" for trend in trends)
+
+    def score(self, trend: Any, now: Optional[datetime] = None) -> float:
+        """impact_score decayed by the trend's age"""
+        if not self.half_life_days or not getattr(trend, "created_at", None):
+            return trend.impact_score
+        age_days = max(((now or datetime.utcnow()) - trend.created_at).total_seconds() / 86400, 0.0)
+        return trend.impact_score * 0.5 ** (age_days / self.half_life_days)
+
+    def _platform_keys(self, trend: Any) -> Set[str]:
+        """Index keys for a trend's platforms"""
+        keys = set()
+        for platform in trend.platform_optimization or []:
+            key = _normalize(platform)
+            keys.add(_WILDCARD_KEY if key in WILDCARD_PLATFORMS else key)
+        return keys or {_WILDCARD_KEY}
+
+    def _index(self, name: str, trend: Any):
+        """Add a trend to the secondary indexes"""
+        for key in self._platform_keys(trend):
+            self._by_platform.setdefault(key, set()).add(name)
+        self._by_category.setdefault(_normalize(trend.category), set()).add(name)
+
+    def _unindex(self, name: str, trend: Any):
+        """Remove a trend from the secondary indexes"""
+        for key in self._platform_keys(trend):
+            self._by_platform.get(key, set()).discard(name)
+        self._by_category.get(_normalize(trend.category), set()).discard(name)
+
+    def add(self, trend: Any) -> bool:
+        """
+        Insert or refresh a trend, deduplicating on trend_name
+
+        Returns:
+            True if the trend was stored
+        """
+        if not getattr(trend, "trend_name", ""):
+            return False
+
+        name = _normalize(trend.trend_name)
+        existing = self._trends.get(name)
+        if existing is not None:
+            self._unindex(name, existing)
+        self._trends[name] = trend
+        self._index(name, trend)
+        return True
+
+    def extend(self, trends: Iterable[Any]) -> int:
+        """
+        Add several trends, evict beyond the bound and rebuild prompt fragments
+
+        Returns:
+            Number of trends stored
+        """
+        added = sum(1 for trend in trends if self.add(trend))
+        self._evict()
+        self._rebuild()
+        return added
+
+    def _evict(self):
+        """Drop the lowest decayed scores beyond max_trends"""
+        overflow = len(self._trends) - self.max_trends
+        if overflow <= 0:
+            return
+        now = datetime.utcnow()
+        for name in sorted(self._trends, key=lambda n: self.score(self._trends[n], now))[:overflow]:
+            self._unindex(name, self._trends.pop(name))
+        logger.info(f"Evicted {overflow} low-impact trends")
+
+    def top(self, platforms: Optional[Iterable[str]] = None, category: Optional[str] = None, k: Optional[int] = None) -> List[Any]:
+        """
+        Highest decayed-score trends matching the filters
+
+        Args:
+            platforms: Any of these platforms (platform-agnostic trends always match)
+            category: Restrict to one category
+            k: Number of trends (defaults to top_k)
+        """
+        if platforms is None:
+            names = set(self._trends)
+        else:
+            names = set(self._by_platform.get(_WILDCARD_KEY, set()))
+            for platform in platforms:
+                names |= self._by_platform.get(_normalize(platform), set())
+        if category is not None:
+            names &= self._by_category.get(_normalize(category), set())
+
+        now = datetime.utcnow()
+        ranked = sorted((self._trends[n] for n in names), key=lambda t: self.score(t, now), reverse=True)
+        return ranked[:k or self.top_k]
+
+    def _rebuild(self):
+        """Precompute the prompt fragment for every scope"""
+        self._fragments = {scope: self.formatter(self.top(platforms)) for scope, platforms in self.scopes.items()}
+        self._fragments[_WILDCARD_KEY] = self.formatter(self.top())
+        self._built_at = time.monotonic()
+
+    def prompt_fragment(self, scope: Optional[str] = None) -> str:
+        """
+        Prebuilt prompt text for a scope (O(1) between refreshes)
+
+        Args:
+            scope: Scope name passed at construction; None or unknown scopes use all trends
+        """
+        if self._built_at is None or time.monotonic() - self._built_at > self.refresh_interval:
+            self._rebuild()
+        return self._fragments.get(scope, self._fragments[_WILDCARD_KEY])
+
+    def __len__(self) -> int:
+        return len(self._trends)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._trends.values()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store size and index cardinality"""
+        return {
+            "trends": len(self._trends),
+            "max_trends": self.max_trends,
+            "platforms": len([k for k, v in self._by_platform.items() if v]),
+            "categories": len([k for k, v in self._by_category.items() if v]),
+            "half_life_days": self.half_life_days
+        }
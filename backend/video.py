@@ -4,51 +4,44 @@ import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
-import asyncio
 from pathlib import Path
 import hashlib
 import uuid
 
-# Optional imports for video processing
-try:
-    import cv2
-    import numpy as np
-    from PIL import Image
-    OPENCV_AVAILABLE = True
-except ImportError:
-    OPENCV_AVAILABLE = False
+from openai_executor import openai_executor
+from registry import services
+from nft_pricing import NFTPricingModel, NUMPY_AVAILABLE, MODEL_VERSION, pricing_features, rule_based_price
+from nft_rarity import CollectionRarity
+
+# Optional integrations are located at import and loaded on first use
+from optional_imports import module_available, lazy_module
+
+# Video processing
+OPENCV_AVAILABLE = module_available("cv2", "numpy", "PIL")
+if not OPENCV_AVAILABLE:
     logging.warning("OpenCV not available. Video processing features will be limited.")
 
-try:
-    import moviepy.editor as mp
-    MOVIEPY_AVAILABLE = True
-except ImportError:
-    MOVIEPY_AVAILABLE = False
+MOVIEPY_AVAILABLE = module_available("moviepy")
+if not MOVIEPY_AVAILABLE:
     logging.warning("MoviePy not available. Video editing features will be limited.")
 
 # OpenAI integration
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+OPENAI_AVAILABLE = module_available("openai")
+if OPENAI_AVAILABLE:
+    openai = lazy_module("openai")
+else:
     logging.warning("OpenAI not available. AI features will be limited.")
 
 # Web3 integration for NFT
-try:
-    from web3 import Web3
-    from eth_account import Account
-    WEB3_AVAILABLE = True
-except ImportError:
-    WEB3_AVAILABLE = False
+WEB3_AVAILABLE = module_available("web3", "eth_account")
+if not WEB3_AVAILABLE:
     logging.warning("Web3 not available. NFT features will be limited.")
 
 # Stripe integration
-try:
-    import stripe
-    STRIPE_AVAILABLE = True
-except ImportError:
-    STRIPE_AVAILABLE = False
+STRIPE_AVAILABLE = module_available("stripe")
+if STRIPE_AVAILABLE:
+    stripe = lazy_module("stripe")
+else:
     logging.warning("Stripe not available. Payment features will be limited.")
 
 @dataclass
@@ -178,6 +171,12 @@ class VideoProductionManager:
         self.minting_history = []
         self.rarity_distribution = {}
         
+        # Local price model, trained on minting records with realized sale prices
+        self.pricing_model = NFTPricingModel()
+        
+        # Statistical rarity per collection, updated as items are minted
+        self.collection_rarity: Dict[str, CollectionRarity] = {}
+        
     def setup_clients(self):
         """Setup external service clients"""
         # OpenAI setup
@@ -201,6 +200,7 @@ class VideoProductionManager:
         if WEB3_AVAILABLE:
             web3_url = os.getenv("WEB3_PROVIDER_URL")
             if web3_url:
+                from web3 import Web3
                 self.web3_client = Web3(Web3.HTTPProvider(web3_url))
             else:
                 logging.warning("WEB3_PROVIDER_URL not set")
@@ -243,8 +243,9 @@ class VideoProductionManager:
             8. Rarity factor calculations
             """
             
-            response = await asyncio.to_thread(
+            response = await openai_executor.run(
                 self.openai_client.chat.completions.create,
+                operation="video_script",
                 model=self.ai_minting_config.model_version,
                 messages=[
                     {"role": "system", "content": "You are a professional video director specializing in AI-enhanced cinematic production and NFT minting optimization."},
@@ -311,7 +312,8 @@ class VideoProductionManager:
         Music: Epic orchestral score with royalty-free licensing for NFT minting
         """
     
-    async def create_enhanced_video_metadata(self, video_prompt: str, style: str) -> Dict[str, Any]:
+    async def create_enhanced_video_metadata(self, video_prompt: str, style: str,
+                                           duration: Optional[int] = None) -> Dict[str, Any]:
         """Create enhanced metadata for video production with AI optimization"""
         style_config = self.video_styles.get(style, self.zack_snyder_style)
         
@@ -322,7 +324,7 @@ class VideoProductionManager:
             "title": f"AI-Enhanced {style_config.name} Video",
             "description": video_prompt[:200] + "...",
             "style": style_config.name,
-            "duration": "Variable",
+            "duration": duration or "Variable",
             "resolution": f"{style_config.resolution[0]}x{style_config.resolution[1]}",
             "frame_rate": f"{style_config.frame_rate} fps",
             "aspect_ratio": style_config.aspect_ratio,
@@ -347,8 +349,9 @@ class VideoProductionManager:
         # Generate AI-powered description with enhanced optimization
         if self.openai_client:
             try:
-                response = await asyncio.to_thread(
+                response = await openai_executor.run(
                     self.openai_client.chat.completions.create,
+                    operation="nft_metadata",
                     model=self.ai_minting_config.model_version,
                     messages=[
                         {"role": "system", "content": "You are an NFT metadata specialist with expertise in AI-enhanced digital art and blockchain optimization."},
@@ -374,6 +377,7 @@ class VideoProductionManager:
             {"trait_type": "Frame Rate", "value": video_metadata['frame_rate']},
             {"trait_type": "Aspect Ratio", "value": video_metadata['aspect_ratio']},
             {"trait_type": "Effects", "value": len(video_metadata['effects'])},
+            {"trait_type": "Duration", "value": video_metadata['duration']},
             {"trait_type": "AI Enhanced", "value": "Yes"},
             {"trait_type": "Minting Ready", "value": "Yes"},
             {"trait_type": "Rarity", "value": video_metadata['rarity_level']},
@@ -449,104 +453,121 @@ class VideoProductionManager:
         return min(base_score, 1.0)
     
     async def predict_enhanced_nft_pricing(self, nft_metadata: NFTMetadata, 
-                                         market_data: Dict[str, Any] = None) -> PricingPrediction:
-        """Predict enhanced NFT pricing using advanced AI and ML models"""
+                                         market_data: Dict[str, Any] = None,
+                                         enrich: bool = False) -> PricingPrediction:
+        """
+        Predict NFT pricing with the local model
         
-        if not self.openai_client:
-            return self._generate_enhanced_mock_pricing(nft_metadata)
+        Args:
+            nft_metadata: NFT to price
+            market_data: Market trends included in the analysis
+            enrich: Ask the LLM for a written recommendation (the price stays the model's)
+        """
+        prediction = self.predict_nft_pricing_many([nft_metadata], market_data)[0]
         
-        try:
-            # Enhanced market analysis
-            market_analysis = {
-                "style_popularity": self._analyze_enhanced_style_popularity(nft_metadata),
-                "collection_value": self._analyze_enhanced_collection_value(nft_metadata),
-                "rarity_score": nft_metadata.rarity_score,
-                "market_trends": market_data or {},
-                "ai_enhancement_bonus": 0.2 if nft_metadata.ai_generated else 0.0,
-                "blockchain_metadata": nft_metadata.blockchain_metadata,
-                "market_analysis": nft_metadata.market_analysis
-            }
+        if enrich and self.openai_client:
+            prediction.recommendation = await self._enrich_pricing_recommendation(nft_metadata, prediction)
+        
+        return prediction
+    
+    def predict_nft_pricing_many(self, nft_metadatas: List[NFTMetadata],
+                                 market_data: Dict[str, Any] = None) -> List[PricingPrediction]:
+        """
+        Price a batch of NFTs in one vectorized pass
+        
+        Args:
+            nft_metadatas: NFTs to price
+            market_data: Market trends included in each analysis
             
+        Returns:
+            Predictions in input order
+        """
+        if not NUMPY_AVAILABLE:
+            return [self._generate_enhanced_mock_pricing(nft_metadata) for nft_metadata in nft_metadatas]
+        
+        self.pricing_model.maybe_fit(self.minting_history)
+        rows = [pricing_features(nft_metadata) for nft_metadata in nft_metadatas]
+        batch = self.pricing_model.predict_many(rows)
+        
+        predictions = []
+        for i, nft_metadata in enumerate(nft_metadatas):
+            predicted_price = float(batch["prices"][i])
+            predictions.append(PricingPrediction(
+                predicted_price=predicted_price,
+                confidence=float(batch["confidence"][i]),
+                factors=self.pricing_model.top_factors(batch["contributions"][i]),
+                market_analysis={
+                    "style_popularity": self._analyze_enhanced_style_popularity(nft_metadata),
+                    "collection_value": self._analyze_enhanced_collection_value(nft_metadata),
+                    "rarity_score": nft_metadata.rarity_score,
+                    "market_trends": market_data or {},
+                    "ai_enhancement_bonus": 0.2 if nft_metadata.ai_generated else 0.0
+                },
+                recommendation=f"List at {predicted_price:.2f}-{predicted_price*1.2:.2f} ETH based on AI enhancement and rarity",
+                ml_model_version=MODEL_VERSION,
+                training_data_points=self.pricing_model.n_samples,
+                market_volatility=self.pricing_model.residual_std,
+                competitor_analysis={
+                    "similar_ai_nfts": 45,
+                    "average_ai_price": 1.8,
+                    "market_share": 0.15
+                }
+            ))
+        return predictions
+    
+    async def _enrich_pricing_recommendation(self, nft_metadata: NFTMetadata,
+                                             prediction: PricingPrediction) -> str:
+        """Written listing advice from the LLM for a model-priced NFT"""
+        try:
             prompt = f"""
-            Analyze this AI-enhanced NFT for advanced pricing prediction:
+            An NFT has been priced by our model. Write a short listing recommendation.
             
             Name: {nft_metadata.name}
             Description: {nft_metadata.description}
-            Style: {next((attr['value'] for attr in nft_metadata.attributes if attr['trait_type'] == 'Style'), 'Unknown')}
-            Rarity: {next((attr['value'] for attr in nft_metadata.attributes if attr['trait_type'] == 'Rarity'), 'Unknown')}
+            Style: {prediction.market_analysis['style_popularity']}
+            Collection Value: {prediction.market_analysis['collection_value']}
             Rarity Score: {nft_metadata.rarity_score:.3f}
             AI Enhanced: {nft_metadata.ai_generated}
-            Effects Count: {next((attr['value'] for attr in nft_metadata.attributes if attr['trait_type'] == 'Effects'), 0)}
-            Base Price: {next((attr['value'] for attr in nft_metadata.attributes if attr['trait_type'] == 'Base Price'), '0 ETH')}
-            
-            Enhanced Market Analysis:
-            - Style Popularity: {market_analysis['style_popularity']}
-            - Collection Value: {market_analysis['collection_value']}
-            - Rarity Score: {market_analysis['rarity_score']}
-            - AI Enhancement Bonus: {market_analysis['ai_enhancement_bonus']}
-            - Market Trends: {market_analysis['market_trends']}
-            - Blockchain Integration: {market_analysis['blockchain_metadata']}
+            Model Price: {prediction.predicted_price:.3f} ETH (confidence {prediction.confidence:.0%})
+            Main Factors: {', '.join(prediction.factors)}
+            Market Trends: {prediction.market_analysis['market_trends']}
             
-            Provide advanced pricing analysis including:
-            1. Predicted price in ETH with confidence intervals
-            2. Confidence level (0-1) with detailed reasoning
-            3. Key pricing factors with weights
-            4. Market recommendation with risk assessment
-            5. ML model insights and training data points
-            6. Competitor analysis and market positioning
-            7. Volatility assessment and price stability
+            Cover listing strategy, risk and market positioning.
             """
             
-            response = await asyncio.to_thread(
+            response = await openai_executor.run(
                 self.openai_client.chat.completions.create,
+                operation="nft_pricing",
                 model=self.ai_minting_config.model_version,
                 messages=[
-                    {"role": "system", "content": "You are an advanced NFT pricing expert with deep knowledge of AI-enhanced digital art, blockchain economics, and machine learning models."},
+                    {"role": "system", "content": "You are an advanced NFT pricing expert with deep knowledge of AI-enhanced digital art and blockchain economics."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=500,
                 temperature=0.6
             )
-            
-            # Parse enhanced AI response
-            ai_response = response.choices[0].message.content
-            
-            # Extract pricing information with enhanced parsing
-            predicted_price = self._extract_enhanced_price_from_response(ai_response, nft_metadata)
-            confidence = self._extract_enhanced_confidence_from_response(ai_response)
-            
-            # Generate competitor analysis
-            competitor_analysis = {
-                "similar_ai_nfts": 45,
-                "average_ai_price": 1.8,
-                "market_share": 0.15,
-                "competitive_advantage": "AI enhancement + blockchain optimization"
-            }
-            
-            return PricingPrediction(
-                predicted_price=predicted_price,
-                confidence=confidence,
-                factors=["AI enhancement", "Rarity score", "Collection value", "Market trends", "Blockchain integration"],
-                market_analysis=market_analysis,
-                recommendation=ai_response,
-                ml_model_version="v2.1",
-                training_data_points=15000,
-                market_volatility=0.25,
-                competitor_analysis=competitor_analysis
-            )
+            return response.choices[0].message.content
             
         except Exception as e:
-            logging.error(f"Error predicting enhanced NFT pricing: {e}")
-            return self._generate_enhanced_mock_pricing(nft_metadata)
+            logging.error(f"Error enriching NFT pricing recommendation: {e}")
+            return prediction.recommendation
     
-    def _generate_enhanced_mock_pricing(self, nft_metadata: NFTMetadata) -> PricingPrediction:
-        """Generate enhanced mock pricing when AI is not available"""
-        base_price = float(next((attr['value'].split()[0] for attr in nft_metadata.attributes if attr['trait_type'] == 'Base Price'), 0.5))
-        rarity_multiplier = 2.0 if "Legendary" in str(nft_metadata.attributes) else 1.5 if "Epic" in str(nft_metadata.attributes) else 1.0
-        ai_multiplier = 1.3 if nft_metadata.ai_generated else 1.0
-        rarity_score_multiplier = 1.0 + nft_metadata.rarity_score * 0.5
+    def record_nft_sale(self, production_id: str, sale_price_eth: float) -> bool:
+        """
+        Record a realized sale price so the pricing model can learn from it
         
-        predicted_price = base_price * rarity_multiplier * ai_multiplier * rarity_score_multiplier
+        Returns:
+            False if the production is not in the minting history
+        """
+        for record in reversed(self.minting_history):
+            if record["production_id"] == production_id:
+                record["sale_price"] = sale_price_eth
+                return True
+        return False
+    
+    def _generate_enhanced_mock_pricing(self, nft_metadata: NFTMetadata) -> PricingPrediction:
+        """Rule-based pricing when NumPy is not available"""
+        predicted_price = rule_based_price(pricing_features(nft_metadata))
         
         return PricingPrediction(
             predicted_price=predicted_price,
@@ -559,8 +580,8 @@ class VideoProductionManager:
                 "ai_enhancement_bonus": 0.2 if nft_metadata.ai_generated else 0.0
             },
             recommendation=f"List at {predicted_price:.2f}-{predicted_price*1.2:.2f} ETH based on AI enhancement and rarity",
-            ml_model_version="v2.1",
-            training_data_points=15000,
+            ml_model_version="rule-based",
+            training_data_points=0,
             market_volatility=0.25,
             competitor_analysis={
                 "similar_ai_nfts": 45,
@@ -569,6 +590,27 @@ class VideoProductionManager:
             }
         )
     
+    def add_to_collection_rarity(self, collection_name: str, items: List[Any],
+                                 ids: Optional[List[Any]] = None) -> Optional[CollectionRarity]:
+        """
+        Add minted items to a collection's rarity tables
+        
+        Args:
+            collection_name: Collection the items belong to
+            items: NFTMetadata objects or metadata dicts with "attributes"
+            ids: Identifiers for later lookups (defaults to positions)
+            
+        Returns:
+            The collection's rarity engine (None without NumPy)
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+        engine = self.collection_rarity.get(collection_name)
+        if engine is None:
+            engine = self.collection_rarity[collection_name] = CollectionRarity()
+        engine.add(items, ids)
+        return engine
+    
     def _analyze_enhanced_style_popularity(self, nft_metadata: NFTMetadata) -> str:
         """Analyze enhanced style popularity with AI considerations"""
         style = next((attr['value'] for attr in nft_metadata.attributes if attr['trait_type'] == 'Style'), 'Unknown')
@@ -596,33 +638,6 @@ class VideoProductionManager:
         else:
             return "Medium"
     
-    def _extract_enhanced_price_from_response(self, response: str, nft_metadata: NFTMetadata) -> float:
-        """Extract enhanced price from AI response with fallback to metadata"""
-        try:
-            import re
-            eth_pattern = r'(\d+\.?\d*)\s*ETH'
-            match = re.search(eth_pattern, response)
-            if match:
-                return float(match.group(1))
-        except:
-            pass
-        
-        # Fallback to metadata base price
-        base_price = next((float(attr['value'].split()[0]) for attr in nft_metadata.attributes if attr['trait_type'] == 'Base Price'), 0.5)
-        return base_price * (1.0 + nft_metadata.rarity_score * 0.5)
-    
-    def _extract_enhanced_confidence_from_response(self, response: str) -> float:
-        """Extract enhanced confidence from AI response"""
-        try:
-            import re
-            confidence_pattern = r'(\d+\.?\d*)%'
-            match = re.search(confidence_pattern, response)
-            if match:
-                return float(match.group(1)) / 100
-        except:
-            pass
-        return 0.8  # Enhanced default confidence
-    
     async def create_enhanced_stripe_product(self, nft_metadata: NFTMetadata, 
                                            pricing_prediction: PricingPrediction) -> Dict[str, Any]:
         """Create enhanced Stripe product for NFT sale with AI optimization"""
@@ -699,11 +714,16 @@ class VideoProductionManager:
         video_prompt = await self.generate_ai_video_prompt(theme, duration, style)
         
         # Step 2: Create enhanced video metadata
-        video_metadata = await self.create_enhanced_video_metadata(video_prompt, style)
+        video_metadata = await self.create_enhanced_video_metadata(video_prompt, style, duration)
         
         # Step 3: Generate AI-optimized NFT metadata
         nft_metadata = await self.generate_optimized_nft_metadata(video_metadata)
         
+        # Step 3b: Rank against the rest of the collection
+        rarity_engine = self.add_to_collection_rarity(
+            nft_metadata.collection['name'], [nft_metadata], ids=[video_metadata["production_id"]]
+        )
+        
         # Step 4: Predict enhanced pricing with ML model
         pricing_prediction = await self.predict_enhanced_nft_pricing(nft_metadata)
         
@@ -717,6 +737,8 @@ class VideoProductionManager:
             "style": style,
             "rarity_score": nft_metadata.rarity_score,
             "predicted_price": pricing_prediction.predicted_price,
+            "pricing_features": pricing_features(nft_metadata),
+            "collection_rarity": rarity_engine.item(video_metadata["production_id"]) if rarity_engine else None,
             "ai_enhanced": True,
             "timestamp": datetime.now().isoformat()
         }
@@ -733,5 +755,9 @@ class VideoProductionManager:
             "minting_history_count": len(self.minting_history)
         }
 
-# Global instance
-video_manager = VideoProductionManager() 
\ No newline at end of file
+# Global instance (built on first use)
+video_manager = services.register("video_manager", VideoProductionManager)
+
+def get_video_manager() -> VideoProductionManager:
+    """Get the process-wide video production manager"""
+    return services.get("video_manager")
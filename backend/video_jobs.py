@@ -0,0 +1,322 @@
+"""
+Video Jobs Module for CK Empire Builder
+Process-pool render queue with job IDs, frame progress and cancellation
+"""
+
+import os
+import uuid
+import asyncio
+import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, CancelledError
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from video_render import FPS, FRAME_SIZE, render_script_video
+
+# Prometheus metrics
+try:
+    from prometheus_client import Counter, Gauge
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    logging.warning("Prometheus client not available. Video render metrics will be limited.")
+
+# Configuration
+try:
+    from config import settings
+except ImportError:
+    # Mock settings for development
+    class settings:
+        VIDEO_RENDER_WORKERS = int(os.getenv("VIDEO_RENDER_WORKERS", "2"))
+        VIDEO_RENDER_MAX_JOBS = int(os.getenv("VIDEO_RENDER_MAX_JOBS", "1000"))
+
+logger = logging.getLogger(__name__)
+
+if PROMETHEUS_AVAILABLE:
+    VIDEO_RENDER_JOBS_TOTAL = Counter('video_render_jobs_total', 'Video render jobs by final status', ['status'])
+    VIDEO_RENDER_JOBS_ACTIVE = Gauge('video_render_jobs_active', 'Video render jobs queued or running')
+
+FINAL_STATUSES = {"completed", "failed", "cancelled"}
+
+class RenderCancelled(Exception):
+    """Raised inside a worker when its job was cancelled mid-render"""
+
+@dataclass
+class RenderJob:
+    """State of one render job"""
+    job_id: str
+    output_path: str
+    duration: int
+    fps: int
+    total_frames: int
+    status: str = "queued"            # queued, running, cancelling, completed, failed, cancelled
+    frames_written: int = 0
+    error: Optional[str] = None
+    stats: Optional[Dict[str, Any]] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def progress(self) -> float:
+        """Fraction of frames written"""
+        return self.frames_written / self.total_frames if self.total_frames else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable job handle"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "output_path": self.output_path,
+            "frames_written": self.frames_written,
+            "total_frames": self.total_frames,
+            "progress": round(self.progress, 4),
+            "error": self.error,
+            "stats": self.stats,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+def render_job(
+    job_id: str,
+    output_path: str,
+    script: str,
+    duration: int,
+    fps: int,
+    size: Tuple[int, int],
+    progress: Dict[str, int],
+    cancelled: Dict[str, bool]
+) -> Dict[str, Any]:
+    """
+    Worker entry point: render one video, publishing progress and honouring cancellation
+
+    Args:
+        progress: Shared job_id -> frames written
+        cancelled: Shared job_id -> True once cancellation was requested
+    """
+    def report(frames_written: int, total_frames: int):
+        progress[job_id] = frames_written
+        if cancelled.get(job_id):
+            raise RenderCancelled(job_id)
+
+    try:
+        return render_script_video(output_path, script, duration, fps=fps, size=size, progress=report)
+    except RenderCancelled:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+
+class VideoRenderQueue:
+    """Submits renders to a worker pool and tracks them by job ID"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        render_fn: Callable[..., Dict[str, Any]] = render_job,
+        max_jobs: Optional[int] = None
+    ):
+        """
+        Args:
+            max_workers: Concurrent renders
+            use_processes: Render in worker processes (threads are for tests and platforms without spawn)
+            render_fn: Top-level worker function with render_job's signature
+            max_jobs: Finished jobs kept for status lookups
+        """
+        self.max_workers = max_workers or settings.VIDEO_RENDER_WORKERS
+        self.use_processes = use_processes
+        self.render_fn = render_fn
+        self.max_jobs = max_jobs or settings.VIDEO_RENDER_MAX_JOBS
+
+        self._executor: Optional[Executor] = None
+        self._manager = None
+        self._progress: Optional[Dict[str, int]] = None
+        self._cancelled: Optional[Dict[str, bool]] = None
+        self._jobs: "OrderedDict[str, RenderJob]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+
+    def _get_executor(self) -> Executor:
+        """Create the worker pool and shared progress state lazily"""
+        if self._executor is None:
+            if self.use_processes:
+                # spawn: workers must not inherit the event loop, threads or open sockets
+                context = multiprocessing.get_context("spawn")
+                self._manager = context.Manager()
+                self._progress = self._manager.dict()
+                self._cancelled = self._manager.dict()
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            else:
+                self._progress = {}
+                self._cancelled = {}
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="video-render")
+            logger.info(f"🎬 Video render pool started with {self.max_workers} {'processes' if self.use_processes else 'threads'}")
+        return self._executor
+
+    def submit(
+        self,
+        script: str,
+        duration: int,
+        output_path: str,
+        fps: int = FPS,
+        size: Tuple[int, int] = FRAME_SIZE,
+        job_id: Optional[str] = None,
+        on_done: Optional[Callable[[RenderJob], None]] = None
+    ) -> RenderJob:
+        """
+        Queue a render and return its handle immediately
+
+        Args:
+            script: Video script
+            duration: Seconds of video
+            output_path: Destination .mp4
+            fps: Frames per second
+            size: (width, height)
+            job_id: Caller-chosen ID (generated if omitted)
+            on_done: Called with the job once it reaches a final status (from a pool thread)
+
+        Returns:
+            The queued job
+        """
+        executor = self._get_executor()
+        job = RenderJob(
+            job_id=job_id or uuid.uuid4().hex[:12],
+            output_path=output_path,
+            duration=duration,
+            fps=fps,
+            total_frames=duration * fps
+        )
+        self._jobs[job.job_id] = job
+        self._evict()
+
+        future = executor.submit(
+            self.render_fn, job.job_id, output_path, script, duration, fps, tuple(size), self._progress, self._cancelled
+        )
+        self._futures[job.job_id] = future
+        future.add_done_callback(lambda f: self._finish(job, f, on_done))
+        self._update_active()
+        logger.info(f"🎬 Queued render {job.job_id}: {duration}s -> {output_path}")
+        return job
+
+    def _finish(self, job: RenderJob, future: Future, on_done: Optional[Callable[[RenderJob], None]]):
+        """Record a job's outcome"""
+        try:
+            job.frames_written = self._progress.pop(job.job_id, job.frames_written)
+            cancel_requested = self._cancelled.pop(job.job_id, False)
+        except Exception:
+            # Shared state is gone once the pool has shut down
+            cancel_requested = job.status == "cancelling"
+        try:
+            job.stats = future.result()
+            job.frames_written = job.stats.get("frames", job.frames_written)
+            job.status = "completed"
+        except (CancelledError, RenderCancelled):
+            job.status = "cancelled"
+        except Exception as e:
+            # RenderCancelled may arrive re-raised under another type from a worker process
+            job.status = "cancelled" if cancel_requested else "failed"
+            job.error = None if cancel_requested else str(e)
+            if not cancel_requested:
+                logger.error(f"❌ Render {job.job_id} failed: {e}")
+        job.finished_at = datetime.utcnow()
+        self._futures.pop(job.job_id, None)
+        self._update_active()
+        if PROMETHEUS_AVAILABLE:
+            VIDEO_RENDER_JOBS_TOTAL.labels(status=job.status).inc()
+
+        if on_done is not None:
+            try:
+                on_done(job)
+            except Exception as e:
+                logger.error(f"Render {job.job_id} completion callback failed: {e}")
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        """Current state of a job, with live frame progress"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status not in FINAL_STATUSES and self._progress is not None:
+            frames = self._progress.get(job_id)
+            if frames is not None:
+                job.frames_written = frames
+                if job.status == "queued":
+                    job.status = "running"
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job
+
+        Returns:
+            True if the job was cancelled or will stop at its next progress report
+        """
+        job = self._jobs.get(job_id)
+        future = self._futures.get(job_id)
+        if job is None or future is None or job.status in FINAL_STATUSES:
+            return False
+        if future.cancel():
+            return True
+        self._cancelled[job_id] = True
+        job.status = "cancelling"
+        logger.info(f"🛑 Cancelling render {job_id}")
+        return True
+
+    async def wait(self, job_id: str) -> Optional[RenderJob]:
+        """Wait for a job to finish without blocking the event loop"""
+        future = self._futures.get(job_id)
+        if future is not None:
+            try:
+                await asyncio.wrap_future(future)
+            except Exception:
+                pass
+            # Let the done callback finish updating the job
+            await asyncio.sleep(0)
+        return self.get(job_id)
+
+    def list_jobs(self, limit: int = 50) -> List[RenderJob]:
+        """Most recent jobs first"""
+        return [self.get(job_id) for job_id in list(reversed(self._jobs))[:limit]]
+
+    def _evict(self):
+        """Forget the oldest finished jobs beyond max_jobs"""
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id].status in FINAL_STATUSES:
+                del self._jobs[job_id]
+
+    def _update_active(self):
+        if PROMETHEUS_AVAILABLE:
+            VIDEO_RENDER_JOBS_ACTIVE.set(len(self._futures))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts by status"""
+        statuses: Dict[str, int] = {}
+        for job_id in list(self._jobs):
+            status = self.get(job_id).status
+            statuses[status] = statuses.get(status, 0) + 1
+        return {
+            "max_workers": self.max_workers,
+            "mode": "process" if self.use_processes else "thread",
+            "active": len(self._futures),
+            "jobs": statuses
+        }
+
+    def shutdown(self):
+        """Cancel queued renders and stop the pool"""
+        if self._executor is not None:
+            for job_id in list(self._futures):
+                self.cancel(job_id)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+# Global video render queue instance
+video_render_queue = VideoRenderQueue()
+
+def get_video_render_queue() -> VideoRenderQueue:
+    """Get the global video render queue instance"""
+    return video_render_queue
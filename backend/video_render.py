@@ -0,0 +1,138 @@
+"""
+Video Render Module for CK Empire Builder
+Streams text-overlay frames into cv2.VideoWriter with one reusable frame buffer
+"""
+
+import sys
+import time
+import logging
+from typing import Dict, Any, Iterator, Optional, Tuple, Callable
+
+from optional_imports import module_available, lazy_module
+
+# Video processing (imported on first render)
+OPENCV_AVAILABLE = module_available("cv2", "numpy")
+if OPENCV_AVAILABLE:
+    cv2 = lazy_module("cv2")
+    np = lazy_module("numpy")
+
+# Peak RSS is only available on Unix
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FPS = 24
+FRAME_SIZE: Tuple[int, int] = (1920, 1080)  # width, height
+
+def overlay_text(script: str, second: int) -> str:
+    """Text drawn on every frame of the given second"""
+    return f"Frame {second}s - {script[:50]}..."
+
+def _peak_rss_mb() -> Optional[float]:
+    """Process peak RSS so far"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+def iter_script_frames(
+    script: str,
+    duration: int,
+    fps: int = FPS,
+    size: Tuple[int, int] = FRAME_SIZE,
+    stats: Optional[Dict[str, int]] = None
+) -> Iterator[Any]:
+    """
+    Yield frames for a script, redrawing only when the overlay text changes
+
+    The same preallocated buffer is yielded every time, so memory stays at one
+    frame regardless of duration. Consumers must copy or write each frame
+    (cv2.VideoWriter.write does) before advancing the generator.
+
+    Args:
+        script: Video script; its first 50 characters are overlaid
+        duration: Seconds of video
+        fps: Frames per second
+        size: (width, height)
+        stats: Optional dict updated with frames and redraws counts
+    """
+    width, height = size
+    buffer = np.zeros((height, width, 3), dtype=np.uint8)
+    origin = (min(100, width // 10), height // 2)
+    scale = 2 * height / 1080
+    thickness = max(1, round(3 * height / 1080))
+    last_text = None
+
+    for frame_number in range(duration * fps):
+        text = overlay_text(script, frame_number // fps)
+        if text != last_text:
+            buffer.fill(0)
+            cv2.putText(buffer, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, (255, 255, 255), thickness)
+            last_text = text
+            if stats is not None:
+                stats["redraws"] = stats.get("redraws", 0) + 1
+        if stats is not None:
+            stats["frames"] = stats.get("frames", 0) + 1
+        yield buffer
+
+def render_script_video(
+    output_path: str,
+    script: str,
+    duration: int,
+    fps: int = FPS,
+    size: Tuple[int, int] = FRAME_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> Dict[str, Any]:
+    """
+    Render a script video straight to disk
+
+    Args:
+        output_path: Destination .mp4
+        script: Video script
+        duration: Seconds of video
+        fps: Frames per second
+        size: (width, height)
+        progress: Called with (frames_written, total_frames) once per second of video
+
+    Returns:
+        Render statistics including frame buffer size and peak memory
+    """
+    width, height = size
+    total_frames = duration * fps
+    counts: Dict[str, int] = {}
+    rss_before = _peak_rss_mb()
+    started = time.perf_counter()
+
+    writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*'mp4v'), float(fps), (width, height))
+    if not writer.isOpened():
+        raise RuntimeError(f"Could not open video writer for {output_path}")
+    try:
+        for frame in iter_script_frames(script, duration, fps, size, stats=counts):
+            writer.write(frame)
+            if progress is not None and counts["frames"] % fps == 0:
+                progress(counts["frames"], total_frames)
+    finally:
+        writer.release()
+
+    elapsed = time.perf_counter() - started
+    rss_after = _peak_rss_mb()
+    stats = {
+        "frames": counts.get("frames", 0),
+        "redraws": counts.get("redraws", 0),
+        "frame_buffer_mb": width * height * 3 / (1024 * 1024),
+        "render_seconds": elapsed,
+        "frames_per_second": counts.get("frames", 0) / elapsed if elapsed > 0 else 0.0,
+        "peak_rss_mb": rss_after,
+        # Growth of the process high-water mark during this render
+        "peak_rss_growth_mb": rss_after - rss_before if rss_after is not None else None
+    }
+    logger.info(
+        f"Rendered {stats['frames']} frames ({stats['redraws']} redraws) to {output_path} "
+        f"in {elapsed:.1f}s, peak RSS {rss_after or 0:.0f}MB"
+    )
+    return stats